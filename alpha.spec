@@ -7,6 +7,14 @@ icon_path = str(Path('alpha/resources/icon.ico').absolute())
 
 block_cipher = None
 
+# The .agent bundle ships as one archive (see alpha/agentbundle.py). It is rebuilt
+# on every run (the archive is deterministic and takes a moment), so a stale one is
+# never shipped, and kept out of build/, which is PyInstaller's own work directory.
+agent_archive = Path('bundle/agent.zip')
+sys.path.insert(0, str(Path('.').absolute()))
+from alpha.agentbundle import build, FOLDER
+build(FOLDER, str(agent_archive))
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -15,9 +23,10 @@ a = Analysis(
         ('alpha/resources/icon.ico', 'alpha/resources'),
         ('alpha/resources/icon.png', 'alpha/resources'),
         ('alpha/commands.json', 'alpha'),
-        ('alpha/superpower_framework', 'alpha/superpower_framework'),
+        ('alpha/file_templates', 'alpha/file_templates'),
+        (str(agent_archive), 'alpha/superpower_framework'),
     ],
-    hiddenimports=['alpha.splash', 'alpha.update', 'alpha.version', 'alpha.utils', 'PyQt6'],
+    hiddenimports=['alpha.splash', 'alpha.update', 'alpha.version', 'alpha.utils', 'alpha.stack_editor', 'yaml', 'requests', 'PyQt6'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
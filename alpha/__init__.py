@@ -1 +1,7 @@
-from .initializer import ProjectInitializer
+def __getattr__(name):
+    # Lazy so that importing a submodule (e.g. alpha.utils for the splash)
+    # doesn't pull in the whole initializer at startup.
+    if name == "ProjectInitializer":
+        from .initializer import ProjectInitializer
+        return ProjectInitializer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,3 @@
+from alpha.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,84 @@
+"""The Superpower .agent bundle as a single archive.
+
+Release builds ship ``alpha/superpower_framework/agent.zip`` instead of the
+loose .agent folder: one file for the installer to lay down and for
+PyInstaller to collect, and one sequential read per project instead of a
+walk plus a copy per file. The zip's central directory is the index, so
+members are streamed straight into ``<project>/.agent`` without unpacking
+anywhere else first.
+
+The archive is built from the folder by alpha.spec on every PyInstaller run,
+or by hand with ``python -m alpha agent-bundle``. Source checkouts don't have
+it and keep copying the folder.
+"""
+import os
+import shutil
+import stat
+import zipfile
+from pathlib import PurePosixPath
+
+FOLDER = "alpha/superpower_framework/.agent"
+ARCHIVE = "alpha/superpower_framework/agent.zip"
+
+# Fixed timestamp so rebuilding an unchanged folder gives a byte-identical archive
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+CHUNK = 1024 * 1024
+
+
+def ignore(directory, names):
+    """Copy filter (shutil.copytree signature): bytecode never belongs in the bundle."""
+    return [name for name in names if name == "__pycache__" or name.endswith((".pyc", ".pyo"))]
+
+
+def build(folder, output):
+    """Zip `folder` (bytecode left out) into `output`. Returns the number of files."""
+    entries = []
+    for directory, dirs, files in os.walk(folder):
+        dirs[:] = sorted(set(dirs) - set(ignore(directory, dirs)))
+        for name in sorted(set(files) - set(ignore(directory, files))):
+            path = os.path.join(directory, name)
+            entries.append((os.path.relpath(path, folder).replace(os.sep, "/"), path))
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    tmp = f"{output}.tmp"
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        for arcname, path in sorted(entries):
+            info = zipfile.ZipInfo(arcname, ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            executable = os.stat(path).st_mode & stat.S_IXUSR
+            info.external_attr = (stat.S_IFREG | (0o755 if executable else 0o644)) << 16
+            with open(path, "rb") as src, zf.open(info, "w") as dst:
+                shutil.copyfileobj(src, dst, CHUNK)
+    os.replace(tmp, output)
+    return len(entries)
+
+
+def members(zf):
+    """(info, relative posix path, executable) for each file, refusing paths that escape the target."""
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        path = PurePosixPath(info.filename)
+        if path.is_absolute() or ".." in path.parts or ":" in info.filename:
+            raise ValueError(f"Unsafe path in bundle: {info.filename}")
+        yield info, path.as_posix(), bool((info.external_attr >> 16) & stat.S_IXUSR)
+
+
+def extract(archive, dest):
+    """Stream every member of `archive` into `dest`. Returns (files, bytes)."""
+    files = size = 0
+    made = set()
+    with zipfile.ZipFile(archive) as zf:
+        for info, rel, executable in members(zf):
+            target = os.path.join(dest, *rel.split("/"))
+            parent = os.path.dirname(target)
+            if parent not in made:
+                os.makedirs(parent, exist_ok=True)
+                made.add(parent)
+            with zf.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, CHUNK)
+            if executable and os.name != "nt":
+                os.chmod(target, 0o755)
+            files += 1
+            size += info.file_size
+    return files, size
@@ -0,0 +1,173 @@
+"""Local artifact cache for pip and npm.
+
+Without it, every Python stack downloads its requirements from PyPI and every
+JS stack fetches from the npm registry, even when the same packages were
+installed a minute ago. ALPHA keeps, under ``<data dir>/artifacts``:
+
+- ``wheels/``: a wheelhouse. Requirements are installed from it with
+  ``--no-index``; missing wheels are first built/downloaded into it.
+- ``npm/``: npm's cache (``npm_config_cache``), used with ``prefer-offline``
+  so cached packages and metadata don't hit the registry.
+- ``refreshed.json``: when the npm metadata and each requirement set's
+  wheels were last fetched from the network.
+
+Once warm, installs run at local-disk speed and generation works offline.
+The cache would then pin ``@latest`` and unpinned requirements forever, so
+after ``MAX_AGE_S`` the next online run revalidates npm metadata and
+re-downloads the wheels before trusting the cache again.
+``ALPHA_OFFLINE=1`` (or ``batch --offline``) forbids network access
+altogether. ``ALPHA_PIP_INDEX_URL`` and ``ALPHA_NPM_REGISTRY`` point the
+cold path at a mirror or a local stand-in index.
+"""
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import time
+import uuid
+from pathlib import Path
+from alpha.utils import get_data_dir
+
+REQUIREMENT_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+# How long fetched npm metadata and wheels are trusted without asking the network
+MAX_AGE_S = 24 * 3600
+NPM_KEY = "npm"
+
+
+def wheel_name(name):
+    """A project name as it appears in wheel file names (PEP 427 escaping)."""
+    return re.sub(r"[-_.]+", "_", name).lower()
+
+
+def offline_by_default():
+    return os.environ.get("ALPHA_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def _wheels_key(requirements):
+    return "pip:" + ",".join(sorted({r.strip().lower() for r in requirements if r.strip()}))
+
+
+class ArtifactCache:
+    def __init__(self, root=None, offline=None, max_age_s=MAX_AGE_S):
+        self.root = Path(root) if root else get_data_dir() / "artifacts"
+        self.offline = offline_by_default() if offline is None else offline
+        self.max_age_s = max_age_s
+        # Set once env() has sent npm to the registry for fresh metadata
+        self.npm_revalidating = False
+
+    @property
+    def wheelhouse(self):
+        return self.root / "wheels"
+
+    @property
+    def npm_cache(self):
+        return self.root / "npm"
+
+    def env(self, base=None):
+        """Environment for commands, pointing pip and npm at the cache."""
+        env = dict(os.environ if base is None else base)
+        env["PIP_FIND_LINKS"] = str(self.wheelhouse)
+        env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+        env["npm_config_cache"] = str(self.npm_cache)
+        if self.offline or self.is_fresh(NPM_KEY):
+            env["npm_config_prefer_offline"] = "true"
+        else:
+            self.npm_revalidating = True
+        if os.environ.get("ALPHA_PIP_INDEX_URL"):
+            env["PIP_INDEX_URL"] = os.environ["ALPHA_PIP_INDEX_URL"]
+        if os.environ.get("ALPHA_NPM_REGISTRY"):
+            env["npm_config_registry"] = os.environ["ALPHA_NPM_REGISTRY"]
+        if self.offline:
+            env["PIP_NO_INDEX"] = "1"
+            env["npm_config_offline"] = "true"
+        return env
+
+    def _load_refreshed(self):
+        try:
+            with open(self.root / "refreshed.json", "r") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def is_fresh(self, key):
+        """Whether `key` (NPM_KEY, or a requirement set's wheels) was fetched within max_age_s."""
+        refreshed_at = self._load_refreshed().get(key)
+        return isinstance(refreshed_at, (int, float)) and time.time() - refreshed_at < self.max_age_s
+
+    def mark_fresh(self, key):
+        data = self._load_refreshed()
+        data[key] = time.time()
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.root / f"refreshed.json.{uuid.uuid4().hex}"
+            with open(tmp, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.root / "refreshed.json")
+        except OSError as e:
+            logging.warning(f"Could not record artifact cache refresh: {e}")
+
+    def mark_npm_fresh(self):
+        self.mark_fresh(NPM_KEY)
+
+    def mark_wheels_fresh(self, requirements):
+        self.mark_fresh(_wheels_key(requirements))
+
+    def wheels_current(self, requirements):
+        """Whether installing requirements can use the wheelhouse without downloading first."""
+        if not self.has_wheels(requirements):
+            return False
+        return self.offline or self.is_fresh(_wheels_key(requirements))
+
+    def has_wheels(self, requirements):
+        """Whether the wheelhouse has some wheel for each requirement (not its dependencies)."""
+        if not self.wheelhouse.is_dir():
+            return False
+        cached = {entry.name.split("-", 1)[0].lower() for entry in os.scandir(self.wheelhouse)
+                  if entry.name.endswith(".whl")}
+        for requirement in requirements:
+            match = REQUIREMENT_NAME_RE.match(requirement)
+            if match and wheel_name(match.group(1)) not in cached:
+                return False
+        return True
+
+    def pip_install(self, python, requirements, run):
+        """Install requirements with `python` from the wheelhouse, filling it first if needed.
+
+        `run(argv)` runs a command with env() and raises CalledProcessError on failure.
+        """
+        requirements = list(requirements)
+        if not requirements:
+            return
+        install = [python, "-m", "pip", "install", "--no-index", "--find-links", str(self.wheelhouse), *requirements]
+        if self.wheels_current(requirements):
+            try:
+                run(install)
+                return
+            except subprocess.CalledProcessError:
+                if self.offline:
+                    raise
+                # Usually a dependency that isn't cached yet
+                logging.info("Wheelhouse incomplete, downloading the missing wheels")
+        elif self.offline:
+            raise RuntimeError(f"Offline and no cached wheels for {', '.join(requirements)}")
+        elif self.has_wheels(requirements):
+            logging.info(f"Cached wheels for {', '.join(requirements)} are older than {self.max_age_s}s, refreshing")
+
+        self.wheelhouse.mkdir(parents=True, exist_ok=True)
+        run([python, "-m", "pip", "wheel", "--wheel-dir", str(self.wheelhouse), *requirements])
+        self.mark_wheels_fresh(requirements)
+        run(install)
+
+    def usage(self):
+        """Bytes used by (wheelhouse, npm cache)."""
+        def size(path):
+            return sum(f.stat().st_size for f in path.rglob("*") if f.is_file()) if path.is_dir() else 0
+        return size(self.wheelhouse), size(self.npm_cache)
+
+    def clear(self):
+        shutil.rmtree(self.wheelhouse, ignore_errors=True)
+        shutil.rmtree(self.npm_cache, ignore_errors=True)
@@ -0,0 +1,217 @@
+"""Content-addressed store for stack templates.
+
+Many template folders are near-identical copies of each other. Importing them
+into the store keeps every distinct file once, as a blob named by its SHA-256,
+plus a small manifest per template listing its paths, modes and blob hashes.
+Disk usage grows with unique content, not with the number of templates.
+
+Layout under ``<data dir>/template-store``::
+
+    blobs/ab/abcdef...      file contents, read-only
+    manifests/<name>.json   {"name", "source", "dirs", "files", "symlinks"}
+
+Materializing a template reads only the blobs in its manifest. Files go
+through the copy engine, so they are reflinked where the filesystem allows
+and never share an inode with the store; ``.tmpl`` files are rendered.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import stat
+import uuid
+from pathlib import Path
+from alpha import templating
+from alpha.copyengine import CopyEngine
+from alpha.utils import get_data_dir
+
+# Stack names become file names: no separators, no leading dot
+NAME_RE = re.compile(r"^[^./\\][^/\\]*$")
+HASH_CHUNK = 1024 * 1024
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TemplateStore:
+    def __init__(self, root=None):
+        self.root = Path(root) if root else get_data_dir() / "template-store"
+
+    def blob_path(self, digest):
+        return self.root / "blobs" / digest[:2] / digest
+
+    def _manifest_path(self, name):
+        if not NAME_RE.match(name):
+            raise ValueError(f"Invalid template name: {name!r}")
+        return self.root / "manifests" / f"{name}.json"
+
+    def names(self):
+        manifests = self.root / "manifests"
+        if not manifests.is_dir():
+            return []
+        return sorted(path.stem for path in manifests.glob("*.json"))
+
+    def manifest(self, name):
+        """The manifest of a stored template, or None."""
+        try:
+            with open(self._manifest_path(name), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _add_blob(self, path, st, previous=None):
+        """Store a file's content, returning its hash.
+
+        `previous` is the file's entry from the last import: if size and
+        mtime are unchanged, it is trusted instead of hashing the file again.
+        """
+        if previous and previous["size"] == st.st_size and previous.get("mtime_ns") == st.st_mtime_ns \
+                and self.blob_path(previous["hash"]).exists():
+            return previous["hash"]
+
+        digest = hash_file(path)
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_name(f"{digest}.{uuid.uuid4().hex}.tmp")
+            CopyEngine(workers=1).copy_file(path, tmp, st)
+            # Blobs are never edited in place; executable if the first copy was
+            os.chmod(tmp, 0o555 if st.st_mode & stat.S_IXUSR else 0o444)
+            os.replace(tmp, blob)
+        return digest
+
+    def import_template(self, name, source):
+        """Add (or update) a template from a directory. Returns its manifest.
+
+        Re-importing an unchanged folder costs one stat per file.
+        """
+        source = Path(source)
+        if not source.is_dir():
+            raise ValueError(f"Template folder not found: {source}")
+        old = self.manifest(name) or {}
+        previous = {entry["path"]: entry for entry in old.get("files", [])}
+        manifest = {"name": name, "source": str(source.absolute()), "dirs": [], "files": [], "symlinks": []}
+        self._scan(str(source), "", manifest, previous)
+
+        if manifest == old:
+            return old
+        path = self._manifest_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{name}.json.{uuid.uuid4().hex}")
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        return manifest
+
+    def _scan(self, directory, prefix, manifest, previous):
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        subdirs = []
+        for entry in entries:
+            rel = prefix + entry.name
+            if entry.is_symlink():
+                manifest["symlinks"].append({"path": rel, "target": os.readlink(entry.path)})
+            elif entry.is_dir():
+                manifest["dirs"].append(rel)
+                subdirs.append(entry)
+            else:
+                st = entry.stat()
+                manifest["files"].append({
+                    "path": rel,
+                    "hash": self._add_blob(entry.path, st, previous.get(rel)),
+                    "mode": stat.S_IMODE(st.st_mode),
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                })
+        for entry in subdirs:
+            self._scan(entry.path, prefix + entry.name + "/", manifest, previous)
+
+    def remove(self, name):
+        """Drop a template's manifest; its blobs go at the next gc()."""
+        try:
+            self._manifest_path(name).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def orphaned(self, directory):
+        """Names of templates synced from a folder under `directory` that no longer exists."""
+        directory = Path(directory).absolute()
+        names = []
+        for name in self.names():
+            source = Path((self.manifest(name) or {}).get("source", ""))
+            if source.is_absolute() and directory in source.parents and not source.is_dir():
+                names.append(name)
+        return names
+
+    def prune(self, directory):
+        """Remove the orphaned() templates of `directory`.
+
+        Returns their names; their blobs go at the next gc().
+        """
+        removed = self.orphaned(directory)
+        for name in removed:
+            logging.info(f"Template folder of '{name}' is gone, removing it from the store")
+            self.remove(name)
+        return removed
+
+    def gc(self):
+        """Delete blobs no manifest references. Returns the bytes freed."""
+        referenced = set()
+        for name in self.names():
+            referenced.update(entry["hash"] for entry in self.manifest(name)["files"])
+        freed = 0
+        blobs = self.root / "blobs"
+        if blobs.is_dir():
+            for blob in blobs.glob("*/*"):
+                if blob.name not in referenced and blob.suffix != ".tmp":
+                    freed += blob.stat().st_size
+                    blob.unlink()
+        return freed
+
+    def usage(self):
+        """(bytes of all templates as files, bytes actually stored in blobs)."""
+        logical = sum(entry["size"] for name in self.names() for entry in self.manifest(name)["files"])
+        blobs = self.root / "blobs"
+        physical = sum(blob.stat().st_size for blob in blobs.glob("*/*")) if blobs.is_dir() else 0
+        return logical, physical
+
+    def materialize(self, name, destination, context=None):
+        """Write a stored template into destination (which may exist)."""
+        manifest = self.manifest(name)
+        if manifest is None:
+            raise ValueError(f"Template '{name}' is not in the store")
+        destination = Path(destination)
+        destination.mkdir(parents=True, exist_ok=True)
+        for rel in manifest["dirs"]:
+            (destination / rel).mkdir(parents=True, exist_ok=True)
+        for link in manifest["symlinks"]:
+            target = destination / link["path"]
+            if os.path.lexists(target):
+                os.remove(target)
+            os.symlink(link["target"], target)
+
+        context = dict({"name": destination.name}, **(context or {}))
+        copies, renders = [], []
+        blobs, dest = str(self.root / "blobs"), str(destination)
+        for entry in manifest["files"]:
+            digest = entry["hash"]
+            blob = os.path.join(blobs, digest[:2], digest)
+            target = os.path.join(dest, entry["path"])
+            if target.endswith(templating.TEMPLATE_SUFFIX):
+                renders.append((templating.load(blob), context, target[:-len(templating.TEMPLATE_SUFFIX)]))
+                continue
+            if os.path.lexists(target):
+                os.remove(target)  # May be read-only
+            copies.append((blob, target, os.stat(blob), entry["mode"]))
+
+        stats = CopyEngine().copy_files(copies)
+        templating.render_files(renders)
+        logging.info(f"Materialized template {name}: {len(renders)} rendered, {stats}")
+        return stats
@@ -0,0 +1,368 @@
+"""Headless command-line entry point (``python -m alpha``).
+
+Drives ``ProjectInitializer.generate_project`` without the GUI so that many
+projects can be scaffolded at once from a manifest.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from alpha.initializer import ProjectInitializer
+from alpha.snapshots import SnapshotCache
+from alpha.utils import get_data_dir
+
+LOG_TAIL_LINES = 15
+
+
+def load_manifest(path):
+    """Load a YAML/JSON manifest and return a list of project configs.
+
+    Accepted shapes:
+      - a list of project configs
+      - {"defaults": {...}, "projects": [...]}, where defaults are merged
+        into every project (project keys win)
+    """
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+
+    if path.suffix.lower() == ".json":
+        data = json.loads(text)
+    else:
+        import yaml
+        data = yaml.safe_load(text)
+
+    if isinstance(data, list):
+        defaults, projects = {}, data
+    elif isinstance(data, dict):
+        defaults = data.get("defaults", {}) or {}
+        projects = data.get("projects", []) or []
+    else:
+        raise ValueError(f"Manifest {path} must be a list or a mapping with 'projects'")
+
+    configs = []
+    for i, project in enumerate(projects):
+        if not isinstance(project, dict):
+            raise ValueError(f"Manifest entry #{i + 1} is not a mapping")
+        config = {**defaults, **project}
+        missing = [k for k in ("project_name", "stack", "target_dir") if not config.get(k)]
+        if missing:
+            raise ValueError(f"Manifest entry #{i + 1} is missing: {', '.join(missing)}")
+        configs.append(config)
+    return configs
+
+
+def _log_name(index, project_name):
+    return f"{index:03d}-{re.sub(r'[^A-Za-z0-9_.-]+', '_', project_name or 'project')}.log"
+
+
+@contextmanager
+def _output_to(path):
+    """Point this process's stdout/stderr (fds 1 and 2, so child commands too) at a log file."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    with open(path, "ab") as log:
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for fd, original in zip((1, 2), saved):
+            os.dup2(original, fd)
+            os.close(original)
+
+
+def _generate_one(config, log_file=None):
+    """Process-pool worker: generate a single project and report the outcome.
+
+    With `log_file`, everything the generation and its commands print goes
+    there instead of the shared terminal.
+    """
+    start = time.perf_counter()
+    output = _output_to(log_file) if log_file else nullcontext()
+    try:
+        with output:
+            ProjectInitializer().generate_project(config)
+        error = None
+    except Exception as e:
+        error = str(e)
+    return {
+        "project_name": config.get("project_name"),
+        "stack": config.get("stack"),
+        "success": error is None,
+        "error": error,
+        "duration_s": time.perf_counter() - start,
+        "log_file": str(log_file) if log_file else None,
+    }
+
+
+def run_batch(configs, jobs=None, log_dir=None):
+    """Generate every config in a bounded process pool, in completion order.
+
+    Each project's output goes to its own file in `log_dir` (default: a new
+    directory under <data dir>/logs), so parallel npm/pip runs don't interleave.
+    """
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    log_dir = Path(log_dir) if log_dir else get_data_dir() / "logs" / time.strftime("batch-%Y%m%d-%H%M%S")
+    log_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(configs) or 1)) as pool:
+        futures = [pool.submit(_generate_one, config, log_dir / _log_name(i, config.get("project_name")))
+                   for i, config in enumerate(configs)]
+        for future in as_completed(futures):
+            result = future.result()
+            _print_result(result)
+            results.append(result)
+    return results
+
+
+def _print_result(result):
+    status = "OK  " if result["success"] else "FAIL"
+    log = f" -> {result['log_file']}" if result.get("log_file") else ""
+    print(f"[{status}] {result['project_name']} ({result['stack']}) in {result['duration_s']:.1f}s{log}", flush=True)
+
+
+def _log_tail(path, lines=LOG_TAIL_LINES):
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return "".join(deque(f, maxlen=lines)).rstrip()
+    except (OSError, TypeError):
+        return ""
+
+
+def print_summary(results, wall_s):
+    ok = [r for r in results if r["success"]]
+    failed = [r for r in results if not r["success"]]
+
+    print()
+    print(f"{'Project':<30} {'Stack':<12} {'Status':<8} {'Time':>8}")
+    print("-" * 61)
+    for r in sorted(results, key=lambda r: r["project_name"] or ""):
+        status = "ok" if r["success"] else "failed"
+        print(f"{r['project_name']:<30} {r['stack']:<12} {status:<8} {r['duration_s']:>7.1f}s")
+    print("-" * 61)
+
+    serial_s = sum(r["duration_s"] for r in results)
+    print(f"{len(ok)} succeeded, {len(failed)} failed in {wall_s:.1f}s (serial time {serial_s:.1f}s)")
+    if results and results[0].get("log_file"):
+        print(f"Logs: {Path(results[0]['log_file']).parent}")
+
+    for r in failed:
+        print(f"\n{r['project_name']}: {r['error']}")
+        tail = _log_tail(r.get("log_file"))
+        if tail:
+            print(f"--- last lines of {r['log_file']} ---\n{tail}")
+
+
+def cmd_batch(args):
+    configs = load_manifest(args.manifest)
+    for config in configs:
+        if args.cache:
+            config["use_cache"] = True
+        if args.golden_venv:
+            config["use_golden_venv"] = True
+        if args.resume:
+            config["resume"] = True
+        if args.offline:
+            config["offline"] = True
+    if not configs:
+        print("Manifest contains no projects.")
+        return 0
+
+    if args.plan:
+        initializer = ProjectInitializer()
+        for config in configs:
+            print(initializer.build_plan(config).describe())
+        return 0
+
+    start = time.perf_counter()
+    results = run_batch(configs, jobs=args.jobs, log_dir=args.log_dir)
+    print_summary(results, time.perf_counter() - start)
+    return 0 if all(r["success"] for r in results) else 1
+
+
+def cmd_cache(args):
+    cache = SnapshotCache()
+    if args.action == "clear":
+        removed = cache.invalidate(stack=args.stack)
+        print(f"Removed {removed} snapshot(s).")
+        return 0
+
+    entries = cache.entries()
+    if args.stack:
+        entries = [m for m in entries if m.get("stack") == args.stack]
+    total = 0
+    for meta in entries:
+        total += meta.get("size", 0)
+        last_used = time.strftime("%Y-%m-%d %H:%M", time.localtime(meta.get("last_used", 0)))
+        ui = meta.get("ui_framework") or "-"
+        print(f"{meta['key']}  {meta.get('stack', '?'):<10} {ui:<12} {meta.get('size', 0) / 1024 ** 2:>8.1f} MiB  {last_used}")
+    print(f"{len(entries)} snapshot(s), {total / 1024 ** 2:.1f} MiB in {cache.root}")
+    return 0
+
+
+def cmd_templates(args):
+    from alpha.blobstore import TemplateStore
+    store = TemplateStore()
+    if args.action == "import":
+        if not args.paths:
+            raise ValueError("templates import needs at least one folder")
+        if args.name and len(args.paths) > 1:
+            raise ValueError("--name only works with a single folder")
+        for path in args.paths:
+            name = args.name or Path(path).absolute().name
+            manifest = store.import_template(name, path)
+            print(f"Imported {name}: {len(manifest['files'])} files")
+    elif args.action == "remove":
+        for name in args.paths:
+            print(f"Removed {name}." if store.remove(name) else f"No template named {name}.")
+    elif args.action == "gc":
+        for name in store.prune(args.templates_dir):
+            print(f"Removed {name}: its folder in {args.templates_dir} is gone.")
+        print(f"Freed {store.gc() / 1024 ** 2:.1f} MiB.")
+    else:
+        for name in store.names():
+            manifest = store.manifest(name)
+            size = sum(entry["size"] for entry in manifest["files"])
+            print(f"{name:<24} {len(manifest['files']):>6} files {size / 1024 ** 2:>8.1f} MiB  {manifest['source']}")
+        logical, physical = store.usage()
+        print(f"{len(store.names())} template(s), {logical / 1024 ** 2:.1f} MiB of files stored in "
+              f"{physical / 1024 ** 2:.1f} MiB of blobs ({store.root})")
+    return 0
+
+
+def cmd_artifacts(args):
+    from alpha.artifacts import ArtifactCache
+    cache = ArtifactCache()
+    if args.action == "clear":
+        cache.clear()
+        print(f"Cleared {cache.root}.")
+        return 0
+    wheels, npm = cache.usage()
+    count = len(list(cache.wheelhouse.glob("*.whl"))) if cache.wheelhouse.is_dir() else 0
+    print(f"wheelhouse  {count:>6} wheels {wheels / 1024 ** 2:>8.1f} MiB  {cache.wheelhouse}")
+    print(f"npm cache   {'':>13} {npm / 1024 ** 2:>8.1f} MiB  {cache.npm_cache}")
+    return 0
+
+
+def cmd_toolchain(args):
+    from alpha.toolchain import Toolchain, TOOLS
+    tools = Toolchain().probe(args.tools or TOOLS, refresh=args.refresh)
+    for tool, info in tools.items():
+        print(f"{tool:<8} {info['version'] or '-':<36} {info['path'] or 'not found'}")
+    return 0 if all(info["path"] for info in tools.values()) else 1
+
+
+def cmd_agent_bundle(args):
+    from alpha import agentbundle
+    from alpha.utils import get_resource_path
+    count = agentbundle.build(get_resource_path(agentbundle.FOLDER), args.output)
+    print(f"Wrote {count} files to {args.output} ({os.path.getsize(args.output) / 1024:.1f} KiB)")
+    return 0
+
+
+def cmd_stats(args):
+    from alpha.history import HistoryStore
+    rows = HistoryStore().stats(stack=args.stack)
+    if not rows:
+        print("No generation history yet.")
+        return 0
+
+    def fmt(value, scale=1, suffix="s"):
+        return "-" if value is None else f"{value / scale:.1f}{suffix}"
+
+    print(f"{'stack':<10} {'step':<20} {'outcome':<24} {'runs':>5} {'p50':>8} {'p95':>8} {'cpu p50':>8} {'written':>9}")
+    for row in rows:
+        print(f"{row['stack']:<10} {row['step']:<20} {row['outcome'] or '-':<24} {row['runs']:>5} {fmt(row['wall_p50']):>8} "
+              f"{fmt(row['wall_p95']):>8} {fmt(row['cpu_p50']):>8} {fmt(row['bytes_p50'], 1024 ** 2, 'MiB'):>9}")
+    return 0
+
+
+def cmd_importtime(args):
+    from alpha.importtime import run_report
+    return run_report(args.modules or None, top=args.top, output=args.json, scale=args.scale)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="alpha", description="ALPHA project initializer (headless)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_batch = sub.add_parser("batch", help="Generate every project listed in a YAML/JSON manifest")
+    p_batch.add_argument("manifest", help="Path to a .yml/.yaml/.json manifest")
+    p_batch.add_argument("-j", "--jobs", type=int, default=None,
+                         help="Number of projects generated in parallel (default: CPU count)")
+    p_batch.add_argument("--cache", action="store_true",
+                         help="Reuse cached stack snapshots instead of re-running init commands")
+    p_batch.add_argument("--golden-venv", action="store_true",
+                         help="Clone a shared pre-built venv into Python stacks instead of building one per project")
+    p_batch.add_argument("--resume", action="store_true",
+                         help="Continue failed generations, skipping the steps they already finished")
+    p_batch.add_argument("--offline", action="store_true",
+                         help="Install only from the local wheelhouse and npm cache (also: ALPHA_OFFLINE=1)")
+    p_batch.add_argument("--log-dir",
+                         help="Where each project's output log goes (default: <data dir>/logs/batch-<time>)")
+    p_batch.add_argument("--plan", action="store_true",
+                         help="Print each project's step dependency graph and exit without generating")
+    p_batch.set_defaults(func=cmd_batch)
+
+    p_cache = sub.add_parser("cache", help="Inspect or invalidate the stack snapshot cache")
+    p_cache.add_argument("action", choices=["list", "clear"])
+    p_cache.add_argument("--stack", help="Only snapshots of this stack")
+    p_cache.set_defaults(func=cmd_cache)
+
+    p_templates = sub.add_parser("templates", help="Manage the deduplicated template store")
+    p_templates.add_argument("action", choices=["list", "import", "remove", "gc"])
+    p_templates.add_argument("paths", nargs="*", help="Folders to import, or template names to remove")
+    p_templates.add_argument("--name", help="Store a single imported folder under this stack name")
+    p_templates.add_argument("--templates-dir", default="templates",
+                             help="gc also removes templates synced from folders deleted here (default: templates)")
+    p_templates.set_defaults(func=cmd_templates)
+
+    p_artifacts = sub.add_parser("artifacts", help="Inspect or clear the local wheelhouse and npm cache")
+    p_artifacts.add_argument("action", choices=["list", "clear"])
+    p_artifacts.set_defaults(func=cmd_artifacts)
+
+    p_toolchain = sub.add_parser("toolchain", help="Show the paths and versions of the external tools")
+    p_toolchain.add_argument("tools", nargs="*", help="Tools to probe (default: python node npm git docker)")
+    p_toolchain.add_argument("--refresh", action="store_true", help="Ignore the cached probe")
+    p_toolchain.set_defaults(func=cmd_toolchain)
+
+    p_bundle = sub.add_parser("agent-bundle", help="Build the .agent archive shipped in release builds")
+    p_bundle.add_argument("-o", "--output", default="bundle/agent.zip", help="Archive path (default: bundle/agent.zip)")
+    p_bundle.set_defaults(func=cmd_agent_bundle)
+
+    p_stats = sub.add_parser("stats", help="Per-step timing percentiles from past generations")
+    p_stats.add_argument("--stack", help="Only this stack")
+    p_stats.set_defaults(func=cmd_stats)
+
+
+    p_import = sub.add_parser("importtime", help="Report import times and check them against import_budget.json")
+    p_import.add_argument("modules", nargs="*", help="Modules to measure (default: all budgeted modules)")
+    p_import.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    p_import.add_argument("--json", help="Also write the report to this JSON file")
+    p_import.add_argument("--scale", type=float, default=1.0, help="Multiply time budgets (for slow machines)")
+    p_import.set_defaults(func=cmd_importtime)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"alpha: error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+"""Structured stack commands.
+
+Besides the legacy ``init_command`` shell string, a stack in commands.json
+can declare ``steps``: a list of built-in operations, which run in-process,
+and argv commands, which spawn the real tool directly (no shell)::
+
+    {"mkdir": "{name}"}                           create a directory (and parents)
+    {"chdir": "{name}"}                           working directory of the following steps
+    {"write": "main.py", "content": "..."}        write a UTF-8 text file
+    {"write": "main.py", "template": "x.tmpl"}    render a file from alpha/file_templates
+    {"venv": "venv", "requirements": ["django"]}  create a venv and pip install into it
+    {"run": ["npx", "create-next-app@latest", "{name}", "--yes"]}
+
+Paths are relative to the working directory, which starts as the target
+directory. Strings may use ``{name}`` (the sanitized project name) and
+``{venv_python}`` (the interpreter of the last venv step). Only these exact
+placeholders are replaced, so braces in file content need no escaping.
+Templates are rendered with the same variables (see alpha/templating.py).
+
+Commands are killed when they run longer than the stack's
+``step_timeout_s`` (a step may set its own ``timeout_s``), and the whole
+generation when it takes longer than ``total_timeout_s``. ``null`` or 0
+disables a timeout.
+"""
+import json
+
+OPS = ("mkdir", "chdir", "write", "venv", "run")
+
+# Generous: a cold npm/pip install on a slow connection takes minutes
+DEFAULT_STEP_TIMEOUT_S = 900
+DEFAULT_TOTAL_TIMEOUT_S = 3600
+
+
+def expand(value, variables):
+    for key, replacement in variables.items():
+        value = value.replace("{" + key + "}", replacement)
+    return value
+
+
+def op_name(step):
+    """The operation of a step, validating its shape."""
+    ops = [op for op in OPS if op in step]
+    if len(ops) != 1:
+        raise ValueError(f"Step must have exactly one of {', '.join(OPS)}: {step}")
+    op = ops[0]
+    if op == "run" and (not isinstance(step["run"], list) or not step["run"]):
+        raise ValueError(f"'run' takes a non-empty argv list: {step}")
+    if op == "write" and ("content" in step) == ("template" in step):
+        raise ValueError(f"'write' needs either 'content' or 'template': {step}")
+    timeout = step.get("timeout_s")
+    if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout < 0):
+        raise ValueError(f"'timeout_s' must be a number of seconds: {step}")
+    return op
+
+
+def validate(steps):
+    if not isinstance(steps, list):
+        raise ValueError("'steps' must be a list")
+    for step in steps:
+        op_name(step)
+
+
+def command_text(stack_cmd):
+    """Canonical text of a stack's init commands (for cache keys and tool detection)."""
+    if "steps" in stack_cmd:
+        return json.dumps(stack_cmd["steps"], sort_keys=True)
+    return stack_cmd.get("init_command", "")
+
+
+def uses_venv(stack_cmd):
+    if "steps" in stack_cmd:
+        return any("venv" in step for step in stack_cmd["steps"])
+    return "venv" in stack_cmd.get("init_command", "")
+
+
+def venv_requirements(stack_cmd):
+    """Requirements of the stack's venv, or None if it doesn't declare them.
+
+    Structured stacks declare them on their venv step; legacy shell stacks
+    with a top-level ``venv_requirements`` key.
+    """
+    if "steps" in stack_cmd:
+        for step in stack_cmd["steps"]:
+            if "venv" in step:
+                return step.get("requirements", [])
+        return None
+    return stack_cmd.get("venv_requirements")
+
+
+def timeouts(stack_cmd):
+    """(per command, whole generation) timeouts of a stack in seconds; None means unlimited."""
+    stack_cmd = stack_cmd or {}
+    step = stack_cmd.get("step_timeout_s", DEFAULT_STEP_TIMEOUT_S)
+    total = stack_cmd.get("total_timeout_s", DEFAULT_TOTAL_TIMEOUT_S)
+    return step or None, total or None
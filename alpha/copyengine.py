@@ -0,0 +1,235 @@
+"""Tree copy engine for templates, snapshots and the .agent bundle.
+
+Each file is copied with the cheapest method the filesystem supports:
+
+1. reflink (``FICLONE``): copy-on-write clone, no data is copied at all
+   (btrfs, XFS, bcachefs, overlayfs on those)
+2. ``os.copy_file_range`` / ``os.sendfile``: copy inside the kernel
+3. a plain buffered copy
+
+A method that the source/destination pair doesn't support is not retried for
+the rest of the tree. Read-only files (assets nobody should edit in place) can
+optionally be hardlinked instead of copied. Files are copied by a thread pool;
+the syscalls release the GIL so this overlaps I/O on large trees.
+"""
+import errno
+import logging
+import os
+import shutil
+import stat
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+
+# Below this many files, starting threads costs more than it saves
+PARALLEL_MIN_FILES = 64
+# On a single core the pool only adds overhead, so it is not used there
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+CHUNK = 8 * 1024 * 1024
+O_BINARY = getattr(os, "O_BINARY", 0)
+WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+# "This filesystem (pair) can't do that": fall back and stop trying.
+# ENOTSOCK: outside Linux, sendfile() only writes to sockets
+UNSUPPORTED = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS, errno.EBADF, errno.EPERM,
+               errno.ENOTSOCK}
+if hasattr(errno, "ENOTSUP"):
+    UNSUPPORTED.add(errno.ENOTSUP)
+
+
+class CopyStats:
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.methods = Counter()
+
+    @property
+    def throughput(self):
+        """Bytes per second."""
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        methods = ", ".join(f"{count} {method}" for method, count in self.methods.most_common())
+        return (f"{self.files} files, {self.bytes / 1024 ** 2:.1f} MiB in {self.seconds:.2f}s "
+                f"({self.throughput / 1024 ** 2:.1f} MiB/s; {methods or 'nothing copied'})")
+
+
+class CopyEngine:
+    def __init__(self, workers=DEFAULT_WORKERS, hardlink_readonly=False):
+        self.workers = workers
+        self.hardlink_readonly = hardlink_readonly
+        # Methods found not to work for this copy; shared by the worker threads
+        self._disabled = set()
+        self._lock = threading.Lock()
+
+    def _disable(self, method, error):
+        with self._lock:
+            if method not in self._disabled:
+                logging.debug(f"Copy method {method} unavailable ({error}), falling back")
+                self._disabled.add(method)
+
+    def copy_file(self, src, dst, st=None, mode=None):
+        """Copy one file (with its permission bits and times); returns the method used."""
+        st = st or os.stat(src)
+        mode = stat.S_IMODE(st.st_mode) if mode is None else mode
+        if self.hardlink_readonly and not mode & WRITE_BITS and mode == stat.S_IMODE(st.st_mode):
+            try:
+                os.link(src, dst)
+                return "hardlink"
+            except OSError as e:
+                if e.errno == errno.EEXIST:
+                    os.remove(dst)
+                    return self.copy_file(src, dst, st, mode)
+                self._disable("hardlink", e)
+
+        # Raw fds: no Python file objects and their buffers on the per-file path
+        src_fd = os.open(src, os.O_RDONLY | O_BINARY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o600)
+            try:
+                method = self._copy_data(src_fd, dst_fd, st.st_size)
+                if os.name != 'nt':
+                    os.fchmod(dst_fd, mode)
+                    os.utime(dst_fd, ns=(st.st_atime_ns, st.st_mtime_ns))
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        if os.name == 'nt':
+            shutil.copystat(src, dst)
+            os.chmod(dst, mode)
+        return method
+
+    def _copy_data(self, src_fd, dst_fd, size):
+        if fcntl is not None and "reflink" not in self._disabled:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                return "reflink"
+            except OSError as e:
+                if e.errno not in UNSUPPORTED:
+                    raise
+                self._disable("reflink", e)
+
+        for method, func in (("copy_file_range", getattr(os, "copy_file_range", None)),
+                             ("sendfile", getattr(os, "sendfile", None) if sys.platform.startswith("linux") else None)):
+            if func is None or method in self._disabled:
+                continue
+            copied = 0
+            try:
+                while copied < size:
+                    if method == "copy_file_range":
+                        n = func(src_fd, dst_fd, min(CHUNK, size - copied))
+                    else:
+                        n = func(dst_fd, src_fd, copied, min(CHUNK, size - copied))
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError as e:
+                if e.errno not in UNSUPPORTED or copied:
+                    raise
+                self._disable(method, e)
+                continue
+            if copied < size:
+                # Shrunk while copying, or a pseudo-file: finish with a plain copy
+                _plain_copy(src_fd, dst_fd, copied)
+            return method
+
+        _plain_copy(src_fd, dst_fd, 0)
+        return "copy"
+
+    def copy_tree(self, src, dst, ignore=None, symlinks=True):
+        """Copy a directory tree into dst (which may exist). Returns CopyStats.
+
+        `ignore` has the shutil.copytree signature: (dir, names) -> names to skip.
+        """
+        start = time.perf_counter()
+        stats = CopyStats()
+        jobs = []
+        dirs = []
+        self._scan(str(src), str(dst), ignore, symlinks, jobs, dirs)
+        self.copy_files(jobs, stats)
+
+        # Directory times last, copying files into them changes them
+        for path, target in dirs:
+            shutil.copystat(path, target)
+
+        stats.seconds = time.perf_counter() - start
+        logging.info(f"Copied {src} -> {dst}: {stats}")
+        return stats
+
+    def copy_files(self, jobs, stats=None):
+        """Copy (src, dst, stat[, mode]) jobs, in parallel when there are many.
+
+        `mode` overrides the permission bits taken from the source stat.
+        Counts go into `stats` (a new CopyStats if None), which is returned.
+        """
+        stats = stats or CopyStats()
+
+        def copy_job(job):
+            return self.copy_file(*job)
+
+        if len(jobs) >= PARALLEL_MIN_FILES and self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                methods = list(pool.map(copy_job, jobs))
+        else:
+            methods = [copy_job(job) for job in jobs]
+
+        for job, method in zip(jobs, methods):
+            stats.files += 1
+            stats.methods[method] += 1
+            if method != "hardlink":
+                stats.bytes += job[2].st_size
+        return stats
+
+    def _scan(self, src, dst, ignore, symlinks, jobs, dirs):
+        """Create the directories and symlinks, collecting (src, dst, stat) file jobs."""
+        os.makedirs(dst, exist_ok=True)
+        dirs.append((src, dst))
+        with os.scandir(src) as it:
+            entries = list(it)
+        skipped = ignore(src, [e.name for e in entries]) if ignore else ()
+
+        for entry in entries:
+            if entry.name in skipped:
+                continue
+            target = os.path.join(dst, entry.name)
+            if symlinks and entry.is_symlink():
+                self._copy_symlink(entry.path, target)
+            elif entry.is_dir():
+                self._scan(entry.path, target, ignore, symlinks, jobs, dirs)
+            else:
+                jobs.append((entry.path, target, entry.stat()))
+
+    @staticmethod
+    def _copy_symlink(src, dst):
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.symlink(os.readlink(src), dst)
+
+
+def copy_tree(src, dst, ignore=None, symlinks=True, hardlink_readonly=False, workers=DEFAULT_WORKERS):
+    """Copy a tree with a fresh CopyEngine; see CopyEngine.copy_tree."""
+    return CopyEngine(workers=workers, hardlink_readonly=hardlink_readonly).copy_tree(src, dst, ignore, symlinks)
+
+
+def _plain_copy(src_fd, dst_fd, offset):
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    while True:
+        chunk = os.read(src_fd, CHUNK)
+        if not chunk:
+            return
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view):]
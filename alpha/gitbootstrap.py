@@ -0,0 +1,272 @@
+"""Stage the bundled .agent tree without `git add`.
+
+`git add .agent` starts cold and hashes every bundled file again for every
+project, although the bundle only changes with an ALPHA release. Instead,
+its blobs and trees are built once per process (SHA-1 + zlib, exactly git's
+loose object format) and written straight into the new repository,
+together with its index. The index carries the stat data of the copied
+files, so git never has to rehash them either.
+
+The commit itself is still made by `git commit`, which knows the user's
+identity, hooks and signing settings. Anything unusual raises, and the
+caller falls back to a single `git add`:
+
+- a repository that already has an index (e.g. create-next-app's), where
+  merging the tree in would take a `git read-tree` anyway
+- a SHA-256 repository
+- ``core.autocrlf``, which makes git convert line endings before hashing
+  (read from git's config files; nothing is spawned)
+- any attributes (``.gitattributes``, ``info/attributes``,
+  ``core.attributesFile``) or ignore rules (``.gitignore``,
+  ``info/exclude``, ``core.excludesFile``)
+"""
+import hashlib
+import os
+import shutil
+import stat
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+from alpha import agentbundle
+
+MODE_FILE = 0o100644
+MODE_EXECUTABLE = 0o100755
+MODE_SYMLINK = 0o120000
+MODE_TREE = 0o040000
+
+# Bundles are hashed once per version (folder sizes/mtimes, or the archive's)
+_bundles = {}
+
+
+class Bundle:
+    def __init__(self, tree, objects, files):
+        self.tree = tree        # hex SHA-1 of the top-level tree
+        self.objects = objects  # {hex sha: zlib-compressed loose object}
+        self.files = files      # [(posix path relative to the bundle, mode, binary sha)]
+
+
+def _signature(root):
+    if os.path.isfile(root):
+        st = os.stat(root)
+        return (st.st_size, st.st_mtime_ns)
+    entries = []
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(set(dirs) - set(agentbundle.ignore(directory, dirs)))
+        for name in sorted(set(files) - set(agentbundle.ignore(directory, files))):
+            st = os.lstat(os.path.join(directory, name))
+            entries.append((os.path.relpath(os.path.join(directory, name), root), st.st_size, st.st_mtime_ns))
+    return tuple(entries)
+
+
+def load_bundle(root):
+    """Bundle for a .agent folder or an agent.zip, cached while it is unchanged."""
+    root = str(root)
+    key = (root, _signature(root))
+    if key not in _bundles:
+        objects, files = {}, []
+        node = _read_archive(root) if os.path.isfile(root) else _read_folder(root)
+        tree = _hash_tree(node, "", objects, files)
+        if tree is None:
+            raise ValueError(f"{root} has no files to stage")
+        _bundles.clear()  # Only the current bundle is worth keeping
+        _bundles[key] = Bundle(tree.hex(), objects, files)
+    return _bundles[key]
+
+
+# Both readers return nested dicts: {name: {...}} for directories, {name: (mode, bytes)} for files
+
+def _read_folder(directory):
+    node = {}
+    with os.scandir(directory) as it:
+        scanned = list(it)
+    skipped = set(agentbundle.ignore(directory, [entry.name for entry in scanned]))
+    for entry in scanned:
+        if entry.name in skipped:
+            continue
+        if entry.is_symlink():
+            node[entry.name] = (MODE_SYMLINK, os.fsencode(os.readlink(entry.path)))
+        elif entry.is_dir():
+            node[entry.name] = _read_folder(entry.path)
+        else:
+            executable = os.name != "nt" and entry.stat().st_mode & stat.S_IXUSR
+            with open(entry.path, "rb") as f:
+                node[entry.name] = (MODE_EXECUTABLE if executable else MODE_FILE, f.read())
+    return node
+
+
+def _read_archive(path):
+    root = {}
+    with zipfile.ZipFile(path) as zf:
+        for info, rel, executable in agentbundle.members(zf):
+            *parents, name = rel.split("/")
+            node = root
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[name] = (MODE_EXECUTABLE if executable else MODE_FILE, zf.read(info))
+    return root
+
+
+def _store(objects, kind, data):
+    raw = f"{kind} {len(data)}\0".encode("ascii") + data
+    sha = hashlib.sha1(raw).digest()
+    objects[sha.hex()] = zlib.compress(raw)
+    return sha
+
+
+def _hash_tree(node, rel, objects, files):
+    """Store the tree for `node` and everything under it; None if it holds no files."""
+    entries = []
+    for name, child in node.items():
+        path = f"{rel}/{name}" if rel else name
+        if isinstance(child, dict):
+            mode, sha = MODE_TREE, _hash_tree(child, path, objects, files)
+            if sha is None:
+                continue  # git doesn't track empty directories
+        else:
+            mode, sha = child[0], _store(objects, "blob", child[1])
+            files.append((path, mode, sha))
+        entries.append((mode, os.fsencode(name), sha))
+    if not entries:
+        return None
+    # git orders tree entries as if directory names ended with "/"
+    entries.sort(key=lambda e: e[1] + b"/" if e[0] == MODE_TREE else e[1])
+    return _store(objects, "tree", b"".join(b"%o %s\0" % (mode, name) + sha for mode, name, sha in entries))
+
+
+def write_objects(git_dir, objects):
+    """Write loose objects that the repository doesn't have yet."""
+    for sha, data in objects.items():
+        path = os.path.join(git_dir, "objects", sha[:2], sha[2:])
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o444)  # Objects are immutable; git makes them read-only too
+        os.replace(tmp, path)
+
+
+def write_index(git_dir, worktree, prefix, files):
+    """Write a version 2 index holding only `files`, stat data taken from the work tree."""
+    entries = []
+    for rel, mode, sha in files:
+        name = os.fsencode(f"{prefix}/{rel}")
+        st = os.lstat(os.path.join(worktree, prefix, rel))
+        fields = (st.st_ctime_ns // 10**9, st.st_ctime_ns % 10**9, st.st_mtime_ns // 10**9, st.st_mtime_ns % 10**9,
+                  st.st_dev, st.st_ino, mode, st.st_uid, st.st_gid, st.st_size)
+        entry = struct.pack(">10I", *(v & 0xFFFFFFFF for v in fields)) + sha + struct.pack(">H", min(len(name), 0xFFF)) + name
+        entries.append((name, entry + b"\0" * (8 - len(entry) % 8)))
+    entries.sort()
+    data = b"DIRC" + struct.pack(">II", 2, len(entries)) + b"".join(entry for _, entry in entries)
+    data += hashlib.sha1(data).digest()
+
+    # index.lock is git's own lock; creating it exclusively keeps us off a concurrent git's toes
+    lock = os.path.join(git_dir, "index.lock")
+    fd = os.open(lock, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(lock, os.path.join(git_dir, "index"))
+    except BaseException:
+        if os.path.exists(lock):
+            os.remove(lock)
+        raise
+
+
+def _config_files(git_dir):
+    """git's config files, system to local (the ones `git config` would read)."""
+    files = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        files.append(os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig")
+        git = shutil.which("git")
+        if git:
+            # Git for Windows keeps its system config (autocrlf=true by default) next to git.exe
+            prefix = os.path.dirname(os.path.dirname(os.path.realpath(git)))
+            files += [os.path.join(prefix, "etc", "gitconfig"), os.path.join(prefix, "mingw64", "etc", "gitconfig")]
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    files += [os.path.join(xdg, "git", "config"), os.environ.get("GIT_CONFIG_GLOBAL") or os.path.expanduser("~/.gitconfig")]
+    files.append(os.path.join(git_dir, "config"))
+    return files
+
+
+def read_core_config(git_dir):
+    """{name: value} of the [core] settings in git's config files, read without spawning git.
+
+    Raises ValueError for configs this simple reader can't follow (includes).
+    """
+    core = {}
+    for path in _config_files(git_dir):
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                lines = f.readlines()
+        except OSError:
+            continue
+        section = None
+        for line in lines:
+            line = line.split("#", 1)[0].split(";", 1)[0].strip()
+            if line.startswith("["):
+                section = line[1:line.find("]")].strip().lower()
+                if section.startswith("include"):
+                    raise ValueError(f"{path} includes other config files")
+            elif section == "core" and line:
+                name, _, value = line.partition("=")
+                core[name.strip().lower()] = value.strip().strip('"') if _ else "true"
+    return core
+
+
+def _has_rules(path):
+    """Whether a gitignore/gitattributes-style file has anything but comments."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return any(line.strip() and not line.lstrip().startswith("#") for line in f)
+    except OSError:
+        return False
+
+
+def _global_file(core, key, name):
+    path = core.get(key)
+    if path is None:
+        # git's default when the setting is unset
+        xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+        path = os.path.join(xdg, "git", name)
+    return os.path.expanduser(path)
+
+
+def check_plain_add(project_path, git_dir, bundle, prefix):
+    """Raise ValueError unless `git add` would store the bundle as its raw bytes, in a fresh index."""
+    if (git_dir / "index").exists():
+        # One `git add` is as cheap as merging our tree into an index that already exists
+        raise ValueError("repository already has an index")
+    core = read_core_config(git_dir)
+    if core.get("autocrlf", "false").lower() in ("true", "input"):
+        raise ValueError(f"core.autocrlf is {core['autocrlf']}")
+    bundled = [project_path / prefix / rel for rel, _, _ in bundle.files
+               if rel.rsplit("/", 1)[-1] in (".gitattributes", ".gitignore")]
+    rule_files = [project_path / ".gitattributes", git_dir / "info" / "attributes",
+                  _global_file(core, "attributesfile", "attributes"),
+                  project_path / ".gitignore", git_dir / "info" / "exclude",
+                  _global_file(core, "excludesfile", "ignore"), *bundled]
+    for path in rule_files:
+        if _has_rules(path):
+            raise ValueError(f"{path} may change what git add stores")
+
+
+def stage(project_path, bundle_root, prefix=".agent"):
+    """Add the copy of `bundle_root` (folder or agent.zip) at project_path/prefix to a fresh index, unhashed.
+
+    Spawns nothing. Raises OSError or ValueError when this repository needs `git add`.
+    """
+    project_path = Path(project_path)
+    git_dir = project_path / ".git"
+    if not git_dir.is_dir():
+        raise ValueError(f"{git_dir} is not a git directory")
+    if "sha256" in (git_dir / "config").read_text(encoding="utf-8", errors="replace").lower():
+        raise ValueError("SHA-256 repository")
+
+    bundle = load_bundle(bundle_root)
+    check_plain_add(project_path, git_dir, bundle, prefix)
+    write_objects(git_dir, bundle.objects)
+    write_index(git_dir, project_path, prefix, bundle.files)
+    return bundle.tree
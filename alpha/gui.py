@@ -1,22 +1,34 @@
 import sys
 import json
+import logging
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QLineEdit, QPushButton, QComboBox, 
-    QCheckBox, QFileDialog, QMessageBox, QProgressBar,
-    QFrame, QDialog, QListWidget, QFormLayout, QGroupBox
+    QCheckBox, QFileDialog, QMessageBox,
+    QFrame, QPlainTextEdit, QToolButton, QSpinBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from alpha.initializer import ProjectInitializer
 
 class ProjectGeneratorWorker(QThread):
     finished = pyqtSignal(bool, str) # Success, Message
+    phase_started = pyqtSignal(str) # Phase
+    phase_finished = pyqtSignal(str, float) # Phase, Duration (s)
+    output = pyqtSignal(str, str) # Phase, Line
 
     def __init__(self, config):
         super().__init__()
         self.config = config
         self.initializer = ProjectInitializer()
+        # Emitted from the worker thread, delivered queued on the GUI thread
+        self.initializer.on_phase = self.phase_started.emit
+        self.initializer.on_phase_finished = self.phase_finished.emit
+        self.initializer.on_output = self.output.emit
 
     def run(self):
         try:
@@ -25,148 +37,326 @@ class ProjectGeneratorWorker(QThread):
         except Exception as e:
             self.finished.emit(False, str(e))
 
-class StackEditorDialog(QDialog):
-    def __init__(self, parent=None, initializer=None):
-        super().__init__(parent)
-        self.setWindowTitle("Stack Manager")
-        self.setGeometry(150, 150, 700, 500)
+    def cancel(self):
+        # Kills the running command (and everything it spawned), then stops
+        self.initializer.cancel()
+
+class PrefetchWorker(QThread):
+    """Warms the caches for the selected stack in the background (see alpha/prefetch.py)."""
+    done = pyqtSignal(dict) # Report
+
+    def __init__(self, initializer, stack, ui_framework, golden_venv):
+        super().__init__()
         self.initializer = initializer
-        self._setup_ui()
-        self._populate_list()
-        self._apply_styles()
+        self.stack = stack
+        self.ui_framework = ui_framework
+        self.golden_venv = golden_venv
+        self._stop = threading.Event()
 
-    def _setup_ui(self):
-        layout = QHBoxLayout(self)
-
-        # Left: List
-        left_layout = QVBoxLayout()
-        left_layout.addWidget(QLabel("Available Stacks"))
-        self.list_stacks = QListWidget()
-        self.list_stacks.currentItemChanged.connect(self._on_stack_selected)
-        left_layout.addWidget(self.list_stacks)
-        
-        btn_add = QPushButton("Add New Stack")
-        btn_add.clicked.connect(self._on_add_new)
-        left_layout.addWidget(btn_add)
-        
-        layout.addLayout(left_layout, 1)
+    def run(self):
+        from alpha.prefetch import Prefetcher
+        try:
+            prefetcher = Prefetcher(self.initializer, should_stop=self._stop.is_set)
+            self.done.emit(prefetcher.prefetch(self.stack, self.ui_framework, self.golden_venv))
+        except Exception as e:
+            # Speculative work must never bother the user
+            logging.warning(f"Prefetch for {self.stack} failed: {e}")
 
-        # Right: Details
-        self.group_details = QGroupBox("Stack Configuration")
-        form_layout = QFormLayout(self.group_details)
-        
-        self.input_name = QLineEdit()
-        self.input_cmd = QLineEdit()
-        self.input_docker_base = QLineEdit()
-        self.input_docker_port = QLineEdit()
-        self.input_docker_cmd = QLineEdit()
-        
-        form_layout.addRow("Stack Name:", self.input_name)
-        form_layout.addRow("Init Command:", self.input_cmd)
-        form_layout.addRow("Docker Base (Opt):", self.input_docker_base)
-        form_layout.addRow("Docker Port (Opt):", self.input_docker_port)
-        form_layout.addRow("Docker Cmd (Opt):", self.input_docker_cmd)
-        
-        btn_save = QPushButton("Save Stack")
-        btn_save.clicked.connect(self._save_stack)
-        form_layout.addRow(btn_save)
-        
-        btn_delete = QPushButton("Delete Stack")
-        btn_delete.clicked.connect(self._delete_stack)
-        # Style delete button red later
-        form_layout.addRow(btn_delete)
+    def stop(self):
+        # Kills a running npm/pip command too
+        self._stop.set()
 
-        layout.addWidget(self.group_details, 2)
+class LogPanel(QWidget):
+    """Collapsible view of streamed command output.
+    
+    Lines are collected in a bounded ring buffer and flushed to the text view
+    on a timer, so heavy npm output costs one repaint per interval instead of
+    one per line.
+    """
+    MAX_LINES = 5000
+    FLUSH_INTERVAL_MS = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = deque(maxlen=self.MAX_LINES)
+        self._running = {}  # Phase -> start time; independent phases overlap
+        self._run_start = 0.0
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        header = QHBoxLayout()
+        self.btn_toggle = QToolButton()
+        self.btn_toggle.setObjectName("btn_toggle_log")
+        self.btn_toggle.setCheckable(True)
+        self.btn_toggle.setArrowType(Qt.ArrowType.RightArrow)
+        self.btn_toggle.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        self.btn_toggle.setText("Log")
+        self.btn_toggle.toggled.connect(self._on_toggled)
+        self.lbl_phase = QLabel("")
+        self.lbl_phase.setObjectName("lbl_phase")
+        header.addWidget(self.btn_toggle)
+        header.addWidget(self.lbl_phase, 1)
+        layout.addLayout(header)
+
+        self.text = QPlainTextEdit()
+        self.text.setObjectName("log_output")
+        self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(self.MAX_LINES)  # Ring buffer in the view too
+        self.text.setMinimumHeight(150)
+        self.text.hide()
+        layout.addWidget(self.text)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._timer.timeout.connect(self._flush)
+
+    def start(self):
+        self.text.clear()
+        self._pending.clear()
+        self._running.clear()
+        self._run_start = time.monotonic()
+        self._timer.start()
+
+    def stop(self):
+        self._running.clear()
+        self.lbl_phase.setText("")
+        self._pending.append(f"── done in {time.monotonic() - self._run_start:.1f}s ──")
+        self._flush()
+        self._timer.stop()
+
+    def on_phase(self, phase):
+        self._running[phase] = time.monotonic()
+        self._pending.append(f"── {phase} ──")
+
+    def on_phase_finished(self, phase, duration_s):
+        self._running.pop(phase, None)
+        self._pending.append(f"── {phase} took {duration_s:.1f}s ──")
+
+    def on_output(self, phase, line):
+        if len(self._running) > 1:
+            line = f"[{phase}] {line}"
+        self._pending.append(line)
+
+    def _flush(self):
+        now = time.monotonic()
+        self.lbl_phase.setText(", ".join(f"{phase} ({now - start:.0f}s)" for phase, start in self._running.items()))
+        if not self._pending:
+            return
+        lines = "\n".join(self._pending)
+        self._pending.clear()
+        self.text.appendPlainText(lines)
+
+    def _on_toggled(self, checked):
+        self.btn_toggle.setArrowType(Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow)
+        self.text.setVisible(checked)
+
+class GenerationJob:
+    """One project in the generation queue."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    CANCELLING = "cancelling"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, config, eta_s=None):
+        self.config = config
+        self.eta_s = eta_s
+        self.status = self.QUEUED
+        self.message = ""
+        self.worker = None
+        self.started_at = None
+        self.finished_at = None
 
-    def _apply_styles(self):
-        self.setStyleSheet("""
-            QDialog { background-color: #1E1E1E; color: white; }
-            QLabel { color: white; }
-            QGroupBox { color: #A020F0; font-weight: bold; border: 1px solid #3E3E3E; margin-top: 10px; }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 3px; }
-            QLineEdit { background-color: #2D2D2D; color: white; padding: 5px; border: 1px solid #3E3E3E; }
-            QListWidget { background-color: #2D2D2D; color: white; border: 1px solid #3E3E3E; }
-            QPushButton { background-color: #3E3E3E; color: white; padding: 6px; border-radius: 4px; }
-            QPushButton:hover { background-color: #4E4E4E; }
-        """)
+    @property
+    def active(self):
+        return self.status in (self.RUNNING, self.CANCELLING)
 
-    def _populate_list(self):
-        self.list_stacks.clear()
-        stacks = self.initializer.get_available_stacks()
-        self.list_stacks.addItems(stacks)
+    @property
+    def finished(self):
+        return self.status in (self.DONE, self.FAILED, self.CANCELLED)
 
-    def _on_stack_selected(self, current, previous):
-        if not current:
-            return
-            
-        stack_name = current.text()
-        self.input_name.setText(stack_name)
-        
-        # Load config from commands.json if available
-        config = self.initializer.commands_config.get("stacks", {}).get(stack_name, {})
-        
-        self.input_cmd.setText(config.get("init_command", ""))
-        self.input_docker_base.setText(config.get("docker_base", ""))
-        self.input_docker_port.setText(config.get("docker_port", ""))
-        self.input_docker_cmd.setText(config.get("docker_cmd", ""))
-        
-        # Disable name editing for existing? Maybe allow copy?
-        # For simplicity, if it's a default stack not in JSON, these will be empty/readonly logic needed?
-        # We'll allow editing, which essentially overrides defaults if we save.
-
-    def _on_add_new(self):
-        self.list_stacks.clearSelection()
-        self.input_name.clear()
-        self.input_name.setFocus()
-        self.input_cmd.clear()
-        self.input_docker_base.clear()
-        self.input_docker_port.clear()
-        self.input_docker_cmd.clear()
-
-    def _save_stack(self):
-        name = self.input_name.text().strip()
-        cmd = self.input_cmd.text().strip()
-        
-        if not name or not cmd:
-            QMessageBox.warning(self, "Invalid", "Name and Init Command are required.")
-            return
-            
-        config = {
-            "init_command": cmd,
-            "docker_base": self.input_docker_base.text().strip(),
-            "docker_port": self.input_docker_port.text().strip(),
-            "docker_cmd": self.input_docker_cmd.text().strip()
-        }
-        
-        self.initializer.save_stack_config(name, config)
-        QMessageBox.information(self, "Saved", f"Stack '{name}' saved successfully.")
-        self._populate_list()
+    def duration(self):
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.monotonic()) - self.started_at
 
-    def _delete_stack(self):
-        name = self.input_name.text().strip()
-        if not name: return
-        
-        if name not in self.initializer.commands_config.get("stacks", {}):
-            QMessageBox.warning(self, "Cannot Delete", "Cannot delete default/internal stacks, only custom configurations.")
-            return
+class JobQueuePanel(QWidget):
+    """Queue of generation jobs, running up to a configurable number at once.
+    
+    Each job gets its own worker thread (and ProjectInitializer). Output of
+    all running jobs goes to the shared log panel, phases prefixed with the
+    project name.
+    """
+    job_finished = pyqtSignal(str, str, str) # Project, Status (done/failed/cancelled), Message
+    queue_started = pyqtSignal()
+    queue_drained = pyqtSignal()
+
+    COLUMNS = ["Project", "Stack", "Status", "Time", ""]
+    DEFAULT_CONCURRENCY = 2
+    MAX_CONCURRENCY = 8
+    REFRESH_INTERVAL_MS = 500
+
+    def __init__(self, log_panel=None, parent=None):
+        super().__init__(parent)
+        self.log_panel = log_panel
+        self.jobs = []
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        header = QHBoxLayout()
+        header.addWidget(QLabel("Queue"), 1)
+        header.addWidget(QLabel("Run at once:"))
+        self.spin_concurrency = QSpinBox()
+        self.spin_concurrency.setObjectName("spin_concurrency")
+        self.spin_concurrency.setRange(1, self.MAX_CONCURRENCY)
+        self.spin_concurrency.setValue(self.DEFAULT_CONCURRENCY)
+        self.spin_concurrency.valueChanged.connect(self._schedule)
+        header.addWidget(self.spin_concurrency)
+        self.btn_clear = QPushButton("Clear finished")
+        self.btn_clear.setObjectName("btn_clear_finished")
+        self.btn_clear.clicked.connect(self.clear_finished)
+        header.addWidget(self.btn_clear)
+        layout.addLayout(header)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setObjectName("job_table")
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setMinimumHeight(120)
+        layout.addWidget(self.table)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self._refresh_times)
+
+    @property
+    def concurrency(self):
+        return self.spin_concurrency.value()
+
+    def enqueue(self, config, eta_s=None):
+        job = GenerationJob(config, eta_s)
+        self.jobs.append(job)
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self.table.setItem(row, 0, QTableWidgetItem(config["project_name"]))
+        self.table.setItem(row, 1, QTableWidgetItem(config["stack"]))
+        self.table.setItem(row, 2, QTableWidgetItem(job.status))
+        self.table.setItem(row, 3, QTableWidgetItem(""))
+        btn_cancel = QPushButton("Cancel")
+        btn_cancel.clicked.connect(lambda: self.cancel(job))
+        self.table.setCellWidget(row, 4, btn_cancel)
+        self._schedule()
+        return job
+
+    def cancel(self, job):
+        if job.status == GenerationJob.QUEUED:
+            job.status = GenerationJob.CANCELLED
+        elif job.status == GenerationJob.RUNNING:
+            job.status = GenerationJob.CANCELLING
+            job.worker.cancel()
+        self._update_row(job)
+        self._schedule()
+
+    def cancel_all(self):
+        for job in self.jobs:
+            self.cancel(job)
+
+    def clear_finished(self):
+        for row in reversed(range(len(self.jobs))):
+            job = self.jobs[row]
+            # A finished job's thread may still be unwinding from run(); it goes at the next clear
+            if job.finished and (job.worker is None or job.worker.isFinished()):
+                del self.jobs[row]
+                self.table.removeRow(row)
+
+    def is_busy(self):
+        return any(job.active for job in self.jobs)
+
+    def _schedule(self):
+        running = sum(job.active for job in self.jobs)
+        for job in self.jobs:
+            if running >= self.concurrency:
+                break
+            if job.status == GenerationJob.QUEUED:
+                self._start(job, first=running == 0)
+                running += 1
+
+    def _start(self, job, first=False):
+        if first:
+            self.queue_started.emit()
+            self._timer.start()
+        name = job.config["project_name"]
+        job.worker = ProjectGeneratorWorker(job.config)
+        if self.log_panel:
+            job.worker.phase_started.connect(lambda phase: self.log_panel.on_phase(f"{name}/{phase}"))
+            job.worker.phase_finished.connect(lambda phase, s: self.log_panel.on_phase_finished(f"{name}/{phase}", s))
+            job.worker.output.connect(lambda phase, line: self.log_panel.on_output(f"{name}/{phase}", line))
+        job.worker.finished.connect(lambda success, message: self._on_job_finished(job, success, message))
+        job.status = GenerationJob.RUNNING
+        job.started_at = time.monotonic()
+        self._update_row(job)
+        job.worker.start()
+
+    def _on_job_finished(self, job, success, message):
+        job.finished_at = time.monotonic()
+        job.message = message
+        if job.status == GenerationJob.CANCELLING and not success:
+            job.status = GenerationJob.CANCELLED
+        else:
+            job.status = GenerationJob.DONE if success else GenerationJob.FAILED
+        # job.worker is kept: its thread is still unwinding from run()
+        self._update_row(job)
+        self.job_finished.emit(job.config["project_name"], job.status, message)
+        self._schedule()
+        if not self.is_busy():
+            self._timer.stop()
+            self.queue_drained.emit()
+
+    def _update_row(self, job):
+        row = self.jobs.index(job)
+        status = self.table.item(row, 2)
+        status.setText(job.status)
+        status.setToolTip(job.message)
+        self.table.cellWidget(row, 4).setEnabled(not job.finished and job.status != GenerationJob.CANCELLING)
+        self._update_time(row, job)
+
+    def _update_time(self, row, job):
+        duration = job.duration()
+        if duration is None:
+            text = f"~{job.eta_s:.0f}s" if job.eta_s else ""
+        elif job.active and job.eta_s:
+            text = f"{duration:.0f}s / ~{job.eta_s:.0f}s"
+        else:
+            text = f"{duration:.{0 if job.active else 1}f}s"
+        self.table.item(row, 3).setText(text)
 
-        confirm = QMessageBox.question(self, "Confirm Delete", f"Delete config for '{name}'?", 
-                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-        
-        if confirm == QMessageBox.StandardButton.Yes:
-            self.initializer.delete_stack_config(name)
-            self._populate_list()
-            self._on_add_new()
+    def _refresh_times(self):
+        for row, job in enumerate(self.jobs):
+            if job.active:
+                self._update_time(row, job)
 
 class AlphaInitializerWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, initializer=None):
         super().__init__()
         self.setWindowTitle("ALPHA Initializer")
-        self.setGeometry(100, 100, 600, 500)  # Increased height for Superpower checkbox
+        self.setGeometry(100, 100, 600, 760)  # Room for the job queue
         
-        # Initialize Backend
-        self.initializer = ProjectInitializer()
-        self.worker = None
+        # Initialize Backend (may be pre-loaded during startup)
+        self.initializer = initializer or ProjectInitializer()
+        
+        # Speculative cache warming for the selected stack (opt-in)
+        self._prefetch = None
+        self._stopping_prefetches = []  # Kept alive until their threads end
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(400)  # Don't start one per combo box scroll step
+        self._prefetch_timer.timeout.connect(self._start_prefetch)
 
         # Setup UI
         self._setup_ui()
@@ -233,6 +423,7 @@ class AlphaInitializerWindow(QMainWindow):
         self.combo_ui.addItems(["None", "Tailwind CSS", "Bootstrap", "DaisyUI", "Shadcn"])
         layout.addWidget(self.lbl_ui)
         layout.addWidget(self.combo_ui)
+        self.combo_ui.currentTextChanged.connect(self._schedule_prefetch)
         
         # Initial Visibility
         self.lbl_ui.hide()
@@ -249,21 +440,51 @@ class AlphaInitializerWindow(QMainWindow):
         self.check_superpower.setToolTip("Include .agent folder and initialize git repository")
         layout.addWidget(self.check_superpower)
 
+        # Snapshot Cache
+        self.check_cache = QCheckBox("Reuse cached stack snapshot")
+        self.check_cache.setObjectName("check_cache")
+        self.check_cache.setToolTip("Copy a previously built stack tree instead of re-running the init command")
+        layout.addWidget(self.check_cache)
+
+        # Golden venv (Python stacks)
+        self.check_golden_venv = QCheckBox("Clone shared virtualenv (Python stacks)")
+        self.check_golden_venv.setObjectName("check_golden_venv")
+        self.check_golden_venv.setToolTip("Clone a pre-built venv per requirement set instead of creating and installing one per project")
+        layout.addWidget(self.check_golden_venv)
+
+        # Resume a failed generation
+        self.check_resume = QCheckBox("Resume previous attempt")
+        self.check_resume.setObjectName("check_resume")
+        self.check_resume.setToolTip("Skip the steps a failed generation of this project already finished")
+        layout.addWidget(self.check_resume)
+
+        # Prefetch while the user fills in the rest
+        self.check_prefetch = QCheckBox("Prefetch packages for the selected stack")
+        self.check_prefetch.setObjectName("check_prefetch")
+        self.check_prefetch.setToolTip("Check tools, resolve @latest versions and warm the npm/pip caches in the background")
+        self.check_prefetch.toggled.connect(self._schedule_prefetch)
+        layout.addWidget(self.check_prefetch)
+
         # Spacer
         layout.addStretch()
 
-        # Action Button
+        # Action Button (queues the project; several can run at once)
         self.btn_init = QPushButton("Initialize Project")
         self.btn_init.setObjectName("btn_initialize")
         self.btn_init.setCursor(Qt.CursorShape.PointingHandCursor)
         self.btn_init.clicked.connect(self._start_generation)
         layout.addWidget(self.btn_init)
-        
-        # Progress Bar (Hidden initially)
-        self.progress = QProgressBar()
-        self.progress.setRange(0, 0) # Indeterminate
-        self.progress.hide()
-        layout.addWidget(self.progress)
+
+        # Streamed command output (collapsed by default)
+        self.log_panel = LogPanel()
+
+        # Generation jobs with status, time (vs. the history ETA) and cancel
+        self.job_queue = JobQueuePanel(self.log_panel)
+        self.job_queue.queue_started.connect(self.log_panel.start)
+        self.job_queue.queue_drained.connect(self.log_panel.stop)
+        self.job_queue.job_finished.connect(self._on_finished)
+        layout.addWidget(self.job_queue)
+        layout.addWidget(self.log_panel)
 
     def _apply_styles(self):
         # Dark Mode + Purple Accent
@@ -320,6 +541,18 @@ class AlphaInitializerWindow(QMainWindow):
                 width: 18px;
                 height: 18px;
             }
+            QToolButton {
+                background-color: transparent;
+                color: white;
+                border: none;
+            }
+            QPlainTextEdit {
+                background-color: #141414;
+                color: #CCCCCC;
+                border: 1px solid #3E3E3E;
+                font-family: Consolas, monospace;
+                font-size: 12px;
+            }
         """)
 
     def _populate_stacks(self):
@@ -335,6 +568,8 @@ class AlphaInitializerWindow(QMainWindow):
             self.input_dir.setText(d)
     
     def _open_stack_manager(self):
+        # Only needed when "Manage" is clicked; keep it off the startup path
+        from alpha.stack_editor import StackEditorDialog
         dialog = StackEditorDialog(self, self.initializer)
         dialog.exec()
         # Refresh stacks on close in case changes happened
@@ -350,6 +585,46 @@ class AlphaInitializerWindow(QMainWindow):
             self.lbl_ui.hide()
             self.combo_ui.hide()
             self.combo_ui.setEnabled(False)
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self, *_):
+        if self._prefetch:
+            self._prefetch.stop()
+        if self.check_prefetch.isChecked():
+            self._prefetch_timer.start()
+        else:
+            self._prefetch_timer.stop()
+
+    def _start_prefetch(self):
+        stack = self.combo_stack.currentText()
+        if not stack:
+            return
+        if self._prefetch:
+            self._prefetch.stop()
+            self._stopping_prefetches.append(self._prefetch)
+        ui_fw = self.combo_ui.currentText() if self.combo_ui.isEnabled() else None
+        worker = PrefetchWorker(self.initializer, stack, ui_fw, self.check_golden_venv.isChecked())
+        worker.done.connect(self._on_prefetch_done)
+        worker.finished.connect(lambda: self._on_prefetch_ended(worker))
+        self._prefetch = worker
+        worker.start()
+
+    def _on_prefetch_ended(self, worker):
+        if worker in self._stopping_prefetches:
+            self._stopping_prefetches.remove(worker)
+        if worker is self._prefetch:
+            self._prefetch = None
+
+    def _on_prefetch_done(self, report):
+        if report["stopped"] or report["stack"] != self.combo_stack.currentText():
+            return
+        if report["missing_tools"]:
+            self.statusBar().showMessage(f"{report['stack']}: not found on PATH: {', '.join(report['missing_tools'])}")
+        elif report["errors"]:
+            self.statusBar().showMessage(f"{report['stack']}: prefetch incomplete ({report['errors'][0]})", 10000)
+        else:
+            resolved = ", ".join(f"{name} {version}" for name, version in report["resolved"].items())
+            self.statusBar().showMessage(f"{report['stack']} ready" + (f": {resolved}" if resolved else ""), 10000)
 
     def _start_generation(self):
         name = self.input_name.text().strip()
@@ -362,6 +637,9 @@ class AlphaInitializerWindow(QMainWindow):
         stack = self.combo_stack.currentText()
         use_docker = self.check_docker.isChecked()
         use_superpower = self.check_superpower.isChecked()
+        use_cache = self.check_cache.isChecked()
+        use_golden_venv = self.check_golden_venv.isChecked()
+        resume = self.check_resume.isChecked()
         ui_fw = self.combo_ui.currentText() if self.combo_ui.isEnabled() else None
         
         config = {
@@ -370,23 +648,37 @@ class AlphaInitializerWindow(QMainWindow):
             "stack": stack,
             "use_docker": use_docker,
             "use_superpower": use_superpower,
+            "use_cache": use_cache,
+            "use_golden_venv": use_golden_venv,
+            "resume": resume,
             "ui_framework": ui_fw
         }
 
-        # UI State: Busy
-        self.btn_init.setEnabled(False)
-        self.progress.show()
-        
-        # Threading
-        self.worker = ProjectGeneratorWorker(config)
-        self.worker.finished.connect(self._on_finished)
-        self.worker.start()
-
-    def _on_finished(self, success, message):
-        self.btn_init.setEnabled(True)
-        self.progress.hide()
-        
-        if success:
-            QMessageBox.information(self, "Success", message)
+        self.job_queue.enqueue(config, self.initializer.estimate_duration(config))
+
+    def _on_finished(self, project_name, status, message):
+        if status == GenerationJob.DONE:
+            self.statusBar().showMessage(message, 10000)
+        elif status == GenerationJob.CANCELLED:
+            # The user asked for it: not an error
+            self.statusBar().showMessage(f"Generation of '{project_name}' cancelled", 10000)
         else:
-            QMessageBox.critical(self, "Error", f"Generation Failed:\n{message}")
+            QMessageBox.critical(self, "Error", f"Generation of '{project_name}' Failed:\n{message}")
+
+    def closeEvent(self, event):
+        if self.job_queue.is_busy():
+            answer = QMessageBox.question(self, "Generation Running",
+                                          "Projects are still being generated. Cancel them and quit?")
+            if answer != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+            self.job_queue.cancel_all()
+            for job in self.job_queue.jobs:
+                if job.worker:
+                    job.worker.wait()
+        self._prefetch_timer.stop()
+        for worker in [self._prefetch, *self._stopping_prefetches]:
+            if worker:
+                worker.stop()
+                worker.wait()
+        event.accept()
@@ -0,0 +1,205 @@
+"""Per-step timing and resource history, stored in a local SQLite database.
+
+Every generation step is probed for wall time, child CPU time (from
+RUSAGE_CHILDREN), bytes written and the commands it ran. The history feeds
+the GUI's ETA and the ``alpha stats`` report.
+
+Steps of the same stage run concurrently and getrusage() is process wide, so
+CPU time and bytes written of overlapping steps are attributed approximately.
+
+A step that can be served from a cache (the snapshot cache, a golden venv)
+takes seconds on a hit and minutes on a miss, so each sample is stored with
+its cache outcome and estimates only use samples with the expected outcome.
+"""
+import logging
+import math
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from alpha.utils import get_data_dir
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS step_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    stack TEXT NOT NULL,
+    step TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    wall_s REAL NOT NULL,
+    child_cpu_s REAL,
+    bytes_written INTEGER,
+    command TEXT,
+    success INTEGER NOT NULL,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_step_runs_stack_step ON step_runs (stack, step);
+"""
+
+# Outcome of a step that involved no cache
+COLD = "cold"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _usage():
+    """(child CPU seconds, bytes written by us and our children) or (None, None)."""
+    if resource is None:
+        return None, None
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_oublock is reported in 512-byte units on Linux
+    return children.ru_utime + children.ru_stime, (children.ru_oublock + own.ru_oublock) * 512
+
+
+class HistoryStore:
+    """SQLite-backed step history (``<data dir>/history.sqlite3``)."""
+
+    def __init__(self, path=None):
+        self.path = path or get_data_dir() / "history.sqlite3"
+        with closing(self._connect()) as db, db:
+            db.executescript(SCHEMA)
+            columns = [row[1] for row in db.execute("PRAGMA table_info(step_runs)")]
+            if "outcome" not in columns:
+                # Older databases; their samples have no known outcome and aren't used for estimates
+                db.execute("ALTER TABLE step_runs ADD COLUMN outcome TEXT")
+
+    def _connect(self):
+        # `with connection` only commits; callers wrap it in closing() as well
+        return sqlite3.connect(str(self.path), timeout=10)
+
+    def record(self, run_id, stack, step, started_at, wall_s, child_cpu_s, bytes_written, command, success,
+               outcome=COLD):
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "INSERT INTO step_runs (run_id, stack, step, started_at, wall_s, child_cpu_s,"
+                " bytes_written, command, success, outcome) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, stack, step, started_at, wall_s, child_cpu_s, bytes_written, command, int(success), outcome),
+            )
+
+    def durations(self, stack, step, outcome=COLD, limit=50):
+        """Wall times of the most recent successful runs of a step with the given cache outcome."""
+        with closing(self._connect()) as db:
+            rows = db.execute(
+                "SELECT wall_s FROM step_runs WHERE stack = ? AND step = ? AND outcome = ? AND success = 1"
+                " ORDER BY started_at DESC LIMIT ?",
+                (stack, step, outcome, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def estimate(self, stack, stages, outcomes=None):
+        """Expected seconds for a plan: each stage costs its slowest step's p50.
+
+        `outcomes` maps steps to their expected cache outcome (default COLD).
+        Returns None when there is no history for any of the steps.
+        """
+        outcomes = outcomes or {}
+        total = 0.0
+        known = False
+        for stage in stages:
+            medians = [percentile(self.durations(stack, step, outcomes.get(step, COLD)), 50) for step in stage]
+            medians = [m for m in medians if m is not None]
+            if medians:
+                known = True
+                total += max(medians)
+        return total if known else None
+
+    def stats(self, stack=None):
+        """Per stack/step/outcome run count and p50/p95 of wall time, child CPU and bytes written."""
+        query = "SELECT stack, step, outcome, wall_s, child_cpu_s, bytes_written FROM step_runs WHERE success = 1"
+        params = ()
+        if stack:
+            query += " AND stack = ?"
+            params = (stack,)
+        with closing(self._connect()) as db:
+            rows = db.execute(query, params).fetchall()
+
+        grouped = {}
+        for row_stack, step, outcome, wall_s, cpu_s, written in rows:
+            grouped.setdefault((row_stack, step, outcome), []).append((wall_s, cpu_s, written))
+
+        report = []
+        # Samples recorded before outcomes were tracked have none
+        for (row_stack, step, outcome), samples in sorted(grouped.items(), key=lambda item: str(item[0])):
+            walls = [s[0] for s in samples]
+            cpus = [s[1] for s in samples if s[1] is not None]
+            written = [s[2] for s in samples if s[2] is not None]
+            report.append({
+                "stack": row_stack,
+                "step": step,
+                "outcome": outcome,
+                "runs": len(samples),
+                "wall_p50": percentile(walls, 50),
+                "wall_p95": percentile(walls, 95),
+                "cpu_p50": percentile(cpus, 50),
+                "bytes_p50": percentile(written, 50),
+            })
+        return report
+
+
+def join_outcomes(outcomes):
+    """One outcome string for all caches a step used, e.g. "snapshot-hit+venv-miss"."""
+    return "+".join(sorted(outcomes)) or COLD
+
+
+class StepRecorder:
+    """Wraps the steps of one generation to probe and record them."""
+
+    def __init__(self, stack, store=None):
+        self.stack = stack
+        self.store = store
+        self.run_id = uuid.uuid4().hex
+        self._commands = {}
+        self._outcomes = {}
+        self._lock = threading.Lock()
+
+    def add_command(self, step, cmd):
+        with self._lock:
+            self._commands.setdefault(step, []).append(cmd)
+
+    def add_outcome(self, step, outcome):
+        """Note a cache hit or miss (e.g. "snapshot-hit") of a step."""
+        with self._lock:
+            self._outcomes.setdefault(step, set()).add(outcome)
+
+    def outcome(self, step):
+        return join_outcomes(self._outcomes.get(step, ()))
+
+    def wrap(self, step, func):
+        def probed():
+            started_at = time.time()
+            start = time.perf_counter()
+            cpu_before, written_before = _usage()
+            success = False
+            try:
+                func()
+                success = True
+            finally:
+                wall_s = time.perf_counter() - start
+                cpu_after, written_after = _usage()
+                child_cpu_s = cpu_after - cpu_before if cpu_before is not None else None
+                bytes_written = written_after - written_before if written_before is not None else None
+                command = " ; ".join(self._commands.get(step, [])) or None
+                self._save(step, started_at, wall_s, child_cpu_s, bytes_written, command, success, self.outcome(step))
+        return probed
+
+    def _save(self, *args):
+        try:
+            if self.store is None:
+                self.store = HistoryStore()
+            self.store.record(self.run_id, self.stack, *args)
+        except sqlite3.Error as e:
+            logging.warning(f"Could not record step history: {e}")
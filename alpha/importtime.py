@@ -0,0 +1,127 @@
+"""Import-time report built from ``python -X importtime``.
+
+Each module is imported in a fresh interpreter and the ``-X importtime``
+trace is parsed into a summary: total time, the slowest imports, and whether
+modules that should be loaded lazily were pulled in. Budgets are tracked in
+``import_budget.json`` at the repo root and enforced by the test suite.
+"""
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+BUDGET_FILE = REPO_ROOT / "import_budget.json"
+
+# "import time:       315 |      62755 |   alpha.cli"
+LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(stderr):
+    """Parse a -X importtime trace into (name, self_us, cumulative_us, depth) tuples."""
+    entries = []
+    for line in stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def own_imports(entries):
+    """Keep only the last top-level import and what it pulled in.
+
+    The trace also lists interpreter startup (site, encodings, .pth hooks),
+    which is not the module's cost. Children are printed before their parent,
+    so the module's subtree is the run of nested entries right before it.
+    """
+    own = [entries[-1]]
+    for entry in reversed(entries[:-1]):
+        if entry[3] == 0:
+            break
+        own.insert(0, entry)
+    return own
+
+
+def measure(module, repeat=3, python=sys.executable):
+    """Import a module in fresh interpreters; returns the fastest run's entries."""
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [python, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+        entries = own_imports(parse_importtime(result.stderr))
+        total = entries[-1][2]
+        if best is None or total < best[0]:
+            best = (total, entries)
+    return best[1]
+
+
+def summarize(module, entries, top=10):
+    total_us = entries[-1][2]
+    slowest = sorted(entries, key=lambda e: e[2], reverse=True)
+    return {
+        "module": module,
+        "total_ms": round(total_us / 1000, 1),
+        "modules": len(entries),
+        "loaded": sorted(e[0] for e in entries),
+        "slowest": [
+            {"name": name, "self_ms": round(s / 1000, 1), "cumulative_ms": round(c / 1000, 1)}
+            for name, s, c, depth in slowest[:top]
+        ],
+    }
+
+
+def load_budgets(path=BUDGET_FILE):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def check(summary, budget):
+    """Returns a list of budget violations (empty if within budget)."""
+    problems = []
+    if summary["total_ms"] > budget["budget_ms"]:
+        problems.append(f"{summary['module']}: import took {summary['total_ms']}ms (budget {budget['budget_ms']}ms)")
+    loaded = set(summary["loaded"])
+    for name in budget.get("lazy", []):
+        if name in loaded:
+            problems.append(f"{summary['module']}: imports {name} eagerly (should be lazy)")
+    return problems
+
+
+def format_summary(summary):
+    lines = [f"{summary['module']}: {summary['total_ms']}ms, {summary['modules']} modules"]
+    for item in summary["slowest"]:
+        lines.append(f"  {item['cumulative_ms']:>8.1f}ms cumulative {item['self_ms']:>7.1f}ms self  {item['name']}")
+    return "\n".join(lines)
+
+
+def run_report(modules=None, top=10, output=None, budget_path=BUDGET_FILE, scale=1.0):
+    """Measure modules (default: all in the budget file) and print the report.
+
+    Returns 1 if any budget is exceeded. `scale` loosens time budgets on slow
+    machines; lazy-import checks are never scaled.
+    """
+    budgets = load_budgets(budget_path)
+    modules = modules or list(budgets)
+    summaries = []
+    problems = []
+    for module in modules:
+        summary = summarize(module, measure(module), top=top)
+        summaries.append(summary)
+        print(format_summary(summary))
+        if module in budgets:
+            budget = dict(budgets[module], budget_ms=budgets[module]["budget_ms"] * scale)
+            problems += check(summary, budget)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(summaries, f, indent=2)
+
+    for problem in problems:
+        print(f"OVER BUDGET: {problem}")
+    return 1 if problems else 0
@@ -1,18 +1,64 @@
 import os
+import re
+import shlex
 import shutil
-import yaml
 import subprocess
 import sys
 import json
+import threading
+import time
 import logging
 from pathlib import Path
 from alpha.utils import get_resource_path
+from alpha.snapshots import SnapshotCache, SNAPSHOT_NAME, make_key, tool_versions
+from alpha.venvs import GoldenVenvStore, BIN_DIR, PYTHON_EXE
+from alpha import agentbundle, commands, gitbootstrap, templating, processes, toolchain
+from alpha.copyengine import copy_tree
+from alpha.blobstore import TemplateStore
+from alpha.pipeline import StepGraph
+from alpha.history import HistoryStore, StepRecorder, join_outcomes
+from alpha.journal import StepJournal, step_hash
+from alpha.artifacts import ArtifactCache
+
+# Segments of Python stack init commands replaced by a golden venv clone
+VENV_CREATE_RE = re.compile(r"^python3? -m venv venv$")
+VENV_PIP_RE = re.compile(r"^venv[/\\](Scripts|bin)[/\\](pip|python -m pip) install\b")
+
+# Named generation phases reported through on_phase/on_output
+PHASE_INIT = "init"
+PHASE_HOOK = "post-install hook"
+PHASE_SUPERPOWER = "superpower"
+PHASE_DOCKER = "docker"
+
+class GenerationCancelled(RuntimeError):
+    pass
+
+class GenerationTimeout(GenerationCancelled):
+    pass
 
 class ProjectInitializer:
     def __init__(self, templates_dir="templates"):
         self.templates_dir = Path(templates_dir)
         self.commands_config = {}
         
+        # Optional progress callbacks: on_phase(phase) when a phase starts,
+        # on_phase_finished(phase, duration_s) when it ends and
+        # on_output(phase, line) for every line a command prints.
+        # When on_output is set, command output is streamed instead of inherited.
+        # Independent phases run concurrently, so callbacks may come from any thread.
+        self.on_phase = None
+        self.on_phase_finished = None
+        self.on_output = None
+        # check(tools, what) raising MissingToolError; replaceable where tools are faked
+        self.toolchain_check = toolchain.check
+        self._recorder = None
+        self._journal = None
+        # Set by cancel() (from any thread); checked between steps
+        self._cancelled = threading.Event()
+        self._step_timeout = None
+        self._deadline = None
+        self._artifacts = None
+        
         # Load commands.json
         cmd_path = Path(__file__).parent / "commands.json"
         if cmd_path.exists():
@@ -29,72 +75,381 @@ class ProjectInitializer:
             for item in self.templates_dir.iterdir():
                 if item.is_dir() and not item.name.startswith((".", "__")):
                     defaults.append(item.name)
+        
+        # Templates imported into the template store (minus those whose folder was
+        # deleted; `templates gc` removes them)
+        store = TemplateStore()
+        orphaned = store.orphaned(self.templates_dir)
+        defaults += [name for name in store.names() if name not in orphaned]
                     
         return sorted(list(set(defaults)))
 
     def generate_project(self, config):
         """Generates the project structure using CLI commands."""
-        raw_name = config.get("project_name")
+        plan = self.build_plan(config)
+        
+        # Probe every step into the local timing history
+        self._recorder = StepRecorder(config.get("stack"))
+        for step in plan.steps.values():
+            step.func = self._recorder.wrap(step.name, step.func)
+        
+        # Journal finished steps; with "resume", skip those finished last time
+        project_root = Path(config.get("target_dir")) / self._project_name(config)
+        created = not project_root.exists()
+        self._journal = StepJournal(project_root, resume=config.get("resume", False))
+        inputs = self._journal_inputs(config)
+        deps = plan.dependencies()
+        for step in plan.steps.values():
+            step.func = self._resumable(step.name, step.func, step_hash(step.name, inputs), deps[step.name])
+        
+        stack_cmd = self.commands_config.get("stacks", {}).get(config.get("stack"))
+        if stack_cmd:
+            # Fail now rather than minutes into an install
+            self.toolchain_check(toolchain.required_tools(stack_cmd), f"Stack '{config.get('stack')}'")
+        self._step_timeout, total_timeout = commands.timeouts(stack_cmd)
+        self._deadline = time.monotonic() + total_timeout if total_timeout else None
+        # pip and npm run against the local wheelhouse / npm cache
+        self._artifacts = ArtifactCache(offline=config.get("offline"))
+        
+        try:
+            plan.run(on_start=self._start_phase, on_finish=self._finish_phase)
+            # Nothing left to resume
+            self._journal.discard()
+            if self._artifacts.npm_revalidating and stack_cmd and "npm" in toolchain.required_tools(stack_cmd):
+                # npm fetched current metadata; prefer the cache again for a while
+                self._artifacts.mark_npm_fresh()
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Command failed: {e}")
+        except GenerationCancelled:
+            # A plain failure keeps its output for --resume; a cancelled or
+            # timed out project is usually unwanted, so don't leave half of it
+            if created and project_root.exists():
+                logging.info(f"Removing partially created {project_root}")
+                shutil.rmtree(project_root, ignore_errors=True)
+            raise
+        finally:
+            self._recorder = None
+            self._journal = None
+            self._deadline = None
+            self._artifacts = None
+
+    def cancel(self):
+        """Stop generating, killing a running command; generate_project raises GenerationCancelled."""
+        self._cancelled.set()
+
+    def _check_cancelled(self):
+        if self._cancelled.is_set():
+            raise GenerationCancelled("Generation cancelled")
+        if self._deadline and time.monotonic() >= self._deadline:
+            raise GenerationTimeout("Generation timed out")
+
+    def _artifact_cache(self):
+        return self._artifacts or ArtifactCache()
+
+    def _command_timeout(self, timeout=None):
+        """Seconds a command may run: its own (or the stack's) timeout, capped by the total deadline."""
+        timeout = timeout or self._step_timeout
+        if self._deadline:
+            remaining = max(0.0, self._deadline - time.monotonic())
+            timeout = min(timeout, remaining) if timeout else remaining
+        return timeout
+
+    def _journal_inputs(self, config):
+        """What a finished step depends on: changing any of it re-runs the step."""
         stack = config.get("stack")
+        return {
+            "stack": stack,
+            "project_name": self._project_name(config),
+            "ui_framework": config.get("ui_framework"),
+            "stack_config": self.commands_config.get("stacks", {}).get(stack),
+        }
+
+    def _resumable(self, name, func, digest, after):
+        journal = self._journal
+
+        def run():
+            self._check_cancelled()
+            if journal.begin(name, digest, after):
+                logging.info(f"Resuming: skipping finished step '{name}'")
+                return
+            func()
+            journal.record(name, digest)
+        return run
+
+    def _journal_for(self, project_root):
+        """The journal if project_root is the project being generated (not a snapshot staging dir)."""
+        if self._journal and self._journal.project_root == Path(project_root):
+            return self._journal
+        return None
+
+    def estimate_duration(self, config):
+        """Expected generation time in seconds from past runs, or None."""
+        try:
+            outcomes = {PHASE_INIT: self._expected_init_outcome(config)}
+            return HistoryStore().estimate(config.get("stack"), self.build_plan(config).stages(), outcomes)
+        except Exception as e:
+            # An estimate is never worth failing a generation for
+            logging.warning(f"Could not estimate duration: {e}")
+            return None
+
+    def _expected_init_outcome(self, config):
+        """The cache outcome the init step would record if the config ran now."""
+        stack_cmd = self.commands_config.get("stacks", {}).get(config.get("stack"))
+        if not stack_cmd:
+            return join_outcomes(())
+        requirements = commands.venv_requirements(stack_cmd)
+        golden_venv = config.get("use_golden_venv", False) and requirements is not None
+        outcomes = []
+        if config.get("use_cache", False) and self._is_snapshot_cacheable(stack_cmd, golden_venv):
+            init_command = commands.command_text(stack_cmd)
+            key = make_key(config.get("stack"), init_command, config.get("ui_framework"), tool_versions(init_command))
+            outcomes.append("snapshot-hit" if SnapshotCache().has(key) else "snapshot-miss")
+        if golden_venv:
+            outcomes.append("venv-hit" if GoldenVenvStore().has(requirements) else "venv-miss")
+        return join_outcomes(outcomes)
+
+    def _clone_golden_venv(self, requirements, destination):
+        hit = GoldenVenvStore().clone(requirements, destination)
+        if self._recorder:
+            self._recorder.add_outcome(PHASE_INIT, "venv-hit" if hit else "venv-miss")
+
+    def build_plan(self, config):
+        """Builds the dependency graph of generation steps for a config.
         
-        # Stack-Specific Sanitization
-        if stack in ["django", "fastapi"]:
-            # Python: snake_case (no hyphens)
-            project_name = raw_name.lower().replace(" ", "_").replace("-", "_")
-        else:
-            # JS/npm: kebab-case (no underscores conventions, but hyphens allowed)
-            # Actually weak kebab: replace spaces with hyphens, lower.
-            project_name = raw_name.lower().replace(" ", "-").replace("_", "-")
+        Docker files and the superpower framework only need the project root
+        to exist, so they run alongside the (slow) post-install hooks.
+        """
+        stack = config.get("stack")
+        project_name = self._project_name(config)
         
         target_dir = Path(config.get("target_dir"))
         use_docker = config.get("use_docker", False)
+        use_superpower = config.get("use_superpower", False)
         ui_framework = config.get("ui_framework")
 
-        target_dir.mkdir(parents=True, exist_ok=True)
+        # Check if stack is in commands.json
+        stack_cmd = self.commands_config.get("stacks", {}).get(stack)
+        project_root = target_dir / project_name
         
-        try:
-            # Check if stack is in commands.json
-            stack_cmd = self.commands_config.get("stacks", {}).get(stack)
+        golden_venv = bool(stack_cmd) and config.get("use_golden_venv", False) and commands.venv_requirements(stack_cmd) is not None
+        from_snapshot = bool(stack_cmd) and config.get("use_cache", False) and self._is_snapshot_cacheable(stack_cmd, golden_venv)
+        
+        def init():
+            target_dir.mkdir(parents=True, exist_ok=True)
+            if not stack_cmd:
+                self._copy_stack_template(stack, project_root)
+            elif from_snapshot:
+                # Snapshots already include the post-install hooks
+                self._init_from_snapshot(stack, stack_cmd, ui_framework, project_name, project_root, golden_venv)
+            else:
+                self._init_stack(stack_cmd, project_name, target_dir, golden_venv)
+        
+        plan = StepGraph(f"{project_name} ({stack})")
+        plan.add(PHASE_INIT, init, inputs=["config"], outputs=["project_root"])
+        
+        if stack_cmd and not from_snapshot and self._has_post_install_hooks(stack, ui_framework):
+            plan.add(PHASE_HOOK, lambda: self._run_post_install_hooks(stack, ui_framework, project_root),
+                     inputs=["project_root"], outputs=["ui_framework"])
+        
+        # Superpower Framework
+        if use_superpower:
+            plan.add(PHASE_SUPERPOWER, lambda: self._apply_superpower_framework(project_root),
+                     inputs=["project_root"], outputs=[".agent", ".git"])
+        
+        # Docker is injected AFTER project creation
+        if use_docker:
+            plan.add(PHASE_DOCKER, lambda: self._generate_docker_files(stack, project_root, ui_framework),
+                     inputs=["project_root"], outputs=["Dockerfile", "docker-compose.yml"])
+        
+        return plan
+
+    def _project_name(self, config):
+        raw_name = config.get("project_name")
+        
+        # Stack-Specific Sanitization
+        if config.get("stack") in ["django", "fastapi"]:
+            # Python: snake_case (no hyphens)
+            return raw_name.lower().replace(" ", "_").replace("-", "_")
+        # JS/npm: kebab-case (no underscores conventions, but hyphens allowed)
+        # Actually weak kebab: replace spaces with hyphens, lower.
+        return raw_name.lower().replace(" ", "-").replace("_", "-")
+
+    def _init_stack(self, stack_cmd, project_name, target_dir, golden_venv=False):
+        """Runs the stack's init steps (or legacy init_command)."""
+        if "steps" in stack_cmd:
+            self._run_steps(stack_cmd["steps"], project_name, target_dir, golden_venv)
+            return
+        
+        project_root = target_dir / project_name
+        cmd = stack_cmd["init_command"].format(name=project_name)
+        
+        split = self._split_venv_command(cmd) if golden_venv else None
+        if split:
+            # Clone the golden venv in place of `python -m venv` + pip installs
+            before, after = split
+            if before:
+                self._run_command(before, target_dir)
+            project_root.mkdir(parents=True, exist_ok=True)
+            self._clone_golden_venv(stack_cmd["venv_requirements"], project_root / "venv")
+            if after:
+                self._run_command(after, project_root)
+        else:
+            self._run_command(cmd, target_dir)
+
+    def _run_steps(self, steps, project_name, target_dir, golden_venv=False):
+        """Runs structured init steps (see alpha/commands.py).
+        
+        Built-in ops run in-process; only `run` and `venv` steps spawn tools.
+        With golden_venv, a venv step is replaced by a clone of the golden venv.
+        Finished steps are journaled one by one, so a resume skips them.
+        """
+        commands.validate(steps)
+        cwd = Path(target_dir)
+        variables = {"name": project_name}
+        journal = self._journal_for(cwd / project_name)
+        
+        for i, step in enumerate(steps):
+            self._check_cancelled()
+            op = commands.op_name(step)
+            digest = step_hash(step, variables)
+            if op != "chdir" and journal and journal.begin_substep(PHASE_INIT, str(i), digest):
+                logging.info(f"Resuming: skipping finished init step {i + 1} ({op})")
+                if op == "venv":
+                    venv_dir = (cwd / commands.expand(step["venv"], variables)).absolute()
+                    variables["venv_python"] = str(venv_dir / BIN_DIR / PYTHON_EXE)
+                continue
             
-            project_root = target_dir / project_name
+            if op == "mkdir":
+                (cwd / commands.expand(step["mkdir"], variables)).mkdir(parents=True, exist_ok=True)
+            elif op == "chdir":
+                cwd = cwd / commands.expand(step["chdir"], variables)
+            elif op == "write":
+                path = cwd / commands.expand(step["write"], variables)
+                if "template" in step:
+                    templating.render_files([(templating.get_template(step["template"]), variables, path)])
+                else:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(commands.expand(step["content"], variables), encoding="utf-8")
+            elif op == "venv":
+                venv_dir = (cwd / commands.expand(step["venv"], variables)).absolute()
+                requirements = step.get("requirements", [])
+                venv_python = venv_dir / BIN_DIR / PYTHON_EXE
+                if golden_venv:
+                    self._clone_golden_venv(requirements, venv_dir)
+                else:
+                    self._run_command([GoldenVenvStore().python, "-m", "venv", str(venv_dir)], cwd)
+                    self._artifact_cache().pip_install(str(venv_python), requirements,
+                                                       lambda argv: self._run_command(argv, cwd))
+                variables["venv_python"] = str(venv_python)
+            else:
+                # A step's own timeout_s overrides the stack's step timeout
+                options = {"timeout": step["timeout_s"]} if step.get("timeout_s") else {}
+                self._run_command([commands.expand(arg, variables) for arg in step["run"]], cwd, **options)
             
-            if stack_cmd:
-                cmd = stack_cmd["init_command"].format(name=project_name)
-                self._run_command(cmd, target_dir)
-                
-                # Post-Install Hooks (UI Frameworks)
-                if ui_framework and ui_framework.lower() == "shadcn":
-                    if stack == "nextjs":
-                        self._apply_nextjs_shadcn(project_root)
-                    elif stack in ["react", "vue"]:
-                        # Vite based
-                        self._apply_vite_shadcn(project_root)
+            if op != "chdir" and journal:
+                journal.record(str(i), digest, step=PHASE_INIT)
 
-            else:
-                 self._copy_stack_template(stack, project_root)
+    def _has_post_install_hooks(self, stack, ui_framework):
+        return bool(ui_framework) and ui_framework.lower() == "shadcn" and stack in ["nextjs", "react", "vue"]
+
+    def post_install_packages(self, stack, ui_framework):
+        """npm packages the post-install hooks will fetch (for cache warming)."""
+        if not self._has_post_install_hooks(stack, ui_framework):
+            return []
+        if stack == "nextjs":
+            return ["shadcn@latest"]
+        return ["tailwindcss", "@tailwindcss/vite", "shadcn@latest"]
 
-            # Superpower Framework (before Docker)
-            use_superpower = config.get("use_superpower", False)
-            if use_superpower:
-                self._apply_superpower_framework(project_root)
+    def _run_post_install_hooks(self, stack, ui_framework, project_root):
+        """Post-Install Hooks (UI Frameworks)."""
+        if not self._has_post_install_hooks(stack, ui_framework):
+            return
+        if stack == "nextjs":
+            self._apply_nextjs_shadcn(project_root)
+        else:
+            # Vite based
+            self._apply_vite_shadcn(project_root)
 
-            # Docker is injected AFTER project creation
-            if use_docker:
-                self._generate_docker_files(stack, project_root, ui_framework)
+    def _split_venv_command(self, cmd):
+        """Splits an && chain around its venv build.
+        
+        Returns (before, after) where `after` no longer contains the pip
+        installs into the venv, or None if the chain doesn't build a venv.
+        The venv is assumed to be created in the project root, which is
+        what every bundled Python stack does.
+        """
+        parts = [part.strip() for part in cmd.split("&&")]
+        venv_idx = next((i for i, part in enumerate(parts) if VENV_CREATE_RE.match(part)), None)
+        if venv_idx is None:
+            return None
+        
+        after = [part for part in parts[venv_idx + 1:] if not VENV_PIP_RE.match(part)]
+        return " && ".join(parts[:venv_idx]), " && ".join(after)
 
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Command failed: {e}")
+    def _is_snapshot_cacheable(self, stack_cmd, golden_venv=False):
+        """Stacks that build a venv can't be snapshotted (venvs hold absolute paths)
+        unless the venv is cloned from a golden one after materializing."""
+        return golden_venv or not commands.uses_venv(stack_cmd)
+
+    def _init_from_snapshot(self, stack, stack_cmd, ui_framework, project_name, project_root, golden_venv=False):
+        """Materializes a cached stack tree, building and storing it on a miss."""
+        cache = SnapshotCache()
+        init_command = commands.command_text(stack_cmd)
+        key = make_key(stack, init_command, ui_framework, tool_versions(init_command))
+        
+        meta = cache.get(key)
+        if self._recorder:
+            self._recorder.add_outcome(PHASE_INIT, "snapshot-miss" if meta is None else "snapshot-hit")
+        if meta is None:
+            logging.info(f"Snapshot miss for {stack}, building {key}")
+            staging = cache.staging_dir()
+            try:
+                self._init_stack(stack_cmd, SNAPSHOT_NAME, staging, golden_venv)
+                self._run_post_install_hooks(stack, ui_framework, staging / SNAPSHOT_NAME)
+                meta = {"stack": stack, "init_command": init_command, "ui_framework": ui_framework}
+                cache.store(key, staging / SNAPSHOT_NAME, meta)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+            meta = cache.get(key)
+            if meta is None:
+                # Snapshot didn't fit in the cache; fall back to a plain init
+                self._init_stack(stack_cmd, project_name, project_root.parent, golden_venv)
+                self._run_post_install_hooks(stack, ui_framework, project_root)
+                return
+        else:
+            logging.info(f"Snapshot hit for {stack} ({key})")
+        
+        cache.materialize(key, project_root, project_name)
+        
+        if golden_venv and "venv" in meta.get("excluded", []):
+            self._clone_golden_venv(commands.venv_requirements(stack_cmd), project_root / "venv")
+        
+        # .git is never cached; recreate it for stacks whose init made one
+        if ".git" in meta.get("excluded", []):
+            try:
+                subprocess.run(["git", "init"], cwd=project_root, check=True, capture_output=True)
+                subprocess.run(["git", "add", "-A"], cwd=project_root, check=True, capture_output=True)
+                subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=project_root, check=True, capture_output=True)
+            except (OSError, subprocess.CalledProcessError) as e:
+                logging.warning(f"Could not recreate git repository from snapshot: {e}")
 
     def _apply_nextjs_shadcn(self, project_path):
         """Runs npx shadcn init for Next.js."""
         # Standard init with defaults
         cmd = "npx -y shadcn@latest init -d"
-        self._run_command(cmd, project_path)
+        self._run_command(cmd, project_path, PHASE_HOOK)
 
     def _apply_vite_shadcn(self, project_path):
         """Complex setup for Vite + Shadcn."""
-        # 1. Install Tailwind & Plugin
-        self._run_command("npm install tailwindcss @tailwindcss/vite", project_path)
+        # 1. Install Tailwind & Plugin (the slow part: journaled so a resume skips it)
+        install = "npm install tailwindcss @tailwindcss/vite"
+        journal = self._journal_for(project_path)
+        if journal and journal.begin_substep(PHASE_HOOK, "tailwind", step_hash(install)):
+            logging.info("Resuming: Tailwind already installed")
+        else:
+            self._run_command(install, project_path, PHASE_HOOK)
+            if journal:
+                journal.record("tailwind", step_hash(install), step=PHASE_HOOK)
         
         # 2. Update src/index.css
         index_css = project_path / "src" / "index.css"
@@ -145,7 +500,8 @@ class ProjectInitializer:
             vite_config.write_text(content)
 
         # 6. Run Init
-        self._run_command("npx -y shadcn@latest init -d", project_path)
+        self._check_cancelled()
+        self._run_command("npx -y shadcn@latest init -d", project_path, PHASE_HOOK)
 
     def _update_json_config(self, file_path, updates):
         """Helper to recursively update a JSON file."""
@@ -214,24 +570,86 @@ class ProjectInitializer:
             # Refresh memory
             self.commands_config = current_data
 
-    def _run_command(self, cmd, cwd):
-        """Helper to run shell commands."""
-        # Shell=True usually needed for complex commands or Windows
+    def _start_phase(self, phase):
+        if self.on_phase:
+            self.on_phase(phase)
+
+    def _finish_phase(self, phase, duration_s):
+        if self.on_phase_finished:
+            self.on_phase_finished(phase, duration_s)
+
+    def _run_command(self, cmd, cwd, phase=PHASE_INIT, timeout=None):
+        """Runs an argv list directly, or a (legacy) shell command string.
+        
+        The command is killed after `timeout` (default: the stack's step
+        timeout) or when the total deadline passes. Commands run in their own
+        process group, which is killed as a whole on timeout or cancel().
+        """
+        shell = isinstance(cmd, str)
+        if shell:
+            # CROSS-PLATFORM FIX (legacy shell commands only):
+            # If running on Linux/Mac, replace Windows venv paths
+            if os.name != 'nt':
+                cmd = cmd.replace("venv/Scripts/", "venv/bin/")
+                cmd = cmd.replace("venv\\Scripts\\", "venv/bin/")
+                cmd = cmd.replace("venv/Scripts", "venv/bin") # Just in case
+            display = cmd
+        else:
+            # npm/npx are .cmd scripts on Windows, which need their full path without a shell
+            cmd = [shutil.which(cmd[0]) or cmd[0]] + list(cmd[1:])
+            display = subprocess.list2cmdline(cmd) if os.name == 'nt' else shlex.join(cmd)
         
-        # CROSS-PLATFORM FIX:
-        # If running on Linux/Mac, replace Windows venv paths
-        if os.name != 'nt':
-            cmd = cmd.replace("venv/Scripts/", "venv/bin/")
-            cmd = cmd.replace("venv\\Scripts\\", "venv/bin/")
-            cmd = cmd.replace("venv/Scripts", "venv/bin") # Just in case
+        if self._recorder:
+            self._recorder.add_command(phase, display)
+        
+        self._check_cancelled()
+        timeout = self._command_timeout(timeout)
+        env = self._artifact_cache().env()
             
-        subprocess.run(cmd, cwd=cwd, shell=True, check=True)
+        if self.on_output is None:
+            # Headless: output goes straight to the terminal
+            output = {}
+        else:
+            # Stream merged stdout/stderr line by line to the listener
+            output = dict(stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                          text=True, encoding="utf-8", errors="replace", bufsize=1)
+        proc = subprocess.Popen(cmd, cwd=cwd, shell=shell, env=env, **output, **processes.NEW_GROUP)
+        reader = None
+        if self.on_output is not None:
+            # Lines are read on a helper thread so this one can watch for cancel and the timeout
+            reader = threading.Thread(target=self._pump_output, args=(proc, phase), daemon=True)
+            reader.start()
+        with proc:
+            stopped = processes.wait(proc, timeout, self._cancelled.is_set)
+            if reader:
+                reader.join(processes.KILL_GRACE_S)
+        if stopped == "stopped":
+            raise GenerationCancelled("Generation cancelled")
+        if stopped == "timeout":
+            raise GenerationTimeout(f"Timed out after {timeout:.0f}s: {display}")
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    def _pump_output(self, proc, phase):
+        try:
+            for line in proc.stdout:
+                self.on_output(phase, line.rstrip("\r\n"))
+        except (OSError, ValueError):
+            pass  # Pipe closed under us after a kill
 
     def _copy_stack_template(self, stack, destination):
         # Legacy/Fallback
         template_src = self.templates_dir / stack
+        store = TemplateStore()
+        context = {"name": destination.name, "stack": stack}
         if template_src.exists():
-             shutil.copytree(template_src, destination, dirs_exist_ok=True)
+            # Sync this stack's folder into the template store (only changed
+            # files are re-hashed), then materialize from deduplicated blobs
+            store.import_template(stack, template_src)
+            store.materialize(stack, destination, context)
+        elif store.manifest(stack) and stack not in store.orphaned(self.templates_dir):
+            # Imported with `templates import`; a deleted templates/ folder's stale copy isn't served
+            store.materialize(stack, destination, context)
         else:
             destination.mkdir(parents=True, exist_ok=True)
             (destination / "README.md").touch()
@@ -241,61 +659,30 @@ class ProjectInitializer:
         return []
 
     def _generate_docker_files(self, stack, destination, ui_framework):
-        # ... logic ...
-        self._generate_dockerfile(stack, destination)
-        self._generate_docker_compose(stack, destination)
+        """Renders the Dockerfile and docker-compose.yml in one batch."""
+        templating.render_files([
+            (templating.get_template("Dockerfile.tmpl"), self._dockerfile_context(stack), destination / "Dockerfile"),
+            (templating.get_template("docker-compose.yml.tmpl"), self._compose_context(stack, destination),
+             destination / "docker-compose.yml"),
+        ])
 
-    def _generate_dockerfile(self, stack, destination):
+    def _dockerfile_context(self, stack):
         # 1. Try Config First
         stack_config = self.commands_config.get("stacks", {}).get(stack)
         
-        if stack_config:
-            base = stack_config.get("docker_base", "alpine:latest")
-            cmd = stack_config.get("docker_cmd", "echo 'No Launch Command'")
-            
-            # Basic Template based on Base Image Family
-            if "node" in base:
-                content = (
-                    f"FROM {base}\n"
-                    "WORKDIR /app\n"
-                    "COPY package*.json .\n"
-                    "RUN npm install\n"
-                    "COPY . .\n"
-                    f"CMD {json.dumps(cmd.split(' '))}" # Naive split, better to use exec form properly or shell form
-                )
-                # Revert to valid JSON list for CMD
-                # Actually, simple shell form CMD "npm run dev" is fine too if we don't care about signals
-                content = (
-                    f"FROM {base}\n"
-                    "WORKDIR /app\n"
-                    "COPY package*.json .\n"
-                    "RUN npm install\n"
-                    "COPY . .\n"
-                    f"CMD {cmd.split(' ')}" 
-                ).replace("'", '"') # Fix quotes for JSON
-                
-            elif "python" in base:
-                content = (
-                    f"FROM {base}\n"
-                    "WORKDIR /app\n"
-                    "COPY requirements.txt .\n"
-                    "RUN pip install --no-cache-dir -r requirements.txt\n"
-                    "COPY . .\n"
-                    f"CMD {cmd.split(' ')}"
-                ).replace("'", '"')
-            else:
-                 content = f"FROM {base}\nCMD {cmd.split(' ')}".replace("'", '"')
-                 
-            with open(destination / "Dockerfile", "w") as f:
-                f.write(content)
-            return
-
-        # Fallback (Should typically not be hit if everything is in commands.json)
-        content = "FROM alpine:latest\nCMD [\"echo\", \"Hello World\"]"
-        with open(destination / "Dockerfile", "w") as f:
-            f.write(content)
+        if not stack_config:
+            # Fallback (Should typically not be hit if everything is in commands.json)
+            return {"base": "alpine:latest", "family": "other", "cmd_json": json.dumps(["echo", "Hello World"])}
+        
+        base = stack_config.get("docker_base", "alpine:latest")
+        cmd = stack_config.get("docker_cmd", "echo 'No Launch Command'")
+        
+        # Basic Template based on Base Image Family
+        family = "node" if "node" in base else "python" if "python" in base else "other"
+        # Exec form, so the process gets signals directly
+        return {"base": base, "family": family, "cmd_json": json.dumps(cmd.split(" "))}
 
-    def _generate_docker_compose(self, stack, destination):
+    def _compose_context(self, stack, destination):
         # Try Config
         stack_config = self.commands_config.get("stacks", {}).get(stack)
         port_map = "8000:8000"
@@ -307,60 +694,48 @@ class ProjectInitializer:
         if not port_map or port_map == "N/A":
              # Use a dummy open port or skip
              port_map = "80" 
-
-        compose_data = {
-            "version": "3",
-            "services": {
-                "web": {
-                    "image": f"{destination.name.lower()}:latest",
-                    "build": ".",
-                    "ports": [port_map],
-                    "volumes": ["./:/app"],
-                    "restart": "always"
-                }
-            }
-        }
-        with open(destination / "docker-compose.yml", "w") as f:
-            yaml.dump(compose_data, f, default_flow_style=False)
+        
+        # JSON strings are valid YAML scalars, so names with ':', '&', '@' etc. stay strings
+        return {"image_json": json.dumps(f"{destination.name.lower()}:latest"), "port_json": json.dumps(str(port_map))}
 
     def _apply_superpower_framework(self, project_path):
-        """Copy bundled .agent folder and initialize git with a commit.
+        """Copy bundled .agent folder (or extract agent.zip) and initialize git with a commit.
         
         This method handles errors gracefully - if anything fails, it logs
         a warning but doesn't fail the project creation.
         """
         try:
-            # Locate bundled .agent folder
-            bundled_agent = get_resource_path("alpha/superpower_framework/.agent")
-            
-            if not bundled_agent.exists():
-                logging.warning(f"Bundled .agent folder not found at {bundled_agent}")
-                return
-            
-            # Copy to project
             dest_agent = project_path / ".agent"
-            shutil.copytree(bundled_agent, dest_agent, dirs_exist_ok=True)
-            logging.info(f"Copied .agent framework to {dest_agent}")
+            # Release builds ship the bundle as one archive, source checkouts as a folder
+            bundled_agent = get_resource_path(agentbundle.ARCHIVE)
+            if bundled_agent.exists():
+                files, size = agentbundle.extract(bundled_agent, dest_agent)
+                logging.info(f"Extracted .agent framework to {dest_agent} ({files} files, {size} bytes)")
+            else:
+                bundled_agent = get_resource_path(agentbundle.FOLDER)
+                if not bundled_agent.exists():
+                    logging.warning(f"Bundled .agent folder not found at {bundled_agent}")
+                    return
+                stats = copy_tree(bundled_agent, dest_agent, ignore=agentbundle.ignore)
+                logging.info(f"Copied .agent framework to {dest_agent} ({stats})")
             
             # Initialize git
-            self._init_git_with_agent(project_path)
+            self._init_git_with_agent(project_path, bundled_agent)
             
         except Exception as e:
             logging.warning(f"Superpower Framework setup failed (non-critical): {e}")
 
-    def _init_git_with_agent(self, project_path):
+    def _init_git_with_agent(self, project_path, bundled_agent=None):
         """Initialize git repo and commit .agent folder.
         
-        Skips git init if repo already exists.
+        Skips git init if repo already exists. The .agent files are staged from
+        pre-hashed objects when possible (see alpha/gitbootstrap.py).
         """
+        # A PATH lookup instead of spawning `git --version`
+        if toolchain.missing(["git"]):
+            logging.warning("Git not found on system - skipping git initialization")
+            return
         try:
-            # Check if git is available
-            result = subprocess.run(
-                ["git", "--version"], 
-                capture_output=True, 
-                check=True
-            )
-            
             git_dir = project_path / ".git"
             
             # Only init if not already a git repo
@@ -369,7 +744,14 @@ class ProjectInitializer:
                 logging.info(f"Initialized git repository in {project_path}")
             
             # Add and commit .agent
-            subprocess.run(["git", "add", ".agent"], cwd=project_path, check=True)
+            try:
+                if bundled_agent is None:
+                    raise ValueError("no bundle to stage from")
+                tree = gitbootstrap.stage(project_path, bundled_agent)
+                logging.info(f"Staged .agent from pre-hashed tree {tree[:12]}")
+            except (OSError, ValueError, subprocess.CalledProcessError) as e:
+                logging.info(f"Staging .agent with git add ({e})")
+                subprocess.run(["git", "add", ".agent"], cwd=project_path, check=True)
             subprocess.run(
                 ["git", "commit", "-m", "Add Superpowers framework"],
                 cwd=project_path,
@@ -0,0 +1,130 @@
+"""Journal of finished generation steps, so a failed generation can resume.
+
+The journal lives in ``<project_root>/.alpha/journal.json`` and maps step
+names to a hash of the step's inputs::
+
+    {"version": 1, "steps": {"init": {"hash": "...", "finished_at": 1700000000.0}}}
+
+When resuming, a step is skipped if it finished before with the same inputs
+and every step before it was skipped too; from the first step that failed or
+changed on, everything runs again.
+
+Tools like create-next-app insist on creating the project directory
+themselves, so nothing is written before ``project_root`` exists: finished
+steps are kept in memory and flushed once it does. A generation that
+succeeds has nothing left to resume, so it removes the journal again.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+JOURNAL_DIR = ".alpha"
+JOURNAL_NAME = "journal.json"
+VERSION = 1
+
+
+def step_hash(*inputs):
+    """Stable hash of a step's inputs (anything JSON serializable)."""
+    text = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class StepJournal:
+    def __init__(self, project_root, resume=False):
+        self.project_root = Path(project_root)
+        self.path = self.project_root / JOURNAL_DIR / JOURNAL_NAME
+        self._lock = threading.Lock()
+        self._steps = self._load() if resume else {}
+        self._skipped = set()
+        self._resuming = {}
+        if resume and not self._steps:
+            logging.warning(f"No journal to resume from in {self.project_root}, starting over")
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != VERSION:
+            return {}
+        return data.get("steps", {})
+
+    def _is_done(self, name, digest):
+        entry = self._steps.get(name)
+        return entry is not None and entry.get("hash") == digest
+
+    def begin(self, name, digest, after=()):
+        """Called as a step starts; True if it finished before and can be skipped.
+
+        `after` are the steps it depends on: it is only skipped if they were.
+        """
+        with self._lock:
+            resumable = set(after) <= self._skipped
+            if resumable and self._is_done(name, digest):
+                self._skipped.add(name)
+                return True
+            # Its sub-steps can still be skipped, up to the first one that runs
+            self._resuming[name] = resumable
+            stale = self._steps.pop(name, None)
+        if stale:
+            # Until it finishes again, a failure must not look finished
+            self.flush()
+        return False
+
+    def begin_substep(self, step, name, digest):
+        """Like begin() for the sequential parts of a running step."""
+        key = f"{step}/{name}"
+        with self._lock:
+            if self._resuming.get(step) and self._is_done(key, digest):
+                return True
+            self._resuming[step] = False
+            stale = self._steps.pop(key, None)
+        if stale:
+            self.flush()
+        return False
+
+    def record(self, name, digest, step=None):
+        """Mark a step (or a sub-step of `step`) as finished."""
+        key = f"{step}/{name}" if step else name
+        with self._lock:
+            self._steps[key] = {"hash": digest, "finished_at": time.time()}
+        self.flush()
+
+    def flush(self):
+        """Write the journal, once the project directory exists."""
+        if not self.project_root.is_dir():
+            return
+        with self._lock:
+            data = {"version": VERSION, "steps": dict(self._steps)}
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            ignore = self.path.parent / ".gitignore"
+            if not ignore.exists():
+                # Keep the journal out of the project's own git repo
+                ignore.write_text("*\n")
+            tmp = self.path.with_name(f"{JOURNAL_NAME}.{uuid.uuid4().hex}")
+            with open(tmp, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logging.warning(f"Could not write step journal {self.path}: {e}")
+
+    def discard(self):
+        """Remove the journal (and its folder, if nothing else is in it)."""
+        for path in (self.path, self.path.parent / ".gitignore"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"Could not remove {path}: {e}")
+        try:
+            self.path.parent.rmdir()
+        except OSError:
+            pass  # Missing, or holds files that aren't ours
@@ -0,0 +1,120 @@
+"""Dependency-graph executor for project generation steps.
+
+Each step declares the resources it reads (inputs) and produces (outputs).
+A step depends on every step producing one of its inputs; steps with no
+dependency on each other run concurrently in a thread pool.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+DEFAULT_WORKERS = 4
+
+
+class Step:
+    def __init__(self, name, func, inputs=(), outputs=()):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+
+
+class StepGraph:
+    """A set of steps wired together by their declared inputs and outputs."""
+
+    def __init__(self, title=""):
+        self.title = title
+        self.steps = {}
+
+    def add(self, name, func, inputs=(), outputs=()):
+        if name in self.steps:
+            raise ValueError(f"Duplicate step: {name}")
+        step = Step(name, func, inputs, outputs)
+        self.steps[name] = step
+        return step
+
+    def dependencies(self):
+        """Map of step name -> names of the steps it waits for.
+
+        Inputs nobody produces are external (e.g. the config) and add no edge.
+        """
+        producers = {}
+        for step in self.steps.values():
+            for output in step.outputs:
+                producers.setdefault(output, set()).add(step.name)
+
+        deps = {}
+        for step in self.steps.values():
+            deps[step.name] = set()
+            for resource in step.inputs:
+                deps[step.name] |= producers.get(resource, set()) - {step.name}
+        return deps
+
+    def stages(self):
+        """Group steps into stages; every step of a stage can run concurrently."""
+        deps = self.dependencies()
+        done = set()
+        stages = []
+        while len(done) < len(deps):
+            ready = [name for name in self.steps if name not in done and deps[name] <= done]
+            if not ready:
+                cycle = sorted(set(deps) - done)
+                raise ValueError(f"Dependency cycle between steps: {', '.join(cycle)}")
+            stages.append(ready)
+            done.update(ready)
+        return stages
+
+    def describe(self):
+        """Human readable plan, one stage per line group."""
+        deps = self.dependencies()
+        lines = [self.title] if self.title else []
+        for i, stage in enumerate(self.stages(), 1):
+            parallel = " (parallel)" if len(stage) > 1 else ""
+            lines.append(f"  stage {i}{parallel}:")
+            for name in stage:
+                step = self.steps[name]
+                after = ", ".join(sorted(deps[name])) or "-"
+                produces = ", ".join(step.outputs) or "-"
+                lines.append(f"    {name:<20} after: {after:<20} produces: {produces}")
+        return "\n".join(lines)
+
+    def run(self, max_workers=DEFAULT_WORKERS, on_start=None, on_finish=None):
+        """Execute all steps as soon as their dependencies are done.
+
+        on_start(name) and on_finish(name, duration_s) are called from the
+        worker threads. The first failing step stops scheduling; steps already
+        running are allowed to finish and the failure is re-raised.
+        """
+        deps = self.dependencies()
+        self.stages()  # Fail fast on cycles
+
+        def run_step(step):
+            if on_start:
+                on_start(step.name)
+            start = time.perf_counter()
+            step.func()
+            if on_finish:
+                on_finish(step.name, time.perf_counter() - start)
+
+        done = set()
+        running = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while True:
+                if error is None:
+                    for name, step in self.steps.items():
+                        if name not in done and name not in running.values() and deps[name] <= done:
+                            running[pool.submit(run_step, step)] = name
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    exc = future.exception()
+                    if exc is not None:
+                        error = error or exc
+                    else:
+                        done.add(name)
+
+        if error is not None:
+            raise error
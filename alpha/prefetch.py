@@ -0,0 +1,129 @@
+"""Speculative cache warming for the selected stack.
+
+While the user is still typing a project name, the GUI can prepare the stack
+they picked (opt-in):
+
+1. check that the tools it needs are on PATH
+2. resolve the ``pkg@latest`` versions its commands will ask npm for
+3. download those packages (and the post-install hook's) into the npm cache
+4. fill the wheelhouse with its Python requirements, or build the golden venv
+
+Every step only warms caches that generation reads anyway (see
+alpha/artifacts.py), so a prefetch that is interrupted or wrong costs
+nothing but the bandwidth. Failures are logged and reported, never raised.
+"""
+import logging
+import re
+import shutil
+import subprocess
+import tempfile
+from alpha import commands, processes, toolchain
+from alpha.artifacts import ArtifactCache
+from alpha.venvs import GoldenVenvStore
+
+# `npm create x@latest` / `npm init x@latest` (group 1 set) or any other `pkg@latest`,
+# in a shell command or a JSON argv list
+LATEST_RE = re.compile(r"""(?:\bnpm["',\s]+(create|init)["',\s]+)?(?<![\w@/.-])(@?[A-Za-z0-9][\w./-]*)@latest\b""")
+
+# How long a single prefetch command may take
+COMMAND_TIMEOUT_S = 300
+
+
+class PrefetchStopped(Exception):
+    pass
+
+
+def initializer_package(name):
+    """The package `npm create <name>` runs: foo -> create-foo, @scope/foo -> @scope/create-foo."""
+    if name.startswith("@"):
+        scope, _, rest = name.partition("/")
+        return f"{scope}/create-{rest}" if rest else f"{scope}/create"
+    return f"create-{name}"
+
+
+def latest_packages(command_text):
+    """Packages a command fetches as ``name@latest``."""
+    packages = {initializer_package(name) if create else name for create, name in LATEST_RE.findall(command_text)}
+    return sorted(packages)
+
+
+class Prefetcher:
+    def __init__(self, initializer, artifacts=None, should_stop=None, run=None):
+        self.initializer = initializer
+        self.artifacts = artifacts or ArtifactCache()
+        self.should_stop = should_stop or (lambda: False)
+        self.run = run or self._run
+
+    def prefetch(self, stack, ui_framework=None, golden_venv=False):
+        """Warm the caches for a stack. Returns a report dict."""
+        report = {"stack": stack, "missing_tools": [], "resolved": {}, "warmed": [], "errors": [], "stopped": False}
+        stack_cmd = self.initializer.commands_config.get("stacks", {}).get(stack)
+        if not stack_cmd:
+            return report  # Template stacks are local copies already
+        command_text = commands.command_text(stack_cmd)
+
+        try:
+            self._check_stop()
+            report["missing_tools"] = toolchain.missing(toolchain.required_tools(stack_cmd))
+
+            packages = latest_packages(command_text) + self.initializer.post_install_packages(stack, ui_framework)
+            if packages and "npm" not in report["missing_tools"]:
+                for package in packages:
+                    self._check_stop()
+                    self._warm_npm(package, report)
+
+            requirements = commands.venv_requirements(stack_cmd)
+            if requirements is not None and "python" not in report["missing_tools"]:
+                self._check_stop()
+                self._warm_python(requirements, golden_venv, report)
+        except PrefetchStopped:
+            report["stopped"] = True
+        logging.info(f"Prefetch for {stack}: {report}")
+        return report
+
+    def _warm_npm(self, package, report):
+        try:
+            name = package[:-len("@latest")] if package.endswith("@latest") else package
+            version = self.run(["npm", "view", name, "version"]).strip().splitlines()[-1]
+            report["resolved"][name] = version
+            # Puts the packument and tarball in the cache npx/npm will read
+            self.run(["npm", "cache", "add", f"{name}@{version}"])
+            # Not mark_npm_fresh(): the dependencies' metadata wasn't refreshed
+            report["warmed"].append(f"{name}@{version}")
+        except (OSError, IndexError, subprocess.CalledProcessError) as e:
+            report["errors"].append(f"{package}: {e}")
+
+    def _warm_python(self, requirements, golden_venv, report):
+        try:
+            if golden_venv:
+                # Through self.run, so stopping the prefetch kills the build too
+                GoldenVenvStore().ensure(requirements, run=self.run, artifacts=self.artifacts)
+                report["warmed"].append("golden venv")
+            elif requirements and not self.artifacts.wheels_current(requirements):
+                self.artifacts.wheelhouse.mkdir(parents=True, exist_ok=True)
+                self.run([GoldenVenvStore().python, "-m", "pip", "wheel",
+                          "--wheel-dir", str(self.artifacts.wheelhouse), *requirements])
+                self.artifacts.mark_wheels_fresh(requirements)
+                report["warmed"].append("wheelhouse")
+        except (OSError, subprocess.CalledProcessError) as e:
+            report["errors"].append(f"python requirements: {e}")
+
+    def _check_stop(self):
+        if self.should_stop():
+            raise PrefetchStopped()
+
+    def _run(self, argv):
+        """Run a command against the artifact cache; returns its stdout. Killed when stopped."""
+        argv = [shutil.which(argv[0]) or argv[0]] + list(argv[1:])
+        # A file rather than a pipe: nobody reads while we poll, and pip is chatty
+        with tempfile.TemporaryFile() as out:
+            proc = subprocess.Popen(argv, env=self.artifacts.env(), stdin=subprocess.DEVNULL,
+                                    stdout=out, stderr=subprocess.DEVNULL, **processes.NEW_GROUP)
+            outcome = processes.wait(proc, COMMAND_TIMEOUT_S, self.should_stop)
+            out.seek(0)
+            output = out.read().decode("utf-8", errors="replace")
+        if outcome == "stopped":
+            raise PrefetchStopped()
+        if outcome == "timeout" or proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, argv)
+        return output
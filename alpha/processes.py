@@ -0,0 +1,73 @@
+"""Child process groups that can be killed as a whole.
+
+npx, npm and shell commands spawn their own children. Killing just the
+direct child leaves those running (and holding CPU, memory and file locks in
+the half-created project), so commands are started in a new process group
+and the whole group is killed on cancel or timeout.
+"""
+import logging
+import os
+import signal
+import subprocess
+import time
+
+# Popen arguments that start the child in a process group of its own
+if os.name == 'nt':
+    NEW_GROUP = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    NEW_GROUP = {"start_new_session": True}
+
+# How often a waiting command checks for cancel and its deadline
+POLL_INTERVAL_S = 0.2
+# Time between SIGTERM and SIGKILL
+KILL_GRACE_S = 3.0
+
+
+def kill_tree(proc, grace_s=KILL_GRACE_S):
+    """Kill a process started with NEW_GROUP and everything it spawned."""
+    if os.name == 'nt':
+        # /T takes the whole tree, /F doesn't ask
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        try:
+            proc.wait(timeout=grace_s)
+        except subprocess.TimeoutExpired:
+            pass
+        # Children may outlive the group leader; the group id stays the same
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    try:
+        proc.wait(timeout=grace_s)
+    except subprocess.TimeoutExpired:
+        logging.warning(f"Process {proc.pid} did not exit after being killed")
+
+
+def wait(proc, timeout=None, should_stop=None):
+    """Wait for proc, killing its group if `timeout` expires or should_stop() is true.
+
+    Returns None when the process exited by itself, else "timeout" or "stopped".
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    while True:
+        try:
+            proc.wait(timeout=POLL_INTERVAL_S)
+            return None
+        except subprocess.TimeoutExpired:
+            pass
+        except BaseException:
+            # Ctrl-C: the group is outside the terminal's foreground group and never sees it
+            kill_tree(proc)
+            raise
+        if should_stop and should_stop():
+            kill_tree(proc)
+            return "stopped"
+        if deadline and time.monotonic() >= deadline:
+            kill_tree(proc)
+            return "timeout"
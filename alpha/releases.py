@@ -0,0 +1,113 @@
+"""GitHub latest-release lookup with an on-disk cache.
+
+The response is cached with a TTL; once stale it is revalidated with
+``If-None-Match`` so an unchanged release costs a 304 (which GitHub does not
+count against the rate limit). Network or server failures fall back to the
+cached result. Point ``ALPHA_UPDATE_API_URL`` at a local server to test.
+"""
+import json
+import logging
+import os
+import time
+from alpha.utils import get_data_dir
+from alpha.version import __version__, GITHUB_REPO
+
+DEFAULT_API_URL = "https://api.github.com"
+CACHE_TTL_S = 6 * 60 * 60
+REQUEST_TIMEOUT_S = 5
+
+
+def get_api_url():
+    return os.environ.get("ALPHA_UPDATE_API_URL", DEFAULT_API_URL).rstrip("/")
+
+
+def _default_cache_path():
+    return get_data_dir() / "latest-release.json"
+
+
+def _load_cache(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(path, cache):
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logging.warning(f"Could not write release cache {path}: {e}")
+
+
+def fetch_latest_release(base_url=None, cache_path=None, ttl=CACHE_TTL_S, timeout=REQUEST_TIMEOUT_S):
+    """Returns the latest release JSON (dict), or None if it is unknown."""
+    url = f"{(base_url or get_api_url()).rstrip('/')}/repos/{GITHUB_REPO}/releases/latest"
+    cache_path = cache_path or _default_cache_path()
+
+    cache = _load_cache(cache_path)
+    if cache and cache.get("url") != url:
+        cache = None
+    cached_data = cache.get("data") if cache else None
+
+    # Fresh enough: no request at all
+    if cache and time.time() - cache.get("fetched_at", 0) < ttl:
+        return cached_data
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if cache and cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+
+    try:
+        import requests  # Only needed for update checks; slow to import
+        response = requests.get(url, headers=headers, timeout=timeout)
+    except Exception as e:
+        logging.info(f"Release lookup failed, using cached result: {e}")
+        return cached_data
+
+    if response.status_code == 304 and cache:
+        cache["fetched_at"] = time.time()
+        _save_cache(cache_path, cache)
+        return cached_data
+
+    if response.status_code == 200:
+        try:
+            data = response.json()
+        except ValueError:
+            return cached_data
+        _save_cache(cache_path, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "fetched_at": time.time(),
+            "data": data,
+        })
+        return data
+
+    logging.info(f"Release lookup returned HTTP {response.status_code}, using cached result")
+    return cached_data
+
+
+def is_newer(latest, current):
+    try:
+        # Semantic versioning check (x.y.z)
+        l_parts = [int(x) for x in latest.split(".")]
+        c_parts = [int(x) for x in current.split(".")]
+        return l_parts > c_parts
+    except (AttributeError, ValueError):
+        return False
+
+
+def check_latest(current=__version__, **kwargs):
+    """Returns (is_update_available, version, url)."""
+    data = fetch_latest_release(**kwargs)
+    if not data:
+        return False, None, None
+
+    latest_tag = data.get("tag_name", "").lstrip("v")
+    html_url = data.get("html_url", "")
+    if is_newer(latest_tag, current):
+        return True, latest_tag, html_url
+    return False, None, None
@@ -0,0 +1,215 @@
+"""Local cache of pre-built stack trees.
+
+Instead of re-running a stack's ``init_command`` (minutes of npm/pip work),
+the tree it produced is stored once and copied into new projects. Snapshots
+are generated under a placeholder project name which is rewritten to the real
+name when the snapshot is materialized.
+"""
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+import uuid
+from pathlib import Path
+from alpha.copyengine import copy_tree
+from alpha.toolchain import Toolchain
+from alpha.utils import get_data_dir
+
+# Project name used while building a snapshot. It contains no separators so it
+# is valid for both the snake_case (Python) and kebab-case (JS) stacks.
+SNAPSHOT_NAME = "alphasnapshotproject"
+
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3  # 5 GiB
+
+# Never stored in a snapshot: venvs hold absolute paths, .git holds history
+# that mentions the placeholder name.
+EXCLUDED_DIRS = {"venv", ".venv", ".git"}
+
+# Directories never searched for the placeholder name (large, and npm/pip
+# regenerate any metadata that mentions it).
+SKIP_REWRITE_DIRS = {"node_modules", "venv", ".venv", ".git", "__pycache__"}
+
+# Files in which the placeholder project name is rewritten.
+NAME_FILES = (
+    "package.json", "package-lock.json", "index.html", "README.md",
+    "*.py", "pyproject.toml", "setup.cfg", "requirements.txt",
+)
+
+
+def tool_versions(command):
+    """Return the versions of the tools a command depends on.
+
+    These are part of the snapshot key: a tree built with another node or
+    python release should not be reused.
+    """
+    versions = {}
+    tools = []
+    if "npm" in command or "npx" in command:
+        tools += ["node", "npm"]
+    if "python" in command or "venv" in command:
+        versions["python"] = sys.version.split()[0]
+    if tools:
+        # Probed in parallel and cached until PATH changes
+        versions.update(Toolchain().versions(tools))
+    return versions
+
+
+def make_key(stack, init_command, ui_framework, versions):
+    """Stable cache key for a stack build."""
+    payload = json.dumps({
+        "stack": stack,
+        "init_command": init_command,
+        "ui_framework": (ui_framework or "").lower(),
+        "tool_versions": versions,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+
+def _tree_size(path):
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class SnapshotCache:
+    """Size-bounded, least-recently-used store of stack trees.
+
+    Layout: ``<root>/<key>/tree`` holds the files and ``<root>/<key>/meta.json``
+    the stack info, size and last use time.
+    """
+
+    def __init__(self, root=None, max_bytes=None):
+        self.root = Path(root) if root else get_data_dir() / "snapshots"
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("ALPHA_SNAPSHOT_MAX_BYTES", DEFAULT_MAX_BYTES))
+        self.max_bytes = max_bytes
+
+    def staging_dir(self):
+        """Fresh directory (on the cache filesystem) to build a snapshot in."""
+        path = self.root / ".staging" / uuid.uuid4().hex
+        path.mkdir(parents=True)
+        return path
+
+    def has(self, key):
+        """Whether a snapshot is cached, without marking it used."""
+        return self._read_meta(key) is not None and (self.root / key / "tree").is_dir()
+
+    def get(self, key):
+        """Return the meta of a cached snapshot (marking it used), or None."""
+        meta = self._read_meta(key)
+        if meta is None or not (self.root / key / "tree").is_dir():
+            return None
+        meta["last_used"] = time.time()
+        self._write_meta(key, meta)
+        return meta
+
+    def store(self, key, source, meta):
+        """Move a freshly built tree into the cache and evict old entries."""
+        source = Path(source)
+        for name in EXCLUDED_DIRS:
+            if (source / name).is_dir():
+                meta.setdefault("excluded", []).append(name)
+                shutil.rmtree(source / name, ignore_errors=True)
+
+        entry = self.root / key
+        entry.mkdir(parents=True, exist_ok=True)
+        try:
+            source.rename(entry / "tree")
+        except OSError:
+            # Another generation stored the same snapshot first.
+            logging.info(f"Snapshot {key} already stored, discarding duplicate")
+            shutil.rmtree(source, ignore_errors=True)
+            return
+
+        now = time.time()
+        meta.update({"key": key, "size": _tree_size(entry / "tree"), "created": now, "last_used": now})
+        self._write_meta(key, meta)
+        self.evict(keep=key)
+
+    def materialize(self, key, destination, project_name):
+        """Copy a cached tree to destination, renaming the placeholder project."""
+        tree = self.root / key / "tree"
+        copy_tree(tree, destination, symlinks=True)
+        rewrite_project_name(destination, SNAPSHOT_NAME, project_name)
+
+    def entries(self):
+        """All snapshot metas, most recently used first."""
+        metas = []
+        if self.root.exists():
+            for entry in self.root.iterdir():
+                if entry.name.startswith("."):
+                    continue
+                meta = self._read_meta(entry.name)
+                if meta is not None:
+                    metas.append(meta)
+        return sorted(metas, key=lambda m: m.get("last_used", 0), reverse=True)
+
+    def invalidate(self, stack=None):
+        """Remove all snapshots (or only those of one stack). Returns the count."""
+        removed = 0
+        for meta in self.entries():
+            if stack is None or meta.get("stack") == stack:
+                shutil.rmtree(self.root / meta["key"], ignore_errors=True)
+                removed += 1
+        if stack is None:
+            shutil.rmtree(self.root / ".staging", ignore_errors=True)
+        return removed
+
+    def evict(self, keep=None):
+        """Drop least recently used snapshots until the cache fits max_bytes."""
+        metas = self.entries()
+        total = sum(m.get("size", 0) for m in metas)
+        for meta in reversed(metas):
+            if total <= self.max_bytes:
+                break
+            if meta["key"] == keep:
+                continue
+            logging.info(f"Evicting snapshot {meta['key']} ({meta.get('stack')})")
+            shutil.rmtree(self.root / meta["key"], ignore_errors=True)
+            total -= meta.get("size", 0)
+
+    def _read_meta(self, key):
+        try:
+            with open(self.root / key / "meta.json", "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, key, meta):
+        tmp = self.root / key / f"meta.json.{uuid.uuid4().hex}"
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp, self.root / key / "meta.json")
+
+
+def rewrite_project_name(root, old, new):
+    """Rename files/dirs named after the project and rewrite it in NAME_FILES."""
+    root = Path(root)
+    renames = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_REWRITE_DIRS]
+        for name in filenames:
+            path = Path(dirpath) / name
+            if any(fnmatch.fnmatch(name, pattern) for pattern in NAME_FILES):
+                try:
+                    content = path.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    content = ""
+                if old in content:
+                    path.write_text(content.replace(old, new), encoding="utf-8")
+            if old in name:
+                renames.append(path)
+        renames.extend(Path(dirpath) / d for d in dirnames if old in d)
+
+    # Deepest first, so parent paths are still valid when children move
+    for path in sorted(renames, key=lambda p: len(p.parts), reverse=True):
+        path.rename(path.with_name(path.name.replace(old, new)))
@@ -0,0 +1,164 @@
+"""Stack Manager dialog for editing stack configurations in commands.json."""
+import json
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QMessageBox, QListWidget, QFormLayout, QGroupBox
+)
+from alpha.commands import validate as validate_steps
+
+class StackEditorDialog(QDialog):
+    def __init__(self, parent=None, initializer=None):
+        super().__init__(parent)
+        self.setWindowTitle("Stack Manager")
+        self.setGeometry(150, 150, 700, 500)
+        self.initializer = initializer
+        self._setup_ui()
+        self._populate_list()
+        self._apply_styles()
+
+    def _setup_ui(self):
+        layout = QHBoxLayout(self)
+
+        # Left: List
+        left_layout = QVBoxLayout()
+        left_layout.addWidget(QLabel("Available Stacks"))
+        self.list_stacks = QListWidget()
+        self.list_stacks.currentItemChanged.connect(self._on_stack_selected)
+        left_layout.addWidget(self.list_stacks)
+        
+        btn_add = QPushButton("Add New Stack")
+        btn_add.clicked.connect(self._on_add_new)
+        left_layout.addWidget(btn_add)
+        
+        layout.addLayout(left_layout, 1)
+
+        # Right: Details
+        self.group_details = QGroupBox("Stack Configuration")
+        form_layout = QFormLayout(self.group_details)
+        
+        self.input_name = QLineEdit()
+        self.input_cmd = QLineEdit()
+        self.input_docker_base = QLineEdit()
+        self.input_docker_port = QLineEdit()
+        self.input_docker_cmd = QLineEdit()
+        self.input_requires = QLineEdit()
+        
+        form_layout.addRow("Stack Name:", self.input_name)
+        self.input_cmd.setPlaceholderText('Shell command, or JSON steps: [{"run": ["npx", "...", "{name}"]}]')
+        form_layout.addRow("Init Command:", self.input_cmd)
+        form_layout.addRow("Docker Base (Opt):", self.input_docker_base)
+        form_layout.addRow("Docker Port (Opt):", self.input_docker_port)
+        form_layout.addRow("Docker Cmd (Opt):", self.input_docker_cmd)
+        self.input_requires.setPlaceholderText("e.g. node, npm (checked before generating)")
+        form_layout.addRow("Requires (Opt):", self.input_requires)
+        
+        btn_save = QPushButton("Save Stack")
+        btn_save.clicked.connect(self._save_stack)
+        form_layout.addRow(btn_save)
+        
+        btn_delete = QPushButton("Delete Stack")
+        btn_delete.clicked.connect(self._delete_stack)
+        # Style delete button red later
+        form_layout.addRow(btn_delete)
+
+        layout.addWidget(self.group_details, 2)
+
+    def _apply_styles(self):
+        self.setStyleSheet("""
+            QDialog { background-color: #1E1E1E; color: white; }
+            QLabel { color: white; }
+            QGroupBox { color: #A020F0; font-weight: bold; border: 1px solid #3E3E3E; margin-top: 10px; }
+            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 3px; }
+            QLineEdit { background-color: #2D2D2D; color: white; padding: 5px; border: 1px solid #3E3E3E; }
+            QListWidget { background-color: #2D2D2D; color: white; border: 1px solid #3E3E3E; }
+            QPushButton { background-color: #3E3E3E; color: white; padding: 6px; border-radius: 4px; }
+            QPushButton:hover { background-color: #4E4E4E; }
+        """)
+
+    def _populate_list(self):
+        self.list_stacks.clear()
+        stacks = self.initializer.get_available_stacks()
+        self.list_stacks.addItems(stacks)
+
+    def _on_stack_selected(self, current, previous):
+        if not current:
+            return
+            
+        stack_name = current.text()
+        self.input_name.setText(stack_name)
+        
+        # Load config from commands.json if available
+        config = self.initializer.commands_config.get("stacks", {}).get(stack_name, {})
+        
+        # Structured steps are edited as their JSON list
+        if "steps" in config:
+            self.input_cmd.setText(json.dumps(config["steps"]))
+        else:
+            self.input_cmd.setText(config.get("init_command", ""))
+        self.input_docker_base.setText(config.get("docker_base", ""))
+        self.input_docker_port.setText(config.get("docker_port", ""))
+        self.input_docker_cmd.setText(config.get("docker_cmd", ""))
+        self.input_requires.setText(", ".join(config.get("requires", [])))
+        
+        # Disable name editing for existing? Maybe allow copy?
+        # For simplicity, if it's a default stack not in JSON, these will be empty/readonly logic needed?
+        # We'll allow editing, which essentially overrides defaults if we save.
+
+    def _on_add_new(self):
+        self.list_stacks.clearSelection()
+        self.input_name.clear()
+        self.input_name.setFocus()
+        self.input_cmd.clear()
+        self.input_docker_base.clear()
+        self.input_docker_port.clear()
+        self.input_docker_cmd.clear()
+        self.input_requires.clear()
+
+    def _save_stack(self):
+        name = self.input_name.text().strip()
+        cmd = self.input_cmd.text().strip()
+        
+        if not name or not cmd:
+            QMessageBox.warning(self, "Invalid", "Name and Init Command are required.")
+            return
+            
+        # Keep the keys this form doesn't edit (e.g. timeouts)
+        existing = self.initializer.commands_config.get("stacks", {}).get(name, {})
+        config = {k: v for k, v in existing.items() if k not in ("steps", "init_command", "requires")}
+        if cmd.startswith("["):
+            try:
+                config["steps"] = json.loads(cmd)
+                validate_steps(config["steps"])
+            except ValueError as e:
+                QMessageBox.warning(self, "Invalid", f"Init steps are not valid: {e}")
+                return
+        else:
+            config["init_command"] = cmd
+        config.update({
+            "docker_base": self.input_docker_base.text().strip(),
+            "docker_port": self.input_docker_port.text().strip(),
+            "docker_cmd": self.input_docker_cmd.text().strip()
+        })
+        requires = [tool.strip() for tool in self.input_requires.text().split(",") if tool.strip()]
+        if requires:
+            config["requires"] = requires
+        
+        self.initializer.save_stack_config(name, config)
+        QMessageBox.information(self, "Saved", f"Stack '{name}' saved successfully.")
+        self._populate_list()
+
+    def _delete_stack(self):
+        name = self.input_name.text().strip()
+        if not name: return
+        
+        if name not in self.initializer.commands_config.get("stacks", {}):
+            QMessageBox.warning(self, "Cannot Delete", "Cannot delete default/internal stacks, only custom configurations.")
+            return
+
+        confirm = QMessageBox.question(self, "Confirm Delete", f"Delete config for '{name}'?", 
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        
+        if confirm == QMessageBox.StandardButton.Yes:
+            self.initializer.delete_stack_config(name)
+            self._populate_list()
+            self._on_add_new()
@@ -3,16 +3,271 @@
 
 This enables parallel execution by launching independent gemini instances
 with isolated context and specific skill instructions.
+
+Fan-out mode (``--plan plan.json``) runs a whole plan from one process: the
+batches run in order, the tasks of a batch run concurrently in a bounded
+worker pool, and one aggregated JSON result is printed at the end.
 """
 
 import argparse
 import json
+import os
+import codecs
+import hashlib
+import signal
 import subprocess
 import sys
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+DEFAULT_TIMEOUT_S = 600  # 10 minutes per subagent
+DEFAULT_MAX_WORKERS = 4
+
+RESULT_START = "---SUBAGENT-RESULT-START---"
+RESULT_END = "---SUBAGENT-RESULT-END---"
+
+# Output is streamed to the log; only this much of it is ever held in memory
+MAX_RESULT_CHARS = 1024 * 1024
+TAIL_CHARS = 64 * 1024
+CHUNK = 64 * 1024
+
+# Opt-in result cache (--cache or SUPERPOWERS_SUBAGENT_CACHE=1)
+CACHE_ENV = "SUPERPOWERS_SUBAGENT_CACHE"
+CACHE_EXCLUDE = "artifacts/superpowers"  # Our own logs and cache don't change the tree state
+DEFAULT_CACHE_TTL_S = 24 * 60 * 60
+DEFAULT_CACHE_ENTRIES = 256
+
+# Own process group/session, so a timeout kills the subagent's children too
+if os.name == "nt":
+    NEW_GROUP = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    NEW_GROUP = {"start_new_session": True}
+
+
+class TailBuffer:
+    """The last `limit` characters fed to it."""
+
+    def __init__(self, limit: int = TAIL_CHARS) -> None:
+        self.limit = limit
+        self._text = ""
+
+    def feed(self, text: str) -> None:
+        self._text = (self._text + text)[-self.limit:]
+
+    def text(self) -> str:
+        return self._text
+
+
+class MarkerScanner:
+    """
+    Extract the text between RESULT_START and RESULT_END from streamed output.
+
+    Markers may be split across chunks. Outside the result only a marker's
+    length of text is kept, and the result itself is capped at `limit`
+    characters (flagged by `truncated`).
+    """
+
+    def __init__(self, start: str = RESULT_START, end: str = RESULT_END, limit: int = MAX_RESULT_CHARS) -> None:
+        self.start, self.end, self.limit = start, end, limit
+        self.state = "before"  # before -> inside -> done
+        self.truncated = False
+        self.tail = TailBuffer()
+        self._pending = ""
+        self._parts: list[str] = []
+        self._size = 0
+
+    def feed(self, text: str) -> None:
+        self.tail.feed(text)
+        buf = self._pending + text
+        self._pending = ""
+        if self.state == "before":
+            i = buf.find(self.start)
+            if i < 0:
+                self._pending = buf[-(len(self.start) - 1):]
+                return
+            buf = buf[i + len(self.start):]
+            self.state = "inside"
+        if self.state == "inside":
+            i = buf.find(self.end)
+            if i >= 0:
+                self._append(buf[:i])
+                self.state = "done"
+                return
+            keep = len(self.end) - 1
+            self._append(buf[:-keep])
+            self._pending = buf[-keep:]
+
+    def _append(self, text: str) -> None:
+        room = self.limit - self._size
+        if len(text) > room:
+            text, self.truncated = text[:room], True
+        if text:
+            self._parts.append(text)
+            self._size += len(text)
+
+    def result(self) -> Optional[str]:
+        """The result (stripped), or None if no start marker was seen."""
+        if self.state == "before":
+            return None
+        if self.state == "inside":
+            # Output ended without an end marker: what's held back is part of the result
+            self._append(self._pending)
+            self._pending = ""
+        return "".join(self._parts).strip()
+
+
+def tree_state(repo_root: Path) -> Optional[str]:
+    """
+    Hash of the repository's state: HEAD plus the content of every changed or
+    untracked file (artifacts/superpowers/ excluded). None outside a git repo.
+    """
+    def git(*args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(["git", *args], cwd=repo_root, capture_output=True)
+
+    try:
+        # Prints the top level, then HEAD unless the repo has no commits yet
+        revs = git("rev-parse", "--show-toplevel", "--verify", "-q", "HEAD").stdout.decode().splitlines()
+        if not revs:
+            return None
+        status = git("status", "--porcelain", "-z", "--untracked-files=all", "--", ".", f":(exclude){CACHE_EXCLUDE}")
+    except OSError:
+        return None
+    if status.returncode != 0:
+        return None
+
+    state = hashlib.sha256("\n".join(revs[1:]).encode() + b"\0" + status.stdout)
+    entries = iter(status.stdout.split(b"\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        if entry[:1] in (b"R", b"C"):
+            next(entries, None)  # The rename's source path
+        path = Path(revs[0]) / os.fsdecode(entry[3:])
+        if path.is_file():
+            state.update(hashlib.sha256(path.read_bytes()).digest())
+    return state.hexdigest()
+
+
+class ResultCache:
+    """
+    Successful subagent results, keyed on a hash of the prompt and tree_state().
+
+    A result is stored under the tree as the subagent left it, never the tree
+    it started from: reverting the subagent's edits must run it again.
+
+    One JSON file per entry under artifacts/superpowers/cache/subagents/.
+    Entries expire after ttl_s; beyond max_entries the least recently used
+    (oldest mtime, refreshed on every hit) are removed.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        ttl_s: float = DEFAULT_CACHE_TTL_S,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+    ) -> None:
+        self.dir = repo_root / "artifacts" / "superpowers" / "cache" / "subagents"
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+
+    def key(self, prompt: str, yolo: bool, repo_root: Path) -> Optional[str]:
+        state = tree_state(repo_root)
+        if state is None:
+            return None  # Can't tell whether the tree changed, so never reuse
+        return hashlib.sha256(json.dumps([prompt, yolo, state]).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        path = self.dir / f"{key}.json"
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - entry["stored_at"] > self.ttl_s:
+                path.unlink()
+                return None
+            os.utime(path)  # Recently used
+        except (OSError, ValueError, KeyError):
+            return None
+        return {**entry["result"], "cached": True, "duration_s": 0.0}
+
+    def put(self, key: Optional[str], result: dict[str, Any]) -> None:
+        if not key:
+            return
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            data = json.dumps({"stored_at": time.time(), "result": result})
+            tmp = self.dir / f"{key}.{uuid.uuid4().hex}.tmp"
+            tmp.write_text(data, encoding="utf-8")
+            os.replace(tmp, self.dir / f"{key}.json")
+            self._evict()
+        except OSError:
+            pass  # A cache that can't be written just misses next time
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+        for mtime, path in entries[self.max_entries:]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def cache_from_args(args: argparse.Namespace, repo_root: Path) -> Optional[ResultCache]:
+    """The result cache if --cache or SUPERPOWERS_SUBAGENT_CACHE=1 asked for it (and --no-cache didn't)."""
+    enabled = args.cache or os.environ.get(CACHE_ENV, "").lower() in ("1", "true", "yes")
+    if not enabled or args.no_cache:
+        return None
+    return ResultCache(repo_root, ttl_s=args.cache_ttl)
+
+
+def _feed_prompt(pipe, prompt: str) -> None:
+    try:
+        pipe.write(prompt.encode("utf-8"))
+        pipe.close()
+    except OSError:
+        pass  # The subagent exited without reading it all
+
+
+def _pump(pipe, log, lock: threading.Lock, prefix: str, sinks) -> None:
+    """Copy a pipe to the log as it arrives (each line prefixed), feeding each decoded chunk to sinks."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    at_line_start = True
+    while True:
+        data = pipe.read1(CHUNK)
+        text = decoder.decode(data, final=not data)
+        if text:
+            for sink in sinks:
+                sink(text)
+            if prefix:
+                body = text[:-1].replace("\n", "\n" + prefix) + text[-1]
+                text = (prefix if at_line_start else "") + body
+                at_line_start = body.endswith("\n")
+            with lock:
+                if not log.closed:  # A grandchild can outlive the join timeout below
+                    log.write(text)
+                    log.flush()  # So the log can be tailed live
+        if not data:
+            break
+    pipe.close()
+
+
+def _kill_tree(proc: subprocess.Popen) -> None:
+    """Kill the subagent and everything it started."""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        proc.kill()
 
 
 def find_repo_root(start: Path) -> Path:
@@ -34,12 +289,40 @@ def load_skill_instructions(skill_path: Path) -> str:
     return skill_path.read_text(encoding="utf-8")
 
 
+def build_prompt(skill: str, task: str, skill_instructions: str, subagent_id: str) -> str:
+    """The focused prompt sent to a subagent."""
+    return f"""You are a specialized subagent focused on: {skill}
+
+IMPORTANT: You have ISOLATED CONTEXT. Do not assume knowledge from other conversations.
+
+Task:
+{task}
+
+Skill Instructions:
+{skill_instructions}
+
+Requirements:
+1. Follow the skill instructions exactly
+2. Complete the task fully
+3. Output ONLY the final result at the end
+4. Do not include meta-commentary or thinking process in final output
+5. Write any artifacts to artifacts/superpowers/subagent-{subagent_id}/
+
+When complete, output:
+{RESULT_START}
+[Your final result here]
+{RESULT_END}
+"""
+
+
 def spawn_subagent(
     skill: str,
     task: str,
     repo_root: Path,
     yolo: bool = True,
     output_format: str = "text",
+    timeout_s: float = DEFAULT_TIMEOUT_S,
+    cache: Optional[ResultCache] = None,
 ) -> dict[str, Any]:
     """
     Spawn a subagent with isolated context.
@@ -50,9 +333,12 @@ def spawn_subagent(
         repo_root: Repository root path
         yolo: Auto-approve all actions (default: True for parallel execution)
         output_format: Output format ('text' or 'json')
+        timeout_s: Seconds before the subagent is stopped
+        cache: Result cache to read and fill (successful runs only)
 
     Returns:
-        dict with keys: success, output, error, log_file, duration_s
+        dict with keys: success, output, error, log_file, duration_s (and cached,
+        True when the result came from the cache)
     """
     # Generate unique subagent ID
     subagent_id = uuid.uuid4().hex[:8]
@@ -77,28 +363,15 @@ def spawn_subagent(
         }
 
     # Construct focused prompt
-    prompt = f"""You are a specialized subagent focused on: {skill}
-
-IMPORTANT: You have ISOLATED CONTEXT. Do not assume knowledge from other conversations.
-
-Task:
-{task}
-
-Skill Instructions:
-{skill_instructions}
-
-Requirements:
-1. Follow the skill instructions exactly
-2. Complete the task fully
-3. Output ONLY the final result at the end
-4. Do not include meta-commentary or thinking process in final output
-5. Write any artifacts to artifacts/superpowers/subagent-{subagent_id}/
+    prompt = build_prompt(skill, task, skill_instructions, subagent_id)
 
-When complete, output:
----SUBAGENT-RESULT-START---
-[Your final result here]
----SUBAGENT-RESULT-END---
-"""
+    # Identical request against an identical tree: reuse the earlier result
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key(build_prompt(skill, task, skill_instructions, "<id>"), yolo, repo_root)
+        hit = cache.get(cache_key) if cache_key else None
+        if hit is not None:
+            return hit
 
     # Build command
     cmd = ["gemini"]
@@ -107,6 +380,8 @@ When complete, output:
 
     # Execute subagent
     start_time = time.time()
+    scanner = MarkerScanner()
+    stderr_tail = TailBuffer()
 
     try:
         with open(log_file, "w", encoding="utf-8") as log:
@@ -117,55 +392,74 @@ When complete, output:
             log.write(f"Task: {task}\n\n")
             log.write("=== PROMPT ===\n")
             log.write(prompt)
-            log.write("\n\n=== EXECUTION ===\n")
+            log.write("\n\n=== EXECUTION (stderr lines prefixed with [stderr]) ===\n")
             log.flush()
 
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                input=prompt,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 cwd=repo_root,
-                timeout=600,  # 10 minute timeout
-                shell=True,  # Required on Windows for .ps1/.cmd scripts
+                # Required on Windows for .ps1/.cmd scripts; on POSIX it would drop the arguments
+                shell=os.name == "nt",
+                **NEW_GROUP,
             )
+            lock = threading.Lock()
+            threads = [
+                threading.Thread(target=_feed_prompt, args=(proc.stdin, prompt), daemon=True),
+                threading.Thread(target=_pump, args=(proc.stdout, log, lock, "", [scanner.feed]), daemon=True),
+                threading.Thread(target=_pump, args=(proc.stderr, log, lock, "[stderr] ", [stderr_tail.feed]), daemon=True),
+            ]
+            for thread in threads:
+                thread.start()
+
+            timed_out = False
+            try:
+                proc.wait(timeout=timeout_s)
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                _kill_tree(proc)
+                proc.wait()
+            for thread in threads:
+                thread.join(timeout=5)  # A grandchild holding the pipes open mustn't hang us
 
             duration_s = time.time() - start_time
-
-            log.write("\n=== STDOUT ===\n")
-            log.write(result.stdout)
-            log.write("\n=== STDERR ===\n")
-            log.write(result.stderr)
-            log.write(f"\n=== EXIT CODE: {result.returncode} ===\n")
-            log.write(f"=== DURATION: {duration_s:.2f}s ===\n")
-
-        # Extract final result from markers
-        output = result.stdout
-        if "---SUBAGENT-RESULT-START---" in output:
-            parts = output.split("---SUBAGENT-RESULT-START---", 1)
-            if len(parts) > 1:
-                result_part = parts[1].split("---SUBAGENT-RESULT-END---", 1)
-                output = result_part[0].strip()
-
-        return {
-            "success": result.returncode == 0,
+            with lock:
+                log.write(f"\n=== EXIT CODE: {proc.returncode} ===\n")
+                log.write(f"=== DURATION: {duration_s:.2f}s ===\n")
+
+        if timed_out:
+            return {
+                "success": False,
+                "output": "",
+                "error": f"Subagent timed out after {duration_s:.0f}s",
+                "log_file": str(log_file),
+                "duration_s": duration_s,
+                "subagent_id": subagent_id,
+            }
+
+        # The text between the result markers, or the end of stdout if there were none
+        output = scanner.result()
+        if output is None:
+            output = scanner.tail.text()
+
+        result = {
+            "success": proc.returncode == 0,
             "output": output,
-            "error": result.stderr if result.returncode != 0 else "",
+            "error": stderr_tail.text() if proc.returncode != 0 else "",
             "log_file": str(log_file),
             "duration_s": duration_s,
             "subagent_id": subagent_id,
+            "cached": False,
         }
+        if cache_key and result["success"]:
+            # Only under the tree as the subagent left it: the tree it started
+            # from may come back (edits reverted), and then it has to run again
+            after = cache.key(build_prompt(skill, task, skill_instructions, "<id>"), yolo, repo_root)
+            cache.put(after, result)
+        return result
 
-    except subprocess.TimeoutExpired:
-        duration_s = time.time() - start_time
-        return {
-            "success": False,
-            "output": "",
-            "error": f"Subagent timed out after {duration_s:.0f}s",
-            "log_file": str(log_file),
-            "duration_s": duration_s,
-            "subagent_id": subagent_id,
-        }
     except Exception as e:
         duration_s = time.time() - start_time
         return {
@@ -178,20 +472,134 @@ When complete, output:
         }
 
 
+def load_plan(path: str) -> list[list[dict[str, Any]]]:
+    """
+    Load a fan-out plan and return its batches.
+
+    The plan is JSON, from a file or "-" for stdin. Either a list of batches or
+    {"batches": [...]}; each batch is a list of tasks like
+    {"id": "step-1", "skill": "tdd", "task": "...", "timeout_s": 300}.
+    "id" and "timeout_s" are optional.
+    """
+    text = sys.stdin.read() if path == "-" else Path(path).read_text(encoding="utf-8")
+    plan = json.loads(text)
+    batches = plan.get("batches") if isinstance(plan, dict) else plan
+    if not isinstance(batches, list) or not all(isinstance(batch, list) for batch in batches):
+        raise ValueError("plan must be a list of batches (lists of tasks)")
+
+    seen = set()
+    for b, batch in enumerate(batches, 1):
+        for t, task in enumerate(batch, 1):
+            if not isinstance(task, dict) or not task.get("skill") or not task.get("task"):
+                raise ValueError(f"batch {b}, task {t}: needs 'skill' and 'task'")
+            task.setdefault("id", f"batch{b}-task{t}")
+            if task["id"] in seen:
+                raise ValueError(f"duplicate task id: {task['id']}")
+            seen.add(task["id"])
+    return batches
+
+
+def run_plan(
+    batches: list[list[dict[str, Any]]],
+    repo_root: Path,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout_s: float = DEFAULT_TIMEOUT_S,
+    yolo: bool = True,
+    keep_going: bool = False,
+    cache: Optional[ResultCache] = None,
+) -> dict[str, Any]:
+    """
+    Run batches in order, each with at most max_workers subagents at a time.
+
+    A failed task stops the plan after its batch (later batches depend on it)
+    unless keep_going is set; the tasks that never ran are listed as skipped.
+
+    Returns:
+        dict with keys: success, batches, skipped, duration_s
+    """
+    start_time = time.time()
+    report: dict[str, Any] = {"success": True, "batches": [], "skipped": [], "duration_s": 0}
+
+    def run_task(task: dict[str, Any]) -> dict[str, Any]:
+        result = spawn_subagent(
+            skill=task["skill"],
+            task=task["task"],
+            repo_root=repo_root,
+            yolo=yolo,
+            output_format="json",
+            timeout_s=task.get("timeout_s", timeout_s),
+            cache=cache,
+        )
+        return {"id": task["id"], "skill": task["skill"], **result}
+
+    for number, batch in enumerate(batches, 1):
+        if not report["success"] and not keep_going:
+            report["skipped"].extend(task["id"] for task in batch)
+            continue
+        batch_start = time.time()
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batch) or 1))) as pool:
+            results = list(pool.map(run_task, batch))
+        report["batches"].append({
+            "batch": number,
+            "success": all(r["success"] for r in results),
+            "results": results,
+            "duration_s": time.time() - batch_start,
+        })
+        report["success"] = report["success"] and report["batches"][-1]["success"]
+
+    report["duration_s"] = time.time() - start_time
+    return report
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Spawn a Gemini CLI subagent for parallel execution"
     )
     parser.add_argument(
         "--skill",
-        required=True,
         help="Skill to use (tdd, debug, review, rest-automation, python-automation)",
     )
     parser.add_argument(
         "--task",
-        required=True,
         help="Task description for the subagent",
     )
+    parser.add_argument(
+        "--plan",
+        help="Fan-out mode: JSON plan of task batches (a file, or - for stdin)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Fan-out mode: subagents running at once (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT_S,
+        help=f"Seconds per subagent, unless a plan task sets timeout_s (default: {DEFAULT_TIMEOUT_S})",
+    )
+    parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="Fan-out mode: run later batches even if a task failed",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse the result of an identical earlier run on an unchanged tree (also: {CACHE_ENV}=1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the subagent, even if the cache is enabled",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL_S,
+        help=f"Seconds a cached result stays valid (default: {DEFAULT_CACHE_TTL_S})",
+    )
     parser.add_argument(
         "--no-yolo",
         action="store_true",
@@ -206,6 +614,27 @@ def main() -> int:
     args = parser.parse_args()
 
     repo_root = find_repo_root(Path.cwd())
+    cache = cache_from_args(args, repo_root)
+
+    if args.plan:
+        try:
+            batches = load_plan(args.plan)
+        except (OSError, ValueError) as e:
+            parser.error(f"invalid plan: {e}")
+        report = run_plan(
+            batches,
+            repo_root,
+            max_workers=args.max_workers,
+            timeout_s=args.timeout,
+            yolo=not args.no_yolo,
+            keep_going=args.keep_going,
+            cache=cache,
+        )
+        print(json.dumps(report, indent=2))
+        return 0 if report["success"] else 1
+
+    if not args.skill or not args.task:
+        parser.error("--skill and --task are required (or use --plan)")
 
     if args.output_format == "text":
         print(f"🤖 Spawning subagent: {args.skill}")
@@ -217,6 +646,8 @@ def main() -> int:
         repo_root=repo_root,
         yolo=not args.no_yolo,
         output_format=args.output_format,
+        timeout_s=args.timeout,
+        cache=cache,
     )
 
     if args.output_format == "json":
@@ -224,7 +655,8 @@ def main() -> int:
         return 0 if result["success"] else 1
 
     # Text output
-    print(f"\n{'✅' if result['success'] else '❌'} Subagent completed in {result['duration_s']:.1f}s")
+    print(f"\n{'✅' if result['success'] else '❌'} Subagent completed in {result['duration_s']:.1f}s"
+          f"{' (cached result)' if result.get('cached') else ''}")
     print(f"📝 Full log: {result['log_file']}")
 
     if result["success"]:
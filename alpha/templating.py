@@ -0,0 +1,157 @@
+"""Small template engine for generated project files.
+
+Templates live in ``alpha/file_templates`` (or are ``.tmpl`` files inside a
+stack template folder) and support variables and conditionals::
+
+    FROM {{ base }}
+    {% if family == "node" %}
+    RUN npm install
+    {% elif not slim %}
+    RUN apt-get update
+    {% else %}
+    ...
+    {% endif %}
+
+Conditions are ``name``, ``not name`` or ``name == "literal"`` (also ``!=``);
+names may be dotted to reach into dicts. A block tag alone on its line
+removes the whole line, so tags don't leave blank lines behind.
+
+Each template is parsed and compiled to a Python function once, then cached
+keyed on its path and modification time. ``render_files`` renders a batch of
+files in memory before writing them all out.
+"""
+import ast
+import re
+from pathlib import Path
+from alpha.utils import get_resource_path
+
+TEMPLATES_DIR = "alpha/file_templates"
+TEMPLATE_SUFFIX = ".tmpl"
+
+# A block tag alone on its line (eats the line), a block tag, or a variable
+TOKEN_RE = re.compile(r"^[ \t]*(\{%.*?%\})[ \t]*(?:\n|\Z)|(\{%.*?%\})|(\{\{.*?\}\})", re.MULTILINE)
+NAME_RE = re.compile(r"^[A-Za-z_][\w.]*$")
+CONDITION_RE = re.compile(r"""^(not\s+)?([A-Za-z_][\w.]*)(?:\s*(==|!=)\s*("[^"]*"|'[^']*'))?$""")
+
+_cache = {}
+
+
+class TemplateError(ValueError):
+    pass
+
+
+class Template:
+    def __init__(self, source, name="<string>"):
+        self.name = name
+        self._render = _compile(source, name)
+
+    def render(self, context):
+        return self._render(context, self._lookup)
+
+    def _lookup(self, context, dotted):
+        value = context
+        for part in dotted.split("."):
+            try:
+                value = value[part]
+            except (KeyError, TypeError):
+                raise TemplateError(f"{self.name}: undefined variable '{dotted}'") from None
+        return value
+
+
+def _condition(expr, name, line):
+    match = CONDITION_RE.match(expr)
+    if not match:
+        raise TemplateError(f"{name}:{line}: invalid condition '{expr}'")
+    negate, var, op, literal = match.groups()
+    code = f"lookup(ctx, {var!r})"
+    if op:
+        code = f"({code} {op} {ast.literal_eval(literal)!r})"
+    return f"not {code}" if negate else code
+
+
+def _compile(source, name):
+    """Translate a template into the source of a Python function and compile it."""
+    code = ["def render(ctx, lookup):", "    out = []", "    append = out.append"]
+    depth = 1
+    blocks = []  # Open if-blocks, with the line each was opened on
+    pos = 0
+
+    def emit(statement):
+        code.append("    " * depth + statement)
+
+    for match in TOKEN_RE.finditer(source):
+        if match.start() > pos:
+            emit(f"append({source[pos:match.start()]!r})")
+        pos = match.end()
+        line = source.count("\n", 0, match.start()) + 1
+        tag = match.group(1) or match.group(2)
+
+        if match.group(3):
+            var = match.group(3)[2:-2].strip()
+            if not NAME_RE.match(var):
+                raise TemplateError(f"{name}:{line}: invalid variable '{var}'")
+            emit(f"append(str(lookup(ctx, {var!r})))")
+            continue
+
+        words = tag[2:-2].strip().split(None, 1)
+        keyword = words[0] if words else ""
+        arg = words[1] if len(words) > 1 else ""
+        if keyword == "if":
+            emit(f"if {_condition(arg, name, line)}:")
+            blocks.append(line)
+            depth += 1
+            emit("pass")
+        elif keyword in ("elif", "else", "endif"):
+            if not blocks:
+                raise TemplateError(f"{name}:{line}: '{keyword}' without 'if'")
+            depth -= 1
+            if keyword == "endif":
+                blocks.pop()
+                continue
+            emit(f"elif {_condition(arg, name, line)}:" if keyword == "elif" else "else:")
+            depth += 1
+            emit("pass")
+        else:
+            raise TemplateError(f"{name}:{line}: unknown tag '{tag}'")
+
+    if blocks:
+        raise TemplateError(f"{name}:{blocks[-1]}: 'if' is never closed")
+    if pos < len(source):
+        emit(f"append({source[pos:]!r})")
+    code.append("    return ''.join(out)")
+
+    namespace = {}
+    exec(compile("\n".join(code), f"<template {name}>", "exec"), namespace)
+    return namespace["render"]
+
+
+def load(path):
+    """Return the compiled template for a file, compiling it only when it changed."""
+    path = Path(path)
+    stat = path.stat()
+    key = str(path.absolute())
+    cached = _cache.get(key)
+    if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        return cached[1]
+    template = Template(path.read_text(encoding="utf-8"), name=path.name)
+    _cache[key] = ((stat.st_mtime_ns, stat.st_size), template)
+    return template
+
+
+def get_template(name):
+    """A bundled template from alpha/file_templates, e.g. ``Dockerfile.tmpl``."""
+    return load(get_resource_path(TEMPLATES_DIR) / name)
+
+
+def render_files(jobs):
+    """Render (template, context, destination) jobs, then write them all.
+
+    Everything is rendered before anything is written, so a template error
+    doesn't leave half of the files behind.
+    """
+    rendered = [(Path(dest), template.render(context)) for template, context, dest in jobs]
+    for parent in {dest.parent for dest, _ in rendered}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for dest, text in rendered:
+        with open(dest, "w", encoding="utf-8", newline="\n") as f:
+            f.write(text)
@@ -0,0 +1,135 @@
+"""Where the external tools are, and which versions.
+
+Stacks declare the tools they shell out to in commands.json::
+
+    "nextjs": {"requires": ["node", "npm"], ...}
+
+(stacks without ``requires`` get it derived from their commands).
+``check()`` runs before a generation starts, so a missing tool fails in
+milliseconds instead of minutes into an install. It only searches PATH.
+
+``probe()`` also asks each tool for its version, all tools in parallel.
+Results are cached in ``<data dir>/toolchain.json`` for CACHE_TTL_S and
+thrown away when PATH changes; a tool is probed again early when its
+executable disappears or a missing one shows up.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from alpha.utils import get_data_dir
+
+TOOLS = ("python", "node", "npm", "git", "docker")
+CACHE_TTL_S = 6 * 60 * 60
+PROBE_TIMEOUT_S = 15
+
+INSTALL_HINTS = {
+    "node": "https://nodejs.org",
+    "npm": "https://nodejs.org",
+    "python": "https://www.python.org/downloads/",
+    "git": "https://git-scm.com/downloads",
+    "docker": "https://docs.docker.com/get-docker/",
+}
+
+
+class MissingToolError(RuntimeError):
+    def __init__(self, missing, what=None):
+        self.missing = missing
+        hints = "; ".join(f"{tool}: {INSTALL_HINTS[tool]}" for tool in missing if tool in INSTALL_HINTS)
+        super().__init__(f"{what + ' needs' if what else 'Missing'} {', '.join(missing)}, not found on PATH"
+                         + (f" ({hints})" if hints else ""))
+
+
+def required_tools(stack_cmd):
+    """Tools a stack needs: its ``requires`` list, or a guess from its commands."""
+    if "requires" in stack_cmd:
+        return list(stack_cmd["requires"])
+    from alpha.commands import command_text
+    text = command_text(stack_cmd)
+    tools = []
+    if "npm" in text or "npx" in text:
+        tools += ["node", "npm"]
+    if "python" in text or "venv" in text:
+        tools.append("python")
+    return tools
+
+
+def missing(tools):
+    return [tool for tool in tools if shutil.which(tool) is None]
+
+
+def check(tools, what=None):
+    """Raise MissingToolError unless every tool is on PATH."""
+    absent = missing(tools)
+    if absent:
+        raise MissingToolError(absent, what)
+
+
+class Toolchain:
+    def __init__(self, cache_path=None, ttl_s=CACHE_TTL_S):
+        self.cache_path = cache_path or get_data_dir() / "toolchain.json"
+        self.ttl_s = ttl_s
+
+    @staticmethod
+    def _path_key():
+        return hashlib.sha256(os.environ.get("PATH", "").encode("utf-8")).hexdigest()[:16]
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("path_key") != self._path_key() or time.time() - data.get("probed_at", 0) > self.ttl_s:
+            return {}
+        return data.get("tools", {})
+
+    def _save(self, tools):
+        data = {"path_key": self._path_key(), "probed_at": time.time(), "tools": tools}
+        tmp = self.cache_path.with_name(f"{self.cache_path.name}.{uuid.uuid4().hex}")
+        try:
+            with open(tmp, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            logging.warning(f"Could not cache toolchain probe: {e}")
+
+    def probe(self, tools=TOOLS, refresh=False):
+        """{tool: {"path": ..., "version": ...}} (None for missing tools)."""
+        cached = {} if refresh else self._load()
+        stale = [tool for tool in tools if tool not in cached or self._moved(tool, cached[tool]["path"])]
+        if stale:
+            with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+                for tool, info in zip(stale, pool.map(self._probe_one, stale)):
+                    cached[tool] = info
+            self._save(cached)
+        return {tool: cached[tool] for tool in tools}
+
+    @staticmethod
+    def _moved(tool, path):
+        """A cached tool that was uninstalled, or a missing one that was installed since."""
+        return not os.path.exists(path) if path else shutil.which(tool) is not None
+
+    def versions(self, tools=TOOLS):
+        return {tool: info["version"] for tool, info in self.probe(tools).items()}
+
+    @staticmethod
+    def _probe_one(tool):
+        path = shutil.which(tool)
+        if path is None:
+            return {"path": None, "version": None}
+        try:
+            result = subprocess.run([path, "--version"], capture_output=True, text=True, check=True,
+                                    timeout=PROBE_TIMEOUT_S)
+            # Python 2 and some builds print the version on stderr
+            lines = (result.stdout or result.stderr).strip().splitlines()
+            version = lines[0] if lines else None
+        except (OSError, subprocess.SubprocessError) as e:
+            logging.warning(f"Could not get the version of {tool} ({path}): {e}")
+            version = None
+        return {"path": path, "version": version}
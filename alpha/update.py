@@ -1,10 +1,9 @@
 """Auto-update checker for GitHub releases."""
-import sys
-import requests
 import webbrowser
 from PyQt6.QtWidgets import QMessageBox, QApplication
 from PyQt6.QtCore import QThread, pyqtSignal
-from alpha.version import __version__, GITHUB_REPO
+from alpha.version import __version__
+from alpha.releases import check_latest, is_newer
 
 
 class UpdateChecker(QThread):
@@ -14,61 +13,24 @@ class UpdateChecker(QThread):
 
     def run(self):
         try:
-            url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                latest_tag = data.get("tag_name", "").lstrip("v")
-                html_url = data.get("html_url", "")
-                
-                if self._is_newer(latest_tag, __version__):
-                    self.update_available.emit(latest_tag, html_url)
-                else:
-                    self.no_update.emit()
-            else:
-                self.no_update.emit()
+            is_update, latest_tag, html_url = check_latest(__version__)
         except Exception:
+            is_update = False
+
+        if is_update:
+            self.update_available.emit(latest_tag, html_url)
+        else:
             self.no_update.emit()
 
     def _is_newer(self, latest, current):
-        try:
-            # Semantic versioning check (x.y.z)
-            l_parts = [int(x) for x in latest.split(".")]
-            c_parts = [int(x) for x in current.split(".")]
-            return l_parts > c_parts
-        except:
-            return False
-
-
-def check_for_updates_blocking():
-    """
-    Synchronous update check. Returns (is_update_available, version, url).
-    Used at startup before showing main window.
-    """
-    try:
-        url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            latest_tag = data.get("tag_name", "").lstrip("v")
-            html_url = data.get("html_url", "")
-            
-            # Compare versions
-            l_parts = [int(x) for x in latest_tag.split(".")]
-            c_parts = [int(x) for x in __version__.split(".")]
-            
-            if l_parts > c_parts:
-                return True, latest_tag, html_url
-    except Exception:
-        pass
-    
-    return False, None, None
+        return is_newer(latest, current)
 
 
 def show_forced_update_dialog(version, url):
     """
     Show a forced update dialog. User MUST update.
-    After clicking OK, opens browser and exits app.
+    After clicking OK, opens browser. The caller is responsible for quitting
+    the app (this may run from a signal slot, where sys.exit can't be used).
     """
     msg = QMessageBox()
     msg.setWindowTitle("Update Required")
@@ -84,9 +46,8 @@ def show_forced_update_dialog(version, url):
     
     msg.exec()
     
-    # Open browser and exit
+    # Open browser
     webbrowser.open(url)
-    sys.exit(0)
 
 
 def show_optional_update_dialog(parent, version, url):
@@ -1,4 +1,5 @@
-"""Utility functions for resource path resolution."""
+"""Utility functions for resource and data path resolution."""
+import os
 import sys
 from pathlib import Path
 
@@ -18,3 +19,23 @@ def get_resource_path(relative_path: str) -> Path:
         base_path = Path(__file__).parent.parent
     
     return base_path / relative_path
+
+
+def get_data_dir() -> Path:
+    """
+    Get the per-user directory where ALPHA keeps caches and local state.
+    
+    Override with the ALPHA_HOME environment variable, otherwise uses
+    %LOCALAPPDATA%\\ALPHA on Windows and $XDG_DATA_HOME/alpha (~/.local/share/alpha)
+    elsewhere. The directory is created on first use.
+    """
+    override = os.environ.get("ALPHA_HOME")
+    if override:
+        base_path = Path(override)
+    elif os.name == 'nt':
+        base_path = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "ALPHA"
+    else:
+        base_path = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "alpha"
+    
+    base_path.mkdir(parents=True, exist_ok=True)
+    return base_path
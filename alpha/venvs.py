@@ -0,0 +1,180 @@
+"""Golden virtualenvs for the Python stacks.
+
+Building a venv and pip-installing the same requirements for every new project
+is the slowest part of the django/fastapi/pyqt6 stacks. Instead, one "golden"
+venv is built per unique requirement set and cloned into projects: files are
+hardlinked where possible and only the files that embed the venv's absolute
+path (scripts, launchers, pyvenv.cfg) are copied and rewritten.
+"""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from alpha.utils import get_data_dir
+from alpha.artifacts import ArtifactCache
+
+BIN_DIR = "Scripts" if os.name == 'nt' else "bin"
+PYTHON_EXE = "python.exe" if os.name == 'nt' else "python"
+
+# Files outside BIN_DIR that may embed the venv path
+FIXUP_SUFFIXES = (".pth", ".cfg")
+
+LOCK_STALE_S = 30 * 60
+
+
+def normalize_requirements(requirements):
+    return sorted({r.strip().lower() for r in requirements if r.strip()})
+
+
+def python_version(python="python"):
+    """Full version string of the interpreter used to build venvs."""
+    result = subprocess.run(
+        [python, "-c", "import sys; print(sys.version)"],
+        capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip()
+
+
+@contextlib.contextmanager
+def _file_lock(path, timeout=LOCK_STALE_S):
+    """Cross-platform exclusive lock based on O_EXCL lock files."""
+    start = time.time()
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > LOCK_STALE_S:
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue
+            if time.time() - start > timeout:
+                raise TimeoutError(f"Timed out waiting for lock {path}")
+            time.sleep(0.2)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+
+class GoldenVenvStore:
+    """Builds golden venvs on demand and clones them into projects.
+
+    Layout: ``<root>/<key>/venv`` is the golden venv, ``<root>/<key>/meta.json``
+    is written once it is complete.
+    """
+
+    def __init__(self, root=None, python="python"):
+        self.root = Path(root) if root else get_data_dir() / "venvs"
+        self.python = python
+
+    def key(self, requirements):
+        payload = json.dumps({
+            "requirements": normalize_requirements(requirements),
+            "python": python_version(self.python),
+            "platform": os.name,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+    def has(self, requirements):
+        """Whether the golden venv for a requirement set is already built."""
+        return (self.root / self.key(requirements) / "meta.json").exists()
+
+    def ensure(self, requirements, run=None, artifacts=None):
+        """Return the golden venv for a requirement set, building it if needed.
+
+        `run(argv)` runs the build commands (default: subprocess.run with the
+        artifact cache's env), so a caller can make them stoppable.
+        """
+        return self._ensure(requirements, run, artifacts)[0]
+
+    def _ensure(self, requirements, run=None, artifacts=None):
+        """(golden venv dir, whether it had to be built)."""
+        entry = (self.root / self.key(requirements)).absolute()
+        venv_dir = entry / "venv"
+        if (entry / "meta.json").exists():
+            return venv_dir, False
+
+        artifacts = artifacts or ArtifactCache()
+        run = run or (lambda argv: subprocess.run(argv, check=True, env=artifacts.env()))
+        entry.mkdir(parents=True, exist_ok=True)
+        with _file_lock(entry / ".lock"):
+            if (entry / "meta.json").exists():
+                return venv_dir, False  # Built by another process while we waited
+
+            # The venv is built in place: moving a venv would break its paths
+            shutil.rmtree(venv_dir, ignore_errors=True)
+            logging.info(f"Building golden venv {entry.name} for {requirements}")
+            run([self.python, "-m", "venv", str(venv_dir)])
+            reqs = normalize_requirements(requirements)
+            artifacts.pip_install(str(venv_dir / BIN_DIR / PYTHON_EXE), reqs, run)
+
+            with open(entry / "meta.json", "w") as f:
+                json.dump({"requirements": reqs, "created": time.time()}, f, indent=2)
+        return venv_dir, True
+
+    def clone(self, requirements, destination):
+        """Clone the golden venv for requirements into destination.
+
+        Returns True if the golden venv was already built (a cache hit).
+        """
+        golden, built = self._ensure(requirements)
+        clone_venv(golden, Path(destination))
+        return not built
+
+
+def _needs_fixup(rel_path):
+    return rel_path.parts[0] == BIN_DIR or rel_path.name == "pyvenv.cfg" or rel_path.suffix in FIXUP_SUFFIXES
+
+
+def clone_venv(source, destination):
+    """Hardlink-clone a venv and rewrite files that embed its absolute path."""
+    source = Path(source).absolute()
+    destination = Path(destination).absolute()
+    old = str(source).encode()
+    new = str(destination).encode()
+    linked = copied = 0
+
+    for dirpath, dirnames, filenames in os.walk(source):
+        rel_dir = Path(dirpath).relative_to(source)
+        (destination / rel_dir).mkdir(parents=True, exist_ok=True)
+
+        for name in dirnames + filenames:
+            src = Path(dirpath) / name
+            dst = destination / rel_dir / name
+            if src.is_symlink():
+                target = os.readlink(src)
+                if target.startswith(str(source)):
+                    target = str(destination) + target[len(str(source)):]
+                os.symlink(target, dst)
+                if name in dirnames:
+                    dirnames.remove(name)  # Don't walk into symlinked dirs
+                continue
+            if name in dirnames:
+                continue
+
+            if _needs_fixup(rel_dir / name):
+                data = src.read_bytes()
+                if old in data:
+                    dst.write_bytes(data.replace(old, new))
+                    shutil.copymode(src, dst)
+                    copied += 1
+                    continue
+            try:
+                os.link(src, dst)
+                linked += 1
+            except OSError:
+                # Different filesystem or no hardlink support
+                shutil.copy2(src, dst)
+                copied += 1
+
+    logging.info(f"Cloned venv into {destination} ({linked} hardlinked, {copied} copied)")
@@ -1,112 +1,98 @@
 import sys
 import time
-from PyQt6.QtWidgets import QApplication, QDialog, QVBoxLayout, QLabel, QProgressBar
+import logging
+from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import Qt, QTimer
-from alpha.gui import AlphaInitializerWindow
+from PyQt6.QtCore import Qt
 from alpha.splash import AlphaSplashScreen
 from alpha.utils import get_resource_path
-from alpha.update import check_for_updates_blocking, show_forced_update_dialog
-
-
-class UpdateCheckDialog(QDialog):
-    """Loading dialog shown while checking for updates."""
-    
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("ALPHA Init")
-        self.setFixedSize(300, 100)
-        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.FramelessWindowHint)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1E1E1E;
-                border: 2px solid #A020F0;
-                border-radius: 10px;
-            }
-            QLabel {
-                color: white;
-                font-size: 14px;
-            }
-            QProgressBar {
-                background-color: #2D2D2D;
-                border: none;
-                border-radius: 3px;
-                height: 6px;
-            }
-            QProgressBar::chunk {
-                background-color: #A020F0;
-                border-radius: 3px;
-            }
-        """)
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        self.label = QLabel("Checking for updates...")
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.label)
-        
-        self.progress = QProgressBar()
-        self.progress.setRange(0, 0)  # Indeterminate
-        layout.addWidget(self.progress)
+from alpha.update import UpdateChecker, show_forced_update_dialog
+
+def create_splash():
+    icon_path = get_resource_path("alpha/resources/icon.png")
+    if not icon_path.exists():
+        return None
+
+    pixmap = QPixmap(str(icon_path))
+    if pixmap.isNull():
+        return None
+
+    # Basic Scaling
+    if pixmap.width() > 500:
+        pixmap = pixmap.scaled(500, 500, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+    splash = AlphaSplashScreen(pixmap)
+    splash.show()
+    return splash
+
+
+def startup(app, splash=None):
+    """Does the real startup work and returns the (not yet shown) main window.
+
+    Splash progress follows the actual steps instead of fixed delays.
+    """
+    def report(progress, msg):
+        if splash:
+            splash.set_progress(progress)
+            splash.showMessage(msg, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft, Qt.GlobalColor.white)
+        app.processEvents()
+
+    report(10, "Loading configuration...")
+    from alpha.initializer import ProjectInitializer
+    initializer = ProjectInitializer()
+
+    report(30, "Checking toolchain...")
+    from alpha import toolchain
+    missing_tools = toolchain.missing(toolchain.TOOLS)
+
+    report(60, "Initializing UI components...")
+    from alpha.gui import AlphaInitializerWindow
+    window = AlphaInitializerWindow(initializer=initializer)
+
+    if missing_tools:
+        window.statusBar().showMessage(f"Not found on PATH: {', '.join(missing_tools)}")
+
+    report(100, "Ready!")
+    return window
 
 
 def main():
+    start = time.perf_counter()
     app = QApplication(sys.argv)
-    
-    # ===== SHOW UPDATE CHECK DIALOG =====
-    update_dialog = UpdateCheckDialog()
-    update_dialog.show()
-    app.processEvents()  # Ensure dialog is displayed
-    
-    # Perform update check (blocking, but dialog is visible)
-    is_update, new_version, release_url = check_for_updates_blocking()
-    
-    # Close the update dialog
-    update_dialog.close()
-    
-    if is_update:
-        # Force update - show dialog, open browser, exit
-        show_forced_update_dialog(new_version, release_url)
-        return  # Won't reach here, sys.exit called in dialog
-    
+
     # ===== SPLASH SCREEN =====
-    icon_path = get_resource_path("alpha/resources/icon.png")
-    splash = None
-    
-    if icon_path.exists():
-        pixmap = QPixmap(str(icon_path))
-        if not pixmap.isNull():
-             # Basic Scaling
-             if pixmap.width() > 500:
-                 pixmap = pixmap.scaled(500, 500, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            
-             # Create Custom Splash
-             splash = AlphaSplashScreen(pixmap)
-             splash.show()
-             
-             # Simulate Loading Steps
-             steps = [
-                 (10, "Loading configuration..."),
-                 (30, "Checking dependencies..."),
-                 (60, "Initializing UI components..."),
-                 (90, "Preparing workspace..."),
-                 (100, "Ready!")
-             ]
-             
-             for progress, msg in steps:
-                 splash.set_progress(progress)
-                 splash.showMessage(msg, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft, Qt.GlobalColor.white)
-                 app.processEvents()
-                 time.sleep(0.3)  # Fake delay
+    splash = create_splash()
+    app.processEvents()
+
+    # ===== UPDATE CHECK (background) =====
+    # Runs alongside startup; a newer release forces the update dialog
+    # whenever it is found, so the network never delays the first window.
+    forced_update = []
+
+    def on_update_available(version, url):
+        forced_update.append(version)
+        if splash:
+            splash.close()
+        show_forced_update_dialog(version, url)
+        app.quit()
+
+    update_checker = UpdateChecker()
+    update_checker.update_available.connect(on_update_available)
+    app.aboutToQuit.connect(update_checker.wait)
+    update_checker.start()
 
     # ===== MAIN WINDOW =====
-    window = AlphaInitializerWindow()
+    window = startup(app, splash)
+    if forced_update:
+        # Update was found while starting up; don't enter the event loop
+        update_checker.wait()
+        return
     window.show()
-    
+
     if splash:
         splash.finish(window)
-        
+
+    logging.info(f"Time to interactive: {time.perf_counter() - start:.2f}s")
     sys.exit(app.exec())
 
 if __name__ == "__main__":
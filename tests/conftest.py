@@ -0,0 +1,20 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path_factory, monkeypatch):
+    """Keep caches and local state written during tests out of the real user directory."""
+    monkeypatch.setenv("ALPHA_HOME", str(tmp_path_factory.mktemp("alpha_home")))
+
+
+@pytest.fixture
+def popen():
+    """Fake spawning: commands started through ProjectInitializer._run_command succeed at once.
+
+    subprocess.run (git, tool probes) is faked too, as popen.run.
+    """
+    from unittest.mock import patch
+    with patch("alpha.initializer.subprocess.run") as run, patch("alpha.initializer.subprocess.Popen") as fake:
+        fake.return_value.returncode = 0
+        fake.run = run
+        yield fake
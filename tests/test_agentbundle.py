@@ -0,0 +1,59 @@
+import os
+import zipfile
+import pytest
+from alpha import agentbundle, gitbootstrap
+from alpha.utils import get_resource_path
+
+
+@pytest.fixture
+def folder(tmp_path):
+    root = tmp_path / "agent"
+    (root / "skills" / "__pycache__").mkdir(parents=True)
+    (root / "skills" / "__pycache__" / "x.pyc").write_bytes(b"\0")
+    (root / "skills" / "SKILL.md").write_text("# skill\n")
+    (root / "run.sh").write_text("#!/bin/sh\n")
+    (root / "run.sh").chmod(0o755)
+    return root
+
+
+def test_build_is_reproducible_and_skips_bytecode(tmp_path, folder):
+    first, second = tmp_path / "a.zip", tmp_path / "b.zip"
+    assert agentbundle.build(folder, first) == 2
+    os.utime(folder / "run.sh", (0, 0))
+    agentbundle.build(folder, second)
+    assert first.read_bytes() == second.read_bytes()
+    assert zipfile.ZipFile(first).namelist() == ["run.sh", "skills/SKILL.md"]
+
+
+def test_extract_round_trip(tmp_path, folder):
+    archive = tmp_path / "agent.zip"
+    agentbundle.build(folder, archive)
+    assert agentbundle.extract(archive, tmp_path / "out") == (2, 18)
+    assert (tmp_path / "out" / "skills" / "SKILL.md").read_text() == "# skill\n"
+    if os.name != "nt":
+        assert os.access(tmp_path / "out" / "run.sh", os.X_OK)
+    # The archive hashes to the same git tree as the folder it was built from
+    assert gitbootstrap.load_bundle(archive).tree == gitbootstrap.load_bundle(folder).tree
+
+
+def test_extract_refuses_paths_outside_dest(tmp_path):
+    archive = tmp_path / "evil.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("../escaped.txt", "x")
+    with pytest.raises(ValueError):
+        agentbundle.extract(archive, tmp_path / "out")
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_superpower_prefers_the_archive(tmp_path, monkeypatch):
+    from alpha import initializer
+    archive = tmp_path / "agent.zip"
+    agentbundle.build(get_resource_path(agentbundle.FOLDER), archive)
+    monkeypatch.setattr(initializer, "get_resource_path",
+                        lambda rel: archive if rel == agentbundle.ARCHIVE else get_resource_path(rel))
+    monkeypatch.setattr(initializer.ProjectInitializer, "_init_git_with_agent", lambda self, path, bundle: None)
+    project = tmp_path / "project"
+    project.mkdir()
+    initializer.ProjectInitializer()._apply_superpower_framework(project)
+    assert (project / ".agent" / "rules" / "superpowers.md").exists()
+    assert not list(project.rglob("__pycache__"))
@@ -0,0 +1,119 @@
+import subprocess
+import sys
+import time
+import zipfile
+import pytest
+from alpha.artifacts import ArtifactCache, wheel_name
+
+
+def _build_wheel(directory, name="alphademo", version="1.0"):
+    """A minimal pure-Python wheel, without needing setuptools/build."""
+    dist_info = f"{name}-{version}.dist-info"
+    path = directory / f"{name}-{version}-py3-none-any.whl"
+    files = {
+        f"{name}/__init__.py": "VALUE = 42\n",
+        f"{dist_info}/METADATA": f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n",
+        f"{dist_info}/WHEEL": "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+    }
+    with zipfile.ZipFile(path, "w") as zf:
+        for arcname, text in files.items():
+            zf.writestr(arcname, text)
+        zf.writestr(f"{dist_info}/RECORD", "".join(f"{n},,\n" for n in files) + f"{dist_info}/RECORD,,\n")
+    return path
+
+
+@pytest.fixture
+def stand_in_index(tmp_path):
+    """A PEP 503 simple index on disk, served through a file:// URL."""
+    project = tmp_path / "index" / "simple" / "alphademo"
+    project.mkdir(parents=True)
+    wheel = _build_wheel(project)
+    (project / "index.html").write_text(f'<html><body><a href="{wheel.name}">{wheel.name}</a></body></html>')
+    return (tmp_path / "index" / "simple").as_uri()
+
+
+def test_env_points_tools_at_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALPHA_PIP_INDEX_URL", "http://mirror.local/simple")
+    monkeypatch.setenv("ALPHA_NPM_REGISTRY", "http://npm.local/")
+    env = ArtifactCache(tmp_path, offline=True).env({})
+
+    assert env["PIP_FIND_LINKS"] == str(tmp_path / "wheels")
+    assert env["npm_config_cache"] == str(tmp_path / "npm")
+    assert env["PIP_INDEX_URL"] == "http://mirror.local/simple"
+    assert env["npm_config_registry"] == "http://npm.local/"
+    assert env["PIP_NO_INDEX"] == "1" and env["npm_config_offline"] == "true"
+    assert "PIP_NO_INDEX" not in ArtifactCache(tmp_path, offline=False).env({})
+
+
+def test_cache_is_preferred_only_while_fresh(tmp_path, monkeypatch):
+    cache = ArtifactCache(tmp_path, offline=False, max_age_s=60)
+    assert "npm_config_prefer_offline" not in cache.env({})
+    assert cache.npm_revalidating
+
+    cache.mark_npm_fresh()
+    assert cache.env({})["npm_config_prefer_offline"] == "true"
+
+    cache.wheelhouse.mkdir()
+    (cache.wheelhouse / "django-5.0-py3-none-any.whl").touch()
+    assert not cache.wheels_current(["django"])
+    cache.mark_wheels_fresh(["Django"])
+    assert cache.wheels_current(["django"])
+
+    # Past max_age_s, metadata and wheels are fetched again
+    later = time.time() + 61
+    monkeypatch.setattr("alpha.artifacts.time.time", lambda: later)
+    assert "npm_config_prefer_offline" not in cache.env({})
+    assert not cache.wheels_current(["django"])
+    assert ArtifactCache(tmp_path, offline=True).wheels_current(["django"])
+
+
+def test_stale_wheels_are_downloaded_again(tmp_path):
+    cache = ArtifactCache(tmp_path, offline=False)
+    cache.wheelhouse.mkdir()
+    (cache.wheelhouse / "django-4.0-py3-none-any.whl").touch()
+    commands = []
+    cache.pip_install("python", ["django"], commands.append)
+    assert [argv[3] for argv in commands] == ["wheel", "install"]
+
+    commands.clear()
+    cache.pip_install("python", ["django"], commands.append)
+    assert [argv[3] for argv in commands] == ["install"]
+
+
+def test_has_wheels_matches_normalized_names(tmp_path):
+    cache = ArtifactCache(tmp_path)
+    cache.wheelhouse.mkdir()
+    (cache.wheelhouse / "uvicorn_standard-0.1-py3-none-any.whl").touch()
+    assert wheel_name("Uvicorn.Standard") == "uvicorn_standard"
+    assert cache.has_wheels(["uvicorn-standard>=0.1"])
+    assert not cache.has_wheels(["django"])
+
+
+def test_cold_install_fills_wheelhouse_then_works_offline(tmp_path, monkeypatch, stand_in_index):
+    monkeypatch.setenv("ALPHA_PIP_INDEX_URL", stand_in_index)
+    target = tmp_path / "site"
+    commands = []
+
+    def run(cache):
+        def run_argv(argv):
+            commands.append(argv[3])
+            # Install into a plain directory instead of a (slow to create) venv
+            extra = ["--target", str(target), "--upgrade"] if argv[3] == "install" else []
+            subprocess.run(argv + extra, check=True, env=cache.env(), capture_output=True)
+        return run_argv
+
+    cache = ArtifactCache(tmp_path / "artifacts")
+    cache.pip_install(sys.executable, ["alphademo"], run(cache))
+    assert commands == ["wheel", "install"]
+    assert (target / "alphademo" / "__init__.py").exists()
+    assert cache.has_wheels(["alphademo"])
+
+    # Warm: no index needed at all
+    monkeypatch.setenv("ALPHA_PIP_INDEX_URL", (tmp_path / "missing").as_uri())
+    commands.clear()
+    offline = ArtifactCache(tmp_path / "artifacts", offline=True)
+    offline.pip_install(sys.executable, ["alphademo"], run(offline))
+    assert commands == ["install"]
+
+    with pytest.raises(RuntimeError):
+        offline.pip_install(sys.executable, ["not-cached"], run(offline))
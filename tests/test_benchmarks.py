@@ -0,0 +1,49 @@
+import json
+import pytest
+from tools.bench import run_suite, compare, run_report, load_config, main
+
+
+def _report(scale=1.0, **mins):
+    return {"meta": {"scale": scale}, "results": {name: {"min_s": s, "median_s": s} for name, s in mins.items()}}
+
+
+def test_suite_runs_at_small_scale():
+    report = run_suite(["generate_project", "copy_stack_template", "update_json_config", "docker_files"],
+                       repeat=1, scale=0.01)
+    for name, result in report["results"].items():
+        assert result["min_s"] > 0, name
+
+
+def test_compare_flags_only_real_regressions():
+    config = {"max_regression": 0.25, "min_delta_ms": 5, "benchmarks": {"startup": {"max_regression": 1.0}}}
+    baseline = _report(copy=0.100, tiny=0.001, startup=0.200)
+
+    current = _report(copy=0.200, tiny=0.003, startup=0.350)
+    problems = compare(current, baseline, config)
+    # tiny doubled but by less than min_delta_ms; startup is within its own allowance
+    assert len(problems) == 1 and problems[0].startswith("copy:")
+
+    assert compare(_report(copy=0.110), baseline, config) == []
+    with pytest.raises(ValueError, match="scale"):
+        compare(_report(scale=2.0, copy=0.1), baseline, config)
+
+
+def test_report_written_and_regression_exit_code(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_report(scale=0.01, docker_files=1e-9)))
+    config = tmp_path / "benchmarks.json"
+    config.write_text(json.dumps({"repeat": 1, "max_regression": 0.1, "min_delta_ms": 0}))
+    output = tmp_path / "results.json"
+
+    assert run_report(["docker_files"], scale=0.01, output=output,
+                      baseline_path=baseline, config_path=config) == 1
+    assert "docker_files" in json.loads(output.read_text())["results"]
+
+
+def test_repo_config_is_valid():
+    config = load_config()
+    assert config["repeat"] > 0 and config["max_regression"] > 0
+
+
+def test_unknown_benchmark_is_a_usage_error(tmp_path):
+    assert main(["no_such_benchmark", "-o", str(tmp_path / "out.json")]) == 2
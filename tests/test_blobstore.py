@@ -0,0 +1,112 @@
+import os
+import shutil
+import pytest
+from alpha.blobstore import TemplateStore
+from alpha.cli import main
+from alpha.initializer import ProjectInitializer
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TemplateStore(tmp_path / "store")
+
+
+def _template(root, variant):
+    (root / "assets").mkdir(parents=True)
+    (root / "assets" / "logo.png").write_bytes(b"\x89PNG" + b"x" * 10_000)
+    os.chmod(root / "assets" / "logo.png", 0o444)
+    (root / "shared.txt").write_text("same in every template")
+    (root / "variant.txt").write_text(variant)
+    (root / "app.py.tmpl").write_text('NAME = "{{ name }}"\n')
+
+
+def test_near_identical_templates_share_blobs(store, tmp_path):
+    for variant in ["a", "b", "c"]:
+        _template(tmp_path / variant, variant)
+        store.import_template(f"stack-{variant}", tmp_path / variant)
+
+    logical, physical = store.usage()
+    assert logical > 3 * 10_000
+    # logo, shared.txt and app.py.tmpl once, plus three one-byte variants
+    assert physical < logical / 2
+    assert store.names() == ["stack-a", "stack-b", "stack-c"]
+
+
+def test_materialize_copies_and_renders(store, tmp_path):
+    _template(tmp_path / "src", "a")
+    store.import_template("web", tmp_path / "src")
+
+    dest = tmp_path / "out" / "my-app"
+    store.materialize("web", dest)
+
+    # Every file is a private copy, read-only ones included
+    logo = dest / "assets" / "logo.png"
+    assert logo.read_bytes().startswith(b"\x89PNG")
+    assert logo.stat().st_nlink == 1
+    assert not logo.stat().st_mode & 0o222
+    os.chmod(logo, 0o644)
+    logo.write_bytes(b"edited")
+    (dest / "shared.txt").write_text("edited")
+    blobs = {e["path"]: store.blob_path(e["hash"]) for e in store.manifest("web")["files"]}
+    assert blobs["shared.txt"].read_text() == "same in every template"
+    assert blobs["assets/logo.png"].read_bytes().startswith(b"\x89PNG")
+    assert (dest / "app.py").read_text() == 'NAME = "my-app"\n'
+
+    # Materializing over an existing (read-only) copy works too
+    os.chmod(logo, 0o444)
+    store.materialize("web", dest)
+    assert logo.read_bytes().startswith(b"\x89PNG")
+
+
+def test_reimport_only_hashes_changed_files(store, tmp_path, monkeypatch):
+    _template(tmp_path / "src", "a")
+    store.import_template("web", tmp_path / "src")
+
+    (tmp_path / "src" / "variant.txt").write_text("changed")
+    hashed = []
+    import alpha.blobstore as blobstore
+    real = blobstore.hash_file
+    monkeypatch.setattr(blobstore, "hash_file", lambda p: hashed.append(os.path.basename(p)) or real(p))
+    store.import_template("web", tmp_path / "src")
+
+    assert hashed == ["variant.txt"]
+
+
+def test_stored_templates_are_stacks(tmp_path):
+    _template(tmp_path / "src", "a")
+    assert main(["templates", "import", str(tmp_path / "src"), "--name", "imported"]) == 0
+
+    init = ProjectInitializer(templates_dir=tmp_path / "none")
+    assert "imported" in init.get_available_stacks()
+    init.generate_project({"project_name": "Demo", "target_dir": str(tmp_path / "projects"), "stack": "imported"})
+    assert (tmp_path / "projects" / "demo" / "variant.txt").read_text() == "a"
+
+
+def test_only_requested_template_synced_and_deleted_ones_pruned_by_gc(tmp_path):
+    templates = tmp_path / "templates"
+    _template(templates / "web", "a")
+    _template(templates / "api", "b")
+    init = ProjectInitializer(templates_dir=templates)
+    store = TemplateStore()
+
+    init._copy_stack_template("web", tmp_path / "out" / "one")
+    assert store.names() == ["web"]
+
+    # A deleted folder's stale copy is neither listed nor served, but only gc removes it
+    shutil.rmtree(templates / "web")
+    assert "web" not in init.get_available_stacks()
+    init._copy_stack_template("web", tmp_path / "out" / "two")
+    assert not (tmp_path / "out" / "two" / "variant.txt").exists()
+    assert store.names() == ["web"]
+
+    assert main(["templates", "gc", "--templates-dir", str(templates)]) == 0
+    assert store.names() == []
+    assert store.usage() == (0, 0)
+
+
+def test_gc_drops_unreferenced_blobs(store, tmp_path):
+    _template(tmp_path / "src", "a")
+    store.import_template("web", tmp_path / "src")
+    store.remove("web")
+    assert store.gc() > 10_000
+    assert store.usage() == (0, 0)
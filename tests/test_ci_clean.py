@@ -6,7 +6,10 @@ from alpha.initializer import ProjectInitializer
 # Fixture for Initializer
 @pytest.fixture
 def initializer():
-    return ProjectInitializer()
+    init = ProjectInitializer()
+    # Mocked commands: don't require node/npm on PATH
+    init.toolchain_check = lambda tools, what=None: None
+    return init
 
 # Test 1: Configuration Loading
 def test_commands_config_loaded(initializer):
@@ -16,81 +19,77 @@ def test_commands_config_loaded(initializer):
     assert "nextjs" in initializer.get_available_stacks()
 
 # Test 2: Django Generation (Mocked)
-def test_generate_django_mocked(initializer, tmp_path):
+def test_generate_django_mocked(initializer, tmp_path, popen):
     config = {
         "project_name": "My Django App",
         "target_dir": str(tmp_path),
         "stack": "django"
     }
     
-    with patch("alpha.initializer.subprocess.run") as mock_run:
-        initializer.generate_project(config)
-        
-        # Verify call args
-        # Should sanitize "My Django App" -> "my_django_app"
-        # Command should contain sanitized name
-        args = mock_run.call_args[0][0]
-        assert "my_django_app" in args
-        assert "startproject" in args
-        assert "venv" in args
+    initializer.generate_project(config)
+
+    # Verify call args
+    # Should sanitize "My Django App" -> "my_django_app"
+    # Command should contain sanitized name
+    args = popen.call_args[0][0]
+    assert "my_django_app" in args
+    assert "startproject" in args
+    # Runs the venv's own interpreter
+    assert "venv" in Path(args[0]).parts
 
 # Test 3: FastAPI Generation (Mocked) - Checks escaping fix
-def test_generate_fastapi_mocked(initializer, tmp_path):
+def test_generate_fastapi_mocked(initializer, tmp_path, popen):
     config = {
         "project_name": "My API",
         "target_dir": str(tmp_path),
         "stack": "fastapi"
     }
     
-    with patch("alpha.initializer.subprocess.run") as mock_run:
-        initializer.generate_project(config)
-        
-        args = mock_run.call_args[0][0]
-        assert "my_api" in args
-        # Ensure the brace format didn't crash and injected correctly
-        # The command should contain 'return {"Hello": "World"}' (Sanity check)
-        # However, shell escaping might vary, but at least python side shouldn't crash.
-        assert 'return {"Hello": "World"}' in args
+    initializer.generate_project(config)
+
+    args = popen.call_args[0][0]
+    assert "pip" in args and "fastapi" in args
+    # main.py is written directly, so its braces and quotes survive as-is
+    main_py = (tmp_path / "my_api" / "main.py").read_text()
+    assert 'return {"Hello": "World"}' in main_py
 
 # Test 4: Next.js Generation (Mocked)
-def test_generate_nextjs_mocked(initializer, tmp_path):
+def test_generate_nextjs_mocked(initializer, tmp_path, popen):
     config = {
         "project_name": "My Frontend",
         "target_dir": str(tmp_path),
         "stack": "nextjs"
     }
     
-    with patch("alpha.initializer.subprocess.run") as mock_run:
-        initializer.generate_project(config)
-        
-        args = mock_run.call_args[0][0]
-        # Kebab case
-        assert "my-frontend" in args
-        assert "create-next-app" in args
+    initializer.generate_project(config)
+
+    args = popen.call_args[0][0]
+    # Kebab case
+    assert "my-frontend" in args
+    assert "create-next-app@latest" in args
 
 # Test 5: Sanitization Logic
-def test_sanitization_snake_case():
+def test_sanitization_snake_case(tmp_path, popen):
     init = ProjectInitializer()
-    config = {"project_name": "Test Project-One", "stack": "django", "target_dir": "."}
+    config = {"project_name": "Test Project-One", "stack": "django", "target_dir": str(tmp_path)}
     
-    with patch("alpha.initializer.subprocess.run") as mock_run:
-        init.generate_project(config)
-        args = mock_run.call_args[0][0]
-        assert "test_project_one" in args
+    init.generate_project(config)
+    args = popen.call_args[0][0]
+    assert "test_project_one" in args
 
-def test_sanitization_kebab_case():
+def test_sanitization_kebab_case(popen):
     init = ProjectInitializer()
+    init.toolchain_check = lambda tools, what=None: None
     config = {"project_name": "Test Project_One", "stack": "react", "target_dir": "."}
     
-    with patch("alpha.initializer.subprocess.run") as mock_run:
-        init.generate_project(config)
-        args = mock_run.call_args[0][0]
-        assert "test-project-one" in args
+    init.generate_project(config)
+    args = popen.call_args[0][0]
+    assert "test-project-one" in args
 
 # Note: Cross-platform path tests removed - patching os.name conflicts with PyQt6 bindings at runtime
 
 # Test 7: Superpower Framework Config Handling
-def test_superpower_framework_config(initializer, tmp_path):
+def test_superpower_framework_config(initializer, tmp_path, popen):
     """Verify use_superpower config is handled in generate_project."""
     config = {
         "project_name": "Super Test",  # Contains space to test sanitization
@@ -99,8 +98,7 @@ def test_superpower_framework_config(initializer, tmp_path):
         "use_superpower": True
     }
     
-    with patch("alpha.initializer.subprocess.run") as mock_run, \
-         patch.object(initializer, "_apply_superpower_framework") as mock_superpower:
+    with patch.object(initializer, "_apply_superpower_framework") as mock_superpower:
         initializer.generate_project(config)
         
         # Verify superpower framework method was called
@@ -111,7 +109,7 @@ def test_superpower_framework_config(initializer, tmp_path):
         project_path = call_args[0]
         assert project_path.name == "super_test"
 
-def test_superpower_framework_not_called_when_disabled(initializer, tmp_path):
+def test_superpower_framework_not_called_when_disabled(initializer, tmp_path, popen):
     """Verify use_superpower=False does not call framework method."""
     config = {
         "project_name": "NoSuper",
@@ -120,8 +118,7 @@ def test_superpower_framework_not_called_when_disabled(initializer, tmp_path):
         "use_superpower": False
     }
     
-    with patch("alpha.initializer.subprocess.run") as mock_run, \
-         patch.object(initializer, "_apply_superpower_framework") as mock_superpower:
+    with patch.object(initializer, "_apply_superpower_framework") as mock_superpower:
         initializer.generate_project(config)
         
         # Verify superpower framework method was NOT called
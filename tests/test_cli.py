@@ -0,0 +1,76 @@
+import json
+import pytest
+from alpha.cli import load_manifest, run_batch, main
+
+
+def test_manifest_defaults_merged(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({
+        "defaults": {"target_dir": str(tmp_path), "use_docker": True},
+        "projects": [
+            {"project_name": "billing", "stack": "fastapi"},
+            {"project_name": "web", "stack": "nextjs", "use_docker": False},
+        ]
+    }))
+
+    configs = load_manifest(manifest)
+    assert [c["project_name"] for c in configs] == ["billing", "web"]
+    assert configs[0]["use_docker"] is True
+    assert configs[1]["use_docker"] is False
+    assert configs[1]["target_dir"] == str(tmp_path)
+
+
+def test_manifest_yaml_list(tmp_path):
+    manifest = tmp_path / "manifest.yml"
+    manifest.write_text(f"- project_name: a\n  stack: django\n  target_dir: {tmp_path}\n")
+    assert load_manifest(manifest)[0]["stack"] == "django"
+
+
+def test_manifest_missing_keys(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([{"project_name": "a"}]))
+    with pytest.raises(ValueError, match="stack"):
+        load_manifest(manifest)
+
+
+def test_run_batch_reports_each_project(tmp_path):
+    # Stacks without an init_command fall back to the template copy,
+    # so this runs real generations in the pool without any tooling.
+    configs = [
+        {"project_name": f"svc {i}", "stack": "custom", "target_dir": str(tmp_path)}
+        for i in range(3)
+    ]
+    results = run_batch(configs, jobs=2)
+
+    assert sorted(r["project_name"] for r in results) == ["svc 0", "svc 1", "svc 2"]
+    assert all(r["success"] for r in results)
+    assert (tmp_path / "svc-0" / "README.md").exists()
+
+
+def test_batch_exit_code_on_failure(tmp_path, capsys):
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([
+        {"project_name": "ok", "stack": "custom", "target_dir": str(tmp_path)},
+        {"project_name": "bad", "stack": "custom", "target_dir": str(blocker)},
+    ]))
+
+    assert main(["batch", str(manifest), "--jobs", "2"]) == 1
+    out = capsys.readouterr().out
+    assert "1 succeeded, 1 failed" in out
+
+
+def test_batch_output_goes_to_per_project_logs(tmp_path, capsys):
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    configs = [
+        {"project_name": "good one", "stack": "custom", "target_dir": str(tmp_path)},
+        {"project_name": "bad", "stack": "custom", "target_dir": str(blocker)},
+    ]
+    results = run_batch(configs, jobs=2, log_dir=tmp_path / "logs")
+
+    logs = sorted(p.name for p in (tmp_path / "logs").iterdir())
+    assert logs == ["000-good_one.log", "001-bad.log"]
+    assert {r["log_file"] for r in results} == {str(tmp_path / "logs" / name) for name in logs}
+    assert "-> " + str(tmp_path / "logs") in capsys.readouterr().out
@@ -0,0 +1,50 @@
+import pytest
+from alpha import commands
+from alpha.initializer import ProjectInitializer
+
+
+def test_steps_run_in_process_and_spawn_only_tools(tmp_path, popen):
+    init = ProjectInitializer()
+    steps = [
+        {"mkdir": "{name}/src"},
+        {"chdir": "{name}"},
+        {"write": "app.py", "content": "print({'name': '{name}'}) # it's \"quoted\" && not a shell\n"},
+        {"run": ["tool", "--project", "{name}"]},
+    ]
+    init._run_steps(steps, "demo", tmp_path)
+
+    assert (tmp_path / "demo" / "src").is_dir()
+    assert (tmp_path / "demo" / "app.py").read_text() == "print({'name': 'demo'}) # it's \"quoted\" && not a shell\n"
+    popen.assert_called_once()
+    argv = popen.call_args[0][0]
+    assert argv[1:] == ["--project", "demo"]
+    assert popen.call_args[1]["cwd"] == tmp_path / "demo"
+    assert popen.call_args[1]["shell"] is False
+
+
+def test_venv_step_uses_venv_interpreter(tmp_path, popen):
+    init = ProjectInitializer()
+    steps = [{"venv": "venv", "requirements": ["django"]}, {"run": ["{venv_python}", "-m", "django"]}]
+    init._run_steps(steps, "demo", tmp_path)
+
+    calls = [call[0][0] for call in popen.call_args_list]
+    assert calls[0][1:] == ["-m", "venv", str(tmp_path / "venv")]
+    # Cold wheelhouse: fill it, then install from it without an index
+    assert calls[1][1:4] == ["-m", "pip", "wheel"] and calls[1][-1] == "django"
+    assert calls[2][1:5] == ["-m", "pip", "install", "--no-index"] and calls[2][-1] == "django"
+    assert calls[3][0] == calls[2][0]
+
+
+def test_invalid_steps_rejected():
+    with pytest.raises(ValueError):
+        commands.validate([{"mkdir": "a", "chdir": "b"}])
+    with pytest.raises(ValueError):
+        commands.validate([{"run": "npm install"}])
+
+
+def test_bundled_stacks_are_structured():
+    stacks = ProjectInitializer().commands_config["stacks"]
+    for name, config in stacks.items():
+        commands.validate(config["steps"])
+    assert commands.venv_requirements(stacks["django"]) == ["django"]
+    assert commands.venv_requirements(stacks["nextjs"]) is None
@@ -0,0 +1,100 @@
+import errno
+import os
+import shutil
+import stat
+import pytest
+from alpha import copyengine
+from alpha.copyengine import CopyEngine, copy_tree
+
+
+@pytest.fixture
+def tree(tmp_path):
+    src = tmp_path / "src"
+    (src / "a" / "b").mkdir(parents=True)
+    (src / "a" / "b" / "data.bin").write_bytes(os.urandom(300_000))
+    (src / "run.sh").write_text("#!/bin/sh\n")
+    os.chmod(src / "run.sh", 0o755)
+    (src / "skip.tmpl").write_text("x")
+    (src / "empty").write_bytes(b"")
+    if hasattr(os, "symlink"):
+        os.symlink("run.sh", src / "link")
+    return src
+
+
+def _assert_same(src, dst):
+    for path in src.rglob("*"):
+        if path.name == "skip.tmpl":
+            continue
+        copy = dst / path.relative_to(src)
+        if path.is_symlink():
+            assert os.readlink(copy) == os.readlink(path)
+        elif path.is_file():
+            assert copy.read_bytes() == path.read_bytes()
+            assert stat.S_IMODE(copy.stat().st_mode) == stat.S_IMODE(path.stat().st_mode)
+
+
+def test_copy_tree_matches_source(tree, tmp_path):
+    dst = tmp_path / "dst"
+    stats = copy_tree(tree, dst, ignore=shutil.ignore_patterns("*.tmpl"))
+
+    _assert_same(tree, dst)
+    assert not (dst / "skip.tmpl").exists()
+    assert stats.files == 3
+    assert stats.bytes == 300_000 + len("#!/bin/sh\n")
+    assert "MiB/s" in str(stats)
+
+
+@pytest.mark.parametrize("broken", [["copy_file_range"], ["copy_file_range", "sendfile"]])
+def test_falls_back_when_kernel_copy_unsupported(tree, tmp_path, monkeypatch, broken):
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "cross-device")
+    for name in broken:
+        if hasattr(os, name):
+            monkeypatch.setattr(os, name, unsupported)
+
+    engine = CopyEngine(workers=1)
+    stats = engine.copy_tree(tree, tmp_path / "dst")
+
+    _assert_same(tree, tmp_path / "dst")
+    assert not set(broken) & set(stats.methods)
+
+
+def test_sendfile_to_file_unsupported(tree, tmp_path, monkeypatch):
+    # macOS/BSD sendfile() exists but only writes to sockets
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    def not_a_socket(*args):
+        raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", not_a_socket, raising=False)
+
+    engine = CopyEngine(workers=1)
+    stats = engine.copy_tree(tree, tmp_path / "dst")
+
+    _assert_same(tree, tmp_path / "dst")
+    assert not {"copy_file_range", "sendfile"} & set(stats.methods)
+
+
+def test_parallel_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(copyengine, "PARALLEL_MIN_FILES", 2)
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(20):
+        (src / f"f{i}").write_text(str(i))
+
+    stats = copy_tree(src, tmp_path / "dst", workers=4)
+    assert stats.files == 20
+    assert (tmp_path / "dst" / "f7").read_text() == "7"
+
+
+def test_hardlinks_read_only_files(tree, tmp_path):
+    asset = tree / "a" / "b" / "data.bin"
+    os.chmod(asset, 0o444)
+
+    stats = copy_tree(tree, tmp_path / "dst", hardlink_readonly=True)
+
+    assert os.stat(asset).st_ino == os.stat(tmp_path / "dst" / "a" / "b" / "data.bin").st_ino
+    # Writable files are still copied
+    assert os.stat(tree / "run.sh").st_ino != os.stat(tmp_path / "dst" / "run.sh").st_ino
+    assert stats.methods["hardlink"] == 1
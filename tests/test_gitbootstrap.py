@@ -0,0 +1,124 @@
+import os
+import shutil
+import subprocess
+import pytest
+from alpha import agentbundle, gitbootstrap
+from alpha.copyengine import copy_tree
+from alpha.initializer import ProjectInitializer
+from alpha.utils import get_resource_path
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+@pytest.fixture(autouse=True)
+def isolated_git_config(tmp_path, monkeypatch):
+    """Keep the user's global/system git config (excludes, autocrlf) out of the tests."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=cwd, check=True,
+                          capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    root = tmp_path / "bundle"
+    (root / "skills" / "a-b").mkdir(parents=True)
+    (root / "skills" / "a-b" / "SKILL.md").write_text("# skill\n")
+    (root / "skills" / "a.md").write_text("sorts before the a-b/ tree\n")
+    (root / "skills" / "__pycache__").mkdir()
+    (root / "skills" / "__pycache__" / "x.pyc").write_bytes(b"\0")
+    (root / "empty").mkdir()
+    (root / "run.sh").write_text("#!/bin/sh\n")
+    (root / "run.sh").chmod(0o755)
+    return root
+
+
+def _project(tmp_path, name, bundle, existing_file=False):
+    project = tmp_path / name
+    project.mkdir()
+    git(project, "init", "-q")
+    if existing_file:
+        (project / "README.md").write_text("hi\n")
+        git(project, "add", "README.md")
+    copy_tree(bundle, project / ".agent", ignore=agentbundle.ignore)
+    return project
+
+
+def test_stage_matches_git_add(tmp_path, bundle):
+    fast = _project(tmp_path, "fast", bundle)
+    legacy = _project(tmp_path, "legacy", bundle)
+
+    gitbootstrap.stage(fast, bundle)
+    git(legacy, "add", ".agent")
+
+    assert git(fast, "write-tree") == git(legacy, "write-tree")
+    assert git(fast, "status", "--porcelain") == git(legacy, "status", "--porcelain")
+    git(fast, "commit", "-q", "-m", "Add Superpowers framework")
+    git(fast, "fsck", "--strict")
+    assert git(fast, "status", "--porcelain") == ""
+
+
+def test_existing_index_raises(tmp_path, bundle):
+    project = _project(tmp_path, "p", bundle, existing_file=True)
+    with pytest.raises(ValueError, match="index"):
+        gitbootstrap.stage(project, bundle)
+
+
+def test_bundled_agent_hashes_like_git(tmp_path):
+    bundled = get_resource_path("alpha/superpower_framework/.agent")
+    project = _project(tmp_path, "p", bundled)
+    tree = gitbootstrap.stage(project, bundled)
+    root = git(project, "write-tree").strip()
+    assert git(project, "rev-parse", f"{root}:.agent").strip() == tree
+    assert gitbootstrap.load_bundle(bundled) is gitbootstrap.load_bundle(bundled)
+
+
+@pytest.mark.parametrize("setup", [
+    lambda p: git(p, "config", "core.autocrlf", "true"),
+    lambda p: (p / ".gitattributes").write_text("*.md text eol=crlf\n"),
+    lambda p: (p / ".gitignore").write_text("node_modules/\n"),
+    lambda p: (p / ".git" / "info" / "exclude").write_text("skills/\n"),
+])
+def test_rules_that_may_change_git_add_raise(tmp_path, bundle, setup):
+    project = _project(tmp_path, "p", bundle)
+    setup(project)
+    with pytest.raises(ValueError):
+        gitbootstrap.stage(project, bundle)
+    assert not (project / ".git" / "index").exists()
+
+
+def test_core_config_read_without_git(tmp_path):
+    (tmp_path / "gitconfig").write_text('[user]\n\tname = x\n[core]\n\tAutoCRLF = "input" ; comment\n\tbare\n')
+    assert gitbootstrap.read_core_config(tmp_path / "none") == {"autocrlf": "input", "bare": "true"}
+    (tmp_path / "gitconfig").write_text("[include]\n\tpath = other\n")
+    with pytest.raises(ValueError):
+        gitbootstrap.read_core_config(tmp_path / "none")
+
+
+@pytest.mark.parametrize("existing_index", [False, True])
+def test_superpower_commit_spawns(tmp_path, bundle, monkeypatch, existing_index):
+    """Fresh repository: git init + git commit. Existing index: git add + git commit."""
+    for var in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{var}_NAME", "t")
+        monkeypatch.setenv(f"GIT_{var}_EMAIL", "t@t")
+    project = tmp_path / "p"
+    project.mkdir()
+    if existing_index:
+        git(project, "init", "-q")
+        (project / "README.md").write_text("hi\n")
+        git(project, "add", "README.md")
+    copy_tree(bundle, project / ".agent", ignore=agentbundle.ignore)
+
+    spawned = []
+    real_run = subprocess.run
+    monkeypatch.setattr(subprocess, "run", lambda argv, *a, **kw: spawned.append(argv[1]) or real_run(argv, *a, **kw))
+    ProjectInitializer()._init_git_with_agent(project, bundle)
+    monkeypatch.undo()
+
+    assert spawned == (["add", "commit"] if existing_index else ["init", "commit"])
+    assert git(project, "status", "--porcelain") == ""
+    assert ".agent/run.sh" in git(project, "ls-files")
@@ -0,0 +1,67 @@
+import sqlite3
+from alpha.cli import main
+from alpha.history import HistoryStore, percentile
+from alpha.initializer import ProjectInitializer, PHASE_INIT, PHASE_DOCKER
+
+
+def test_percentile_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == 5
+    assert percentile([1, 2], 50) == 1
+    assert percentile([], 50) is None
+
+
+def test_estimate_uses_slowest_step_per_stage(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    for i, (step, wall_s) in enumerate([("init", 10.0), ("init", 12.0), ("init", 30.0), ("docker", 1.0), ("superpower", 2.0)]):
+        store.record("run", "react", step, i, wall_s, None, None, None, True)
+    store.record("run", "react", "init", 99, 500.0, None, None, None, False)  # failures don't count
+
+    assert store.estimate("react", [["init"], ["docker", "superpower"]]) == 12.0 + 2.0
+    assert store.estimate("vue", [["init"]]) is None
+
+
+def test_estimate_separates_cache_outcomes(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    for i, (wall_s, outcome) in enumerate([(60.0, "snapshot-miss"), (64.0, "snapshot-miss"), (2.0, "snapshot-hit")]):
+        store.record("run", "react", "init", i, wall_s, None, None, None, True, outcome)
+
+    assert store.estimate("react", [["init"]], {"init": "snapshot-hit"}) == 2.0
+    assert store.estimate("react", [["init"]], {"init": "snapshot-miss"}) == 60.0
+    assert store.estimate("react", [["init"]]) is None  # no cold samples
+    assert {row["outcome"] for row in store.stats("react")} == {"snapshot-hit", "snapshot-miss"}
+
+
+def test_old_database_gains_outcome_column(tmp_path):
+    path = tmp_path / "history.sqlite3"
+    db = sqlite3.connect(str(path))
+    db.execute("CREATE TABLE step_runs (id INTEGER PRIMARY KEY AUTOINCREMENT, run_id TEXT NOT NULL,"
+               " stack TEXT NOT NULL, step TEXT NOT NULL, started_at REAL NOT NULL, wall_s REAL NOT NULL,"
+               " child_cpu_s REAL, bytes_written INTEGER, command TEXT, success INTEGER NOT NULL)")
+    db.execute("INSERT INTO step_runs (run_id, stack, step, started_at, wall_s, success)"
+               " VALUES ('old', 'react', 'init', 0, 5.0, 1)")
+    db.commit()
+    db.close()
+
+    store = HistoryStore(path)
+    store.record("new", "react", "init", 1, 7.0, None, None, None, True)
+    assert store.durations("react", "init") == [7.0]
+    assert [row["outcome"] for row in store.stats("react")] == ["cold", None]
+
+
+def test_generation_recorded_and_reported(tmp_path, capsys, popen):
+    init = ProjectInitializer()
+    config = {"project_name": "app", "target_dir": str(tmp_path), "stack": "django", "use_docker": True}
+
+    (tmp_path / "app").mkdir()
+    init.generate_project(config)
+
+    stats = {row["step"]: row for row in HistoryStore().stats(stack="django")}
+    assert set(stats) == {PHASE_INIT, PHASE_DOCKER}
+    assert stats[PHASE_INIT]["runs"] == 1
+    assert stats[PHASE_INIT]["outcome"] == "cold"
+    assert init.estimate_duration(config) is not None
+
+    assert main(["stats", "--stack", "django"]) == 0
+    assert PHASE_DOCKER in capsys.readouterr().out
@@ -0,0 +1,46 @@
+"""Import-time regression gate (see import_budget.json)."""
+import importlib.util
+import os
+import pytest
+from alpha.importtime import load_budgets, measure, summarize, check, parse_importtime, own_imports
+
+# Wall-clock budgets depend on the machine, so they only run when asked for
+# (ALPHA_IMPORT_BUDGET=1, scaled by ALPHA_IMPORT_BUDGET_SCALE on slow machines),
+# as CI does.
+# The lazy-import checks are deterministic and always run.
+TIME_BUDGETS = os.environ.get("ALPHA_IMPORT_BUDGET", "").lower() in ("1", "true", "yes")
+SCALE = float(os.environ.get("ALPHA_IMPORT_BUDGET_SCALE", "1.0"))
+
+BUDGETS = load_budgets()
+
+
+def _summary(module):
+    if module in ("main", "alpha.gui") and importlib.util.find_spec("PyQt6") is None:
+        pytest.skip("PyQt6 not installed")
+    return summarize(module, measure(module, repeat=3 if TIME_BUDGETS else 1))
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_on_demand_modules_stay_lazy(module):
+    budget = dict(BUDGETS[module], budget_ms=float("inf"))
+    assert check(_summary(module), budget) == []
+
+
+@pytest.mark.skipif(not TIME_BUDGETS, reason="set ALPHA_IMPORT_BUDGET=1 to check import-time budgets")
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_import_within_budget(module):
+    budget = dict(BUDGETS[module], budget_ms=BUDGETS[module]["budget_ms"] * SCALE)
+    assert check(_summary(module), budget) == []
+
+
+def test_parse_keeps_only_target_subtree():
+    trace = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 | site",
+        "import time:        10 |         10 |     json.decoder",
+        "import time:        20 |         30 |   json",
+        "import time:      5000 |       5030 | alpha.cli",
+    ])
+    entries = own_imports(parse_importtime(trace))
+    assert [e[0] for e in entries] == ["json.decoder", "json", "alpha.cli"]
+    assert summarize("alpha.cli", entries)["total_ms"] == 5.0
@@ -0,0 +1,101 @@
+import threading
+import time
+import pytest
+
+pytest.importorskip("PyQt6")
+from PyQt6.QtWidgets import QApplication
+from alpha import gui
+from alpha.gui import JobQueuePanel, GenerationJob
+from alpha.initializer import GenerationCancelled
+
+
+class FakeInitializer:
+    """Blocks in generate_project until released or cancelled."""
+    started = []
+
+    def __init__(self):
+        self.on_phase = self.on_phase_finished = self.on_output = None
+        self.release = threading.Event()
+        self.cancelled = threading.Event()
+
+    def generate_project(self, config):
+        FakeInitializer.started.append(self)
+        while not self.release.wait(0.01):
+            if self.cancelled.is_set():
+                raise GenerationCancelled("Generation cancelled")
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+@pytest.fixture
+def panel(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    FakeInitializer.started = []
+    monkeypatch.setattr(gui, "ProjectInitializer", FakeInitializer)
+    panel = JobQueuePanel()
+    yield panel
+    for job in panel.jobs:
+        if job.worker:
+            job.worker.initializer.release.set()
+            job.worker.wait()
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        QApplication.processEvents()
+        time.sleep(0.01)
+
+
+def _config(name):
+    return {"project_name": name, "stack": "react", "target_dir": "."}
+
+
+def test_runs_up_to_concurrency_jobs_at_once(panel):
+    panel.spin_concurrency.setValue(2)
+    jobs = [panel.enqueue(_config(f"p{i}")) for i in range(3)]
+    assert [job.status for job in jobs] == ["running", "running", "queued"]
+
+    _wait_for(lambda: len(FakeInitializer.started) == 2)
+    jobs[0].worker.initializer.release.set()
+    _wait_for(lambda: jobs[2].status == GenerationJob.RUNNING)
+    assert jobs[0].status == GenerationJob.DONE
+    assert jobs[0].duration() is not None
+
+
+def test_cancel_queued_and_running_jobs(panel):
+    panel.spin_concurrency.setValue(1)
+    running, queued = panel.enqueue(_config("a")), panel.enqueue(_config("b"))
+
+    panel.cancel(queued)
+    assert queued.status == GenerationJob.CANCELLED
+
+    drained, reported = [], []
+    panel.queue_drained.connect(lambda: drained.append(True))
+    panel.job_finished.connect(lambda name, status, message: reported.append((name, status)))
+    panel.cancel(running)
+    _wait_for(lambda: drained)
+    assert running.status == GenerationJob.CANCELLED
+    assert reported == [("a", GenerationJob.CANCELLED)]
+    assert len(FakeInitializer.started) == 1
+
+    running.worker.wait()
+    panel.clear_finished()
+    assert panel.jobs == [] and panel.table.rowCount() == 0
+
+
+def test_clear_finished_keeps_jobs_whose_thread_still_runs(panel):
+    job = panel.enqueue(_config("a"))
+    job.worker.initializer.release.set()
+    _wait_for(lambda: job.status == GenerationJob.DONE)
+    job.worker.wait()
+
+    job.worker.isFinished = lambda: False  # Still unwinding from run()
+    panel.clear_finished()
+    assert panel.jobs == [job]
+
+    del job.worker.isFinished
+    panel.clear_finished()
+    assert panel.jobs == []
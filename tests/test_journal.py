@@ -0,0 +1,91 @@
+import json
+import subprocess
+import pytest
+from alpha.initializer import ProjectInitializer
+from alpha.journal import StepJournal, JOURNAL_DIR, JOURNAL_NAME
+
+
+class FlakyInitializer(ProjectInitializer):
+    """Fakes the react + shadcn commands; shadcn init fails while `fail` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.toolchain_check = lambda tools, what=None: None  # npm is faked
+        self.ran = []
+        self.timeouts = []
+        self.fail = True
+
+    def _run_command(self, cmd, cwd, phase="init", timeout=None):
+        text = cmd if isinstance(cmd, str) else " ".join(cmd)
+        self.ran.append(text)
+        self.timeouts.append(timeout)
+        if "create" in text and "vite" in text:
+            (cwd / "app" / "src").mkdir(parents=True)
+        elif "shadcn" in text and self.fail:
+            raise subprocess.CalledProcessError(1, cmd)
+
+
+def _config(tmp_path, **extra):
+    return {"project_name": "app", "target_dir": str(tmp_path), "stack": "react", "ui_framework": "shadcn", **extra}
+
+
+def test_resume_skips_finished_steps(tmp_path):
+    init = FlakyInitializer()
+    with pytest.raises(RuntimeError):
+        init.generate_project(_config(tmp_path))
+    assert len(init.ran) == 3  # create vite, npm install tailwind, shadcn init
+
+    journal = json.loads((tmp_path / "app" / JOURNAL_DIR / JOURNAL_NAME).read_text())
+    assert set(journal["steps"]) == {"init", "init/0", "post-install hook/tailwind"}
+
+    init.ran.clear()
+    init.fail = False
+    init.generate_project(_config(tmp_path, resume=True))
+    assert len(init.ran) == 1 and "shadcn" in init.ran[0]
+    # A finished project keeps no journal behind
+    assert not (tmp_path / "app" / JOURNAL_DIR).exists()
+
+
+def test_without_resume_everything_runs(tmp_path):
+    init = FlakyInitializer()
+    with pytest.raises(RuntimeError):
+        init.generate_project(_config(tmp_path))
+
+    init.ran.clear()
+    init.fail = False
+    with pytest.raises(FileExistsError):
+        init.generate_project(_config(tmp_path))
+    assert "vite" in init.ran[0]
+
+
+def test_changed_inputs_rerun_the_step_and_its_dependents(tmp_path):
+    (tmp_path / "app").mkdir()
+    journal = StepJournal(tmp_path / "app")
+    journal.record("init", "old")
+    journal.record("docker", "d")
+
+    resumed = StepJournal(tmp_path / "app", resume=True)
+    assert not resumed.begin("init", "new")
+    assert not resumed.begin("docker", "d", after=["init"])
+
+
+def test_nothing_is_written_before_the_project_exists(tmp_path):
+    journal = StepJournal(tmp_path / "app")
+    journal.record("init", "x")
+    assert not (tmp_path / "app").exists()
+
+    (tmp_path / "app").mkdir()
+    journal.record("docker", "y")
+    assert StepJournal(tmp_path / "app", resume=True).begin("init", "x")
+    assert (tmp_path / "app" / JOURNAL_DIR / ".gitignore").read_text() == "*\n"
+
+
+def test_step_timeout_reaches_overridden_run_command(tmp_path):
+    init = FlakyInitializer()
+    init.commands_config["stacks"]["timed"] = {
+        "steps": [{"mkdir": "{name}"}, {"run": ["tool", "{name}"], "timeout_s": 5}],
+        "requires": [],
+    }
+    init.generate_project({"project_name": "app", "target_dir": str(tmp_path), "stack": "timed"})
+    assert init.ran == ["tool app"]
+    assert init.timeouts == [5]
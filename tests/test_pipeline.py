@@ -0,0 +1,54 @@
+import threading
+import pytest
+from alpha.initializer import ProjectInitializer, PHASE_INIT, PHASE_HOOK, PHASE_SUPERPOWER, PHASE_DOCKER
+from alpha.pipeline import StepGraph
+
+
+def test_dependencies_from_inputs_and_outputs():
+    graph = StepGraph()
+    graph.add("a", lambda: None, inputs=["config"], outputs=["root"])
+    graph.add("b", lambda: None, inputs=["root"], outputs=["x"])
+    graph.add("c", lambda: None, inputs=["root", "x"])
+
+    assert graph.dependencies() == {"a": set(), "b": {"a"}, "c": {"a", "b"}}
+    assert graph.stages() == [["a"], ["b"], ["c"]]
+
+
+def test_independent_steps_run_concurrently():
+    barrier = threading.Barrier(2, timeout=2)
+    graph = StepGraph()
+    graph.add("root", lambda: None, outputs=["root"])
+    # Each waits for the other: only passes if both run at the same time
+    graph.add("left", barrier.wait, inputs=["root"])
+    graph.add("right", barrier.wait, inputs=["root"])
+    graph.run()
+
+
+def test_failure_stops_dependents():
+    ran = []
+    graph = StepGraph()
+    graph.add("a", lambda: 1 / 0, outputs=["root"])
+    graph.add("b", lambda: ran.append("b"), inputs=["root"])
+
+    with pytest.raises(ZeroDivisionError):
+        graph.run()
+    assert ran == []
+
+
+def test_cycle_detected():
+    graph = StepGraph()
+    graph.add("a", lambda: None, inputs=["y"], outputs=["x"])
+    graph.add("b", lambda: None, inputs=["x"], outputs=["y"])
+    with pytest.raises(ValueError, match="cycle"):
+        graph.run()
+
+
+def test_generation_plan_parallelizes_docker_and_superpower(tmp_path):
+    plan = ProjectInitializer().build_plan({
+        "project_name": "web", "target_dir": str(tmp_path), "stack": "react",
+        "ui_framework": "Shadcn", "use_docker": True, "use_superpower": True,
+    })
+
+    assert plan.stages() == [[PHASE_INIT], [PHASE_HOOK, PHASE_SUPERPOWER, PHASE_DOCKER]]
+    # Planning must not touch the filesystem
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,83 @@
+from unittest.mock import patch
+from alpha.artifacts import ArtifactCache
+from alpha.initializer import ProjectInitializer
+from alpha.prefetch import Prefetcher, PrefetchStopped, latest_packages
+
+
+class FakeNpm:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, argv):
+        self.calls.append(argv)
+        return "6.1.0\n" if argv[1] == "view" else ""
+
+
+def test_latest_packages_from_steps_and_shell_commands():
+    assert latest_packages('["npx", "create-next-app@latest", "{name}"]') == ["create-next-app"]
+    assert latest_packages("npm create vite@latest app && npx -y @scope/tool@latest x") == ["@scope/tool", "create-vite"]
+    # npm create/init run the create-* package
+    assert latest_packages('["npm", "create", "vite@latest", "{name}"]') == ["create-vite"]
+    assert latest_packages("npm init @scope/app@latest x && npm init @scope@latest y") == ["@scope/create", "@scope/create-app"]
+
+
+def test_resolves_and_warms_npm_packages(tmp_path):
+    run = FakeNpm()
+    prefetcher = Prefetcher(ProjectInitializer(), artifacts=ArtifactCache(tmp_path), run=run)
+    with patch("alpha.toolchain.shutil.which", return_value="/usr/bin/tool"):
+        report = prefetcher.prefetch("react", ui_framework="Shadcn")
+
+    assert report["resolved"]["create-vite"] == "6.1.0"
+    assert ["npm", "cache", "add", "create-vite@6.1.0"] in run.calls
+    assert "vite" not in report["resolved"]
+    assert ["npm", "cache", "add", "shadcn@6.1.0"] in run.calls
+    assert ["npm", "view", "@tailwindcss/vite", "version"] in run.calls
+    assert not report["errors"] and not report["stopped"]
+    # One warmed package doesn't make the whole npm cache trustworthy
+    assert not prefetcher.artifacts.is_fresh("npm")
+
+
+def test_missing_npm_skips_network_work(tmp_path):
+    run = FakeNpm()
+    prefetcher = Prefetcher(ProjectInitializer(), artifacts=ArtifactCache(tmp_path), run=run)
+    with patch("alpha.toolchain.shutil.which", return_value=None):
+        report = prefetcher.prefetch("nextjs")
+    assert report["missing_tools"] == ["node", "npm"]
+    assert run.calls == []
+
+
+def test_python_stack_fills_wheelhouse_once(tmp_path):
+    run = FakeNpm()
+    artifacts = ArtifactCache(tmp_path)
+    prefetcher = Prefetcher(ProjectInitializer(), artifacts=artifacts, run=run)
+    with patch("alpha.toolchain.shutil.which", return_value="/usr/bin/python"):
+        prefetcher.prefetch("django")
+        assert run.calls[-1][1:4] == ["-m", "pip", "wheel"]
+
+        (artifacts.wheelhouse / "Django-5.0-py3-none-any.whl").touch()
+        run.calls.clear()
+        prefetcher.prefetch("django")
+    assert run.calls == []
+
+
+def test_stop_interrupts_between_steps(tmp_path):
+    run = FakeNpm()
+    prefetcher = Prefetcher(ProjectInitializer(), artifacts=ArtifactCache(tmp_path), run=run, should_stop=lambda: True)
+    assert prefetcher.prefetch("react")["stopped"]
+    assert run.calls == []
+
+
+def test_golden_venv_build_runs_through_the_stoppable_runner(tmp_path):
+    calls = []
+
+    def run(argv):
+        calls.append(argv)
+        raise PrefetchStopped()  # What Prefetcher._run does once stop is requested
+
+    prefetcher = Prefetcher(ProjectInitializer(), artifacts=ArtifactCache(tmp_path), run=run)
+    with patch("alpha.toolchain.shutil.which", return_value="/usr/bin/python"):
+        report = prefetcher.prefetch("django", golden_venv=True)
+
+    assert report["stopped"]
+    assert calls[0][1:3] == ["-m", "venv"]
+    assert "golden venv" not in report["warmed"]
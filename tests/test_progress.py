@@ -0,0 +1,99 @@
+import os
+import subprocess
+import threading
+import time
+import sys
+import pytest
+from alpha.initializer import ProjectInitializer, PHASE_INIT, PHASE_DOCKER
+
+
+def test_run_command_streams_lines(tmp_path):
+    init = ProjectInitializer()
+    lines = []
+    init.on_output = lambda phase, line: lines.append((phase, line))
+
+    cmd = f'"{sys.executable}" -c "import sys; print(1); print(2, file=sys.stderr); print(3)"'
+    init._run_command(cmd, tmp_path)
+
+    assert lines == [(PHASE_INIT, "1"), (PHASE_INIT, "2"), (PHASE_INIT, "3")]
+
+
+def test_streamed_failure_raises(tmp_path):
+    init = ProjectInitializer()
+    init.on_output = lambda phase, line: None
+    with pytest.raises(subprocess.CalledProcessError):
+        init._run_command(f'"{sys.executable}" -c "raise SystemExit(3)"', tmp_path)
+
+
+def test_phases_reported_in_order(tmp_path, popen):
+    init = ProjectInitializer()
+    phases = []
+    init.on_phase = phases.append
+    config = {"project_name": "app", "target_dir": str(tmp_path), "stack": "django", "use_docker": True}
+
+    (tmp_path / "app").mkdir()
+    init.generate_project(config)
+
+    assert phases == [PHASE_INIT, PHASE_DOCKER]
+
+
+def test_cancel_stops_before_the_next_step(tmp_path, popen):
+    from alpha.initializer import GenerationCancelled
+    init = ProjectInitializer()
+    init.cancel()
+    config = {"project_name": "app", "target_dir": str(tmp_path), "stack": "django"}
+    with pytest.raises(GenerationCancelled):
+        init.generate_project(config)
+    popen.assert_not_called()
+
+
+def _slow_stack(init, headless=False, **timeouts):
+    init.commands_config = {"stacks": {"slow": {
+        "steps": [{"mkdir": "{name}"}, {"chdir": "{name}"},
+                  {"run": [sys.executable, "-c", "import time; time.sleep(60)"]}],
+        **timeouts,
+    }}}
+    init.on_output = None if headless else lambda phase, line: None
+    return {"project_name": "app", "target_dir": "", "stack": "slow"}
+
+
+@pytest.mark.parametrize("headless", [False, True])
+def test_timeout_kills_command_and_removes_partial_project(tmp_path, headless):
+    from alpha.initializer import GenerationTimeout
+    init = ProjectInitializer()
+    config = dict(_slow_stack(init, headless, step_timeout_s=0.5), target_dir=str(tmp_path))
+    start = time.monotonic()
+    with pytest.raises(GenerationTimeout):
+        init.generate_project(config)
+    assert time.monotonic() - start < 10
+    assert not (tmp_path / "app").exists()
+
+
+@pytest.mark.parametrize("headless", [False, True])
+def test_cancel_kills_the_whole_process_group(tmp_path, headless):
+    from alpha.initializer import GenerationCancelled
+    init = ProjectInitializer()
+    pid_file = tmp_path / "grandchild.pid"
+    # A shell that starts a grandchild, like npx does
+    script = f"import subprocess, sys, time; p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); open({str(pid_file)!r}, 'w').write(str(p.pid)); time.sleep(60)"
+    threading.Timer(1.0, init.cancel).start()
+    init.on_output = None if headless else lambda phase, line: None
+    with pytest.raises(GenerationCancelled):
+        init._run_command([sys.executable, "-c", script], tmp_path)
+
+    if sys.platform.startswith("linux") and pid_file.exists():
+        grandchild = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while _alive(grandchild) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not _alive(grandchild)
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # Killed but not yet reaped by init
+    with open(f"/proc/{pid}/stat") as f:
+        return f.read().split()[2] != "Z"
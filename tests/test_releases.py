@@ -0,0 +1,82 @@
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+pytest.importorskip("requests")
+from alpha import releases
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Stand-in for the releases API that honours If-None-Match."""
+    release = {"tag_name": "v99.0.0", "html_url": "https://example.invalid/release"}
+    etag = '"abc123"'
+    status = 200
+    hits = []
+
+    def do_GET(self):
+        FakeGitHub.hits.append(self.headers.get("If-None-Match"))
+        if self.status != 200:
+            self.send_response(self.status)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(self.release).encode()
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    FakeGitHub.hits = []
+    FakeGitHub.status = 200
+    httpd = HTTPServer(("127.0.0.1", 0), FakeGitHub)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+def test_fresh_cache_skips_request(server, tmp_path):
+    cache = tmp_path / "cache.json"
+    first = releases.fetch_latest_release(base_url=server, cache_path=cache)
+    second = releases.fetch_latest_release(base_url=server, cache_path=cache)
+
+    assert first == second == FakeGitHub.release
+    assert len(FakeGitHub.hits) == 1
+
+
+def test_stale_cache_revalidates_with_etag(server, tmp_path):
+    cache = tmp_path / "cache.json"
+    releases.fetch_latest_release(base_url=server, cache_path=cache)
+    data = releases.fetch_latest_release(base_url=server, cache_path=cache, ttl=0)
+
+    assert FakeGitHub.hits == [None, '"abc123"']
+    assert data == FakeGitHub.release
+
+
+def test_server_error_falls_back_to_cache(server, tmp_path):
+    cache = tmp_path / "cache.json"
+    releases.fetch_latest_release(base_url=server, cache_path=cache)
+    FakeGitHub.status = 500
+
+    assert releases.fetch_latest_release(base_url=server, cache_path=cache, ttl=0) == FakeGitHub.release
+
+
+def test_unreachable_without_cache(tmp_path):
+    assert releases.fetch_latest_release(base_url="http://127.0.0.1:9", cache_path=tmp_path / "c.json", timeout=1) is None
+
+
+def test_check_latest_via_env_base_url(server, monkeypatch):
+    monkeypatch.setenv("ALPHA_UPDATE_API_URL", server)
+    assert releases.check_latest("1.6.0") == (True, "99.0.0", "https://example.invalid/release")
+    assert releases.check_latest("99.0.0") == (False, None, None)
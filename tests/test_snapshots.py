@@ -0,0 +1,105 @@
+import json
+import pytest
+from unittest.mock import patch
+from alpha.history import HistoryStore
+from alpha.initializer import ProjectInitializer, PHASE_INIT
+from alpha.snapshots import SnapshotCache, rewrite_project_name
+
+
+def fake_vite(cmd, cwd):
+    """Stand-in for `npm create vite` that writes a small named tree."""
+    name = cmd[3]
+    root = cwd / name
+    (root / "src").mkdir(parents=True)
+    (root / "node_modules" / "dep").mkdir(parents=True)
+    (root / "package.json").write_text(json.dumps({"name": name}))
+    (root / "index.html").write_text(f"<title>{name}</title>")
+    (root / "node_modules" / "dep" / "index.js").write_text("module.exports = 1")
+
+
+@pytest.fixture
+def initializer():
+    init = ProjectInitializer()
+    # npm is faked: don't require it on PATH
+    init.toolchain_check = lambda tools, what=None: None
+    return init
+
+
+def test_snapshot_hit_skips_init_command(initializer, tmp_path):
+    with patch("alpha.initializer.tool_versions", return_value={"node": "v20"}), \
+         patch.object(initializer, "_run_command", side_effect=fake_vite) as mock_run:
+        for name in ["First App", "Second App"]:
+            initializer.generate_project({
+                "project_name": name, "target_dir": str(tmp_path),
+                "stack": "react", "use_cache": True,
+            })
+
+    assert mock_run.call_count == 1
+    second = tmp_path / "second-app"
+    assert json.loads((second / "package.json").read_text())["name"] == "second-app"
+    assert "second-app" in (second / "index.html").read_text()
+    assert (second / "node_modules" / "dep" / "index.js").exists()
+
+    # The miss and the hit are timed separately, and the next run expects a hit
+    outcomes = {row["outcome"] for row in HistoryStore().stats("react") if row["step"] == PHASE_INIT}
+    assert outcomes == {"snapshot-miss", "snapshot-hit"}
+    with patch("alpha.initializer.tool_versions", return_value={"node": "v20"}):
+        config = {"project_name": "third", "target_dir": str(tmp_path), "stack": "react", "use_cache": True}
+        assert initializer._expected_init_outcome(config) == "snapshot-hit"
+
+
+def test_tool_versions_change_key(initializer, tmp_path):
+    config = {"project_name": "app", "target_dir": str(tmp_path), "stack": "react", "use_cache": True}
+    with patch.object(initializer, "_run_command", side_effect=fake_vite) as mock_run:
+        with patch("alpha.initializer.tool_versions", return_value={"node": "v20"}):
+            initializer.generate_project(config)
+        with patch("alpha.initializer.tool_versions", return_value={"node": "v22"}):
+            initializer.generate_project({**config, "project_name": "app two"})
+
+    assert mock_run.call_count == 2
+
+
+def test_python_venv_stacks_not_cached(initializer, tmp_path, popen):
+    config = {"project_name": "api", "target_dir": str(tmp_path), "stack": "django", "use_cache": True}
+    initializer.generate_project(config)
+    assert SnapshotCache().entries() == []
+
+
+def _store(cache, key, tmp_path, size, stack="react"):
+    tree = tmp_path / f"build-{key}"
+    tree.mkdir()
+    (tree / "blob").write_bytes(b"x" * size)
+    cache.store(key, tree, {"stack": stack})
+
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = SnapshotCache(root=tmp_path / "cache", max_bytes=250)
+    _store(cache, "a", tmp_path, 100)
+    _store(cache, "b", tmp_path, 100)
+    cache.get("a")  # a is now more recently used than b
+    _store(cache, "c", tmp_path, 100)
+
+    keys = {m["key"] for m in cache.entries()}
+    assert keys == {"a", "c"}
+
+
+def test_invalidate_by_stack(tmp_path):
+    cache = SnapshotCache(root=tmp_path / "cache")
+    _store(cache, "a", tmp_path, 10, stack="react")
+    _store(cache, "b", tmp_path, 10, stack="vue")
+
+    assert cache.invalidate(stack="react") == 1
+    assert [m["key"] for m in cache.entries()] == ["b"]
+    assert cache.get("a") is None
+
+
+def test_rewrite_renames_project_package(tmp_path):
+    pkg = tmp_path / "placeholder"
+    pkg.mkdir()
+    (pkg / "settings.py").write_text("ROOT_URLCONF = 'placeholder.urls'")
+    (tmp_path / "manage.py").write_text("'placeholder.settings'")
+
+    rewrite_project_name(tmp_path, "placeholder", "my_api")
+
+    assert (tmp_path / "my_api" / "settings.py").read_text() == "ROOT_URLCONF = 'my_api.urls'"
+    assert "my_api.settings" in (tmp_path / "manage.py").read_text()
@@ -0,0 +1,178 @@
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+import pytest
+from alpha.utils import get_resource_path
+
+SCRIPT = get_resource_path("alpha/superpower_framework/.agent/skills/superpowers-workflow/scripts/spawn_subagent.py")
+
+
+@pytest.fixture
+def spawn():
+    spec = importlib.util.spec_from_file_location("spawn_subagent", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_load_plan_validates_and_names_tasks(spawn, tmp_path):
+    plan = tmp_path / "plan.json"
+    plan.write_text(json.dumps({"batches": [[{"skill": "tdd", "task": "a"}, {"id": "x", "skill": "review", "task": "b"}]]}))
+    assert [t["id"] for t in spawn.load_plan(str(plan))[0]] == ["batch1-task1", "x"]
+
+    plan.write_text(json.dumps([[{"skill": "tdd"}]]))
+    with pytest.raises(ValueError, match="needs 'skill' and 'task'"):
+        spawn.load_plan(str(plan))
+
+
+def test_run_plan_bounds_workers_and_stops_after_a_failed_batch(spawn, tmp_path, monkeypatch):
+    running, peak, lock = [0], [0], threading.Lock()
+    timeouts = {}
+
+    def fake_spawn(skill, task, repo_root, yolo, output_format, timeout_s, cache):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        timeouts[task] = timeout_s
+        return {"success": task != "bad", "output": task, "error": "", "log_file": "", "duration_s": 0.05}
+
+    monkeypatch.setattr(spawn, "spawn_subagent", fake_spawn)
+    batches = [
+        [{"id": f"t{i}", "skill": "tdd", "task": f"task {i}"} for i in range(4)],
+        [{"id": "fail", "skill": "debug", "task": "bad", "timeout_s": 5}],
+        [{"id": "later", "skill": "tdd", "task": "never"}],
+    ]
+    report = spawn.run_plan(batches, tmp_path, max_workers=2, timeout_s=30)
+
+    assert peak[0] == 2
+    assert not report["success"]
+    assert [b["success"] for b in report["batches"]] == [True, False]
+    assert [r["id"] for r in report["batches"][0]["results"]] == ["t0", "t1", "t2", "t3"]
+    assert report["skipped"] == ["later"]
+    assert timeouts == {"task 0": 30, "task 1": 30, "task 2": 30, "task 3": 30, "bad": 5}
+
+    report = spawn.run_plan(batches, tmp_path, keep_going=True)
+    assert report["skipped"] == [] and len(report["batches"]) == 3
+
+
+def test_marker_scanner_handles_split_markers_in_bounded_memory(spawn):
+    scanner = spawn.MarkerScanner(limit=20)
+    stream = "noise " * 1000 + "---SUBAGENT-RESULT-START---\n  the result  \n---SUBAGENT-RESULT-END--- trailing"
+    for i in range(0, len(stream), 7):
+        scanner.feed(stream[i:i + 7])
+        assert len(scanner._pending) < len(spawn.RESULT_START)
+    assert scanner.result() == "the result"
+    assert not scanner.truncated
+
+    scanner = spawn.MarkerScanner(limit=5)
+    scanner.feed("---SUBAGENT-RESULT-START---abcdefgh")
+    assert scanner.result() == "abcde" and scanner.truncated
+    assert spawn.MarkerScanner().result() is None
+
+
+def _fake_gemini(tmp_path, monkeypatch, repo):
+    skill = repo / ".agent" / "skills" / "superpowers-tdd"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("Do it.")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    gemini = bin_dir / "gemini"
+    gemini.write_text(
+        "#!/bin/sh\n"
+        "cat > /dev/null\n"
+        f"echo call >> '{tmp_path / 'calls'}'\n"
+        "echo working; echo oops >&2\n"
+        "printf -- '---SUBAGENT-RESULT-'; printf 'START---\\ndone\\n---SUBAGENT-RESULT-END---\\n'\n"
+        "[ -n \"$EDIT\" ] && echo edited >> \"$EDIT\"\n"
+        "[ -n \"$SLOW\" ] && sleep 30\n"
+        "exit 0\n"
+    )
+    gemini.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return lambda: len((tmp_path / "calls").read_text().splitlines())
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX fake gemini script")
+def test_streams_output_to_the_log_and_kills_on_timeout(spawn, tmp_path, monkeypatch):
+    _fake_gemini(tmp_path, monkeypatch, tmp_path)
+
+    result = spawn.spawn_subagent("tdd", "task", tmp_path)
+    assert result["success"] and result["output"] == "done"
+    log = open(result["log_file"], encoding="utf-8").read()
+    assert "working\n" in log and "[stderr] oops\n" in log and "=== EXIT CODE: 0 ===" in log
+
+    monkeypatch.setenv("SLOW", "1")
+    started = time.time()
+    result = spawn.spawn_subagent("tdd", "task", tmp_path, timeout_s=0.5)
+    assert not result["success"] and "timed out" in result["error"]
+    assert time.time() - started < 10
+
+
+@pytest.mark.skipif(os.name == "nt" or shutil.which("git") is None, reason="POSIX fake gemini script, needs git")
+def test_result_cache_reuses_runs_on_an_unchanged_tree(spawn, tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    calls = _fake_gemini(tmp_path, monkeypatch, repo)
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    (repo / "app.py").write_text("x = 1\n")
+    cache = spawn.ResultCache(repo)
+
+    first = spawn.spawn_subagent("tdd", "task", repo, cache=cache)
+    again = spawn.spawn_subagent("tdd", "task", repo, cache=cache)
+    assert calls() == 1 and not first["cached"] and again["cached"]
+    assert again["output"] == first["output"] == "done"
+
+    spawn.spawn_subagent("tdd", "another task", repo, cache=cache)
+    (repo / "app.py").write_text("x = 2\n")  # Untracked edits count too
+    spawn.spawn_subagent("tdd", "task", repo, cache=cache)
+    assert calls() == 3
+
+    expired = spawn.ResultCache(repo, ttl_s=-1)
+    spawn.spawn_subagent("tdd", "task", repo, cache=expired)
+    assert calls() == 4
+
+    spawn.ResultCache(repo, max_entries=1)._evict()
+    assert len(list(cache.dir.glob("*.json"))) == 1
+
+
+@pytest.mark.skipif(os.name == "nt" or shutil.which("git") is None, reason="POSIX fake gemini script, needs git")
+def test_reverting_the_subagents_edits_runs_it_again(spawn, tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    calls = _fake_gemini(tmp_path, monkeypatch, repo)
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    (repo / "app.py").write_text("x = 1\n")
+    monkeypatch.setenv("EDIT", str(repo / "app.py"))
+    cache = spawn.ResultCache(repo)
+
+    spawn.spawn_subagent("tdd", "task", repo, cache=cache)
+    monkeypatch.delenv("EDIT")
+    assert spawn.spawn_subagent("tdd", "task", repo, cache=cache)["cached"]  # Tree as the subagent left it
+
+    (repo / "app.py").write_text("x = 1\n")  # Back to where the first run started
+    assert not spawn.spawn_subagent("tdd", "task", repo, cache=cache)["cached"]
+    assert calls() == 2
+
+
+def test_cache_is_opt_in_and_can_be_bypassed(spawn, tmp_path, monkeypatch):
+    def args(*argv):
+        parser = spawn.argparse.ArgumentParser()
+        parser.add_argument("--cache", action="store_true")
+        parser.add_argument("--no-cache", action="store_true")
+        parser.add_argument("--cache-ttl", type=float, default=60)
+        return parser.parse_args(argv)
+
+    monkeypatch.delenv(spawn.CACHE_ENV, raising=False)
+    assert spawn.cache_from_args(args(), tmp_path) is None
+    assert spawn.cache_from_args(args("--cache"), tmp_path).ttl_s == 60
+    monkeypatch.setenv(spawn.CACHE_ENV, "1")
+    assert spawn.cache_from_args(args(), tmp_path) is not None
+    assert spawn.cache_from_args(args("--no-cache"), tmp_path) is None
+    assert spawn.tree_state(tmp_path) is None  # Not a git repo: never reuse
@@ -0,0 +1,37 @@
+"""Startup benchmark: time-to-interactive must stay within budget."""
+import os
+import time
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Seconds from QApplication creation to a ready main window.
+# Override with ALPHA_STARTUP_BUDGET_S on slow machines.
+STARTUP_BUDGET_S = float(os.environ.get("ALPHA_STARTUP_BUDGET_S", "1.5"))
+
+
+def test_time_to_interactive_within_budget():
+    from PyQt6.QtWidgets import QApplication
+    import main
+
+    start = time.perf_counter()
+    app = QApplication.instance() or QApplication([])
+    window = main.startup(app)
+    window.show()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    assert window.isVisible()
+    assert elapsed < STARTUP_BUDGET_S, f"Startup took {elapsed:.2f}s (budget {STARTUP_BUDGET_S}s)"
+    window.close()
+
+
+def test_startup_does_not_sleep(monkeypatch):
+    """Splash progress must come from real work, not fixed delays."""
+    from PyQt6.QtWidgets import QApplication
+    import main
+
+    monkeypatch.setattr(main.time, "sleep", lambda s: pytest.fail("startup called time.sleep"))
+    app = QApplication.instance() or QApplication([])
+    main.startup(app).close()
@@ -0,0 +1,77 @@
+import pytest
+from alpha import templating
+from alpha.initializer import ProjectInitializer
+from alpha.templating import Template, TemplateError
+
+
+def test_variables_and_conditionals():
+    template = Template(
+        "FROM {{ base }}\n"
+        "{% if family == \"node\" %}\n"
+        "RUN npm install\n"
+        "{% elif not slim %}\n"
+        "RUN apt-get update\n"
+        "{% else %}\n"
+        "# slim\n"
+        "{% endif %}\n"
+        "ENV APP={{ app.name }} {\"json\": true}\n"
+    )
+    assert template.render({"base": "node:18", "family": "node", "slim": False, "app": {"name": "x"}}) == \
+        "FROM node:18\nRUN npm install\nENV APP=x {\"json\": true}\n"
+    assert template.render({"base": "py", "family": "python", "slim": True, "app": {"name": "y"}}) == \
+        "FROM py\n# slim\nENV APP=y {\"json\": true}\n"
+
+
+def test_errors_name_the_template():
+    with pytest.raises(TemplateError, match="t.tmpl:2: 'if' is never closed"):
+        Template("ok\n{% if a %}\n", name="t.tmpl")
+    with pytest.raises(TemplateError, match="undefined variable 'missing'"):
+        Template("{{ missing }}").render({})
+
+
+def test_compiled_once_until_changed(tmp_path):
+    path = tmp_path / "a.tmpl"
+    path.write_text("v1 {{ x }}")
+    first = templating.load(path)
+    assert templating.load(path) is first
+
+    path.write_text("version2 {{ x }}")
+    assert templating.load(path).render({"x": 1}) == "version2 1"
+
+
+def test_stack_template_renders_tmpl_files(tmp_path):
+    src = tmp_path / "templates" / "custom"
+    (src / "pkg").mkdir(parents=True)
+    (src / "static.txt").write_text("{{ not rendered }}")
+    (src / "pkg" / "app.py.tmpl").write_text('NAME = "{{ name }}"\n')
+
+    ProjectInitializer(templates_dir=tmp_path / "templates")._copy_stack_template("custom", tmp_path / "out" / "demo")
+
+    out = tmp_path / "out" / "demo"
+    assert (out / "static.txt").read_text() == "{{ not rendered }}"
+    assert (out / "pkg" / "app.py").read_text() == 'NAME = "demo"\n'
+    assert not (out / "pkg" / "app.py.tmpl").exists()
+
+
+def test_docker_files(tmp_path):
+    ProjectInitializer()._generate_docker_files("nextjs", tmp_path, None)
+
+    dockerfile = (tmp_path / "Dockerfile").read_text()
+    assert dockerfile.startswith("FROM node:18-alpine\nWORKDIR /app\n")
+    assert dockerfile.endswith('CMD ["npm", "run", "dev"]\n')
+    compose = (tmp_path / "docker-compose.yml").read_text()
+    assert '- "3000:3000"' in compose
+    assert f'image: "{tmp_path.name.lower()}:latest"' in compose
+
+
+@pytest.mark.parametrize("name", ["@app", "a&b", "*star", "!bang", "%pct", "key: value", 'say "hi"'])
+def test_compose_values_are_quoted(tmp_path, name):
+    yaml = pytest.importorskip("yaml")
+    init = ProjectInitializer()
+    init.commands_config = {"stacks": {"custom": {"docker_port": "80: 80 #x"}}}
+    destination = tmp_path / name
+    init._generate_docker_files("custom", destination, None)
+
+    compose = yaml.safe_load((destination / "docker-compose.yml").read_text())
+    assert compose["services"]["web"]["image"] == f"{name}:latest"
+    assert compose["services"]["web"]["ports"] == ["80: 80 #x"]
@@ -0,0 +1,54 @@
+import subprocess
+import pytest
+from unittest.mock import patch
+from alpha import toolchain
+from alpha.initializer import ProjectInitializer
+from alpha.toolchain import Toolchain, MissingToolError
+
+
+def _fake_run(calls):
+    def run(argv, **kwargs):
+        calls.append(argv[0])
+        return subprocess.CompletedProcess(argv, 0, stdout=f"{argv[0]} 1.0\n", stderr="")
+    return run
+
+
+def test_probe_is_cached_until_path_changes(tmp_path, monkeypatch):
+    calls = []
+    chain = Toolchain(cache_path=tmp_path / "toolchain.json")
+    tool = tmp_path / "node"
+    tool.touch()
+    monkeypatch.setattr(toolchain.shutil, "which", lambda name: str(tool) if name == "node" else None)
+    monkeypatch.setattr(toolchain.subprocess, "run", _fake_run(calls))
+
+    assert chain.probe(["node", "docker"]) == {
+        "node": {"path": str(tool), "version": f"{tool} 1.0"},
+        "docker": {"path": None, "version": None},
+    }
+    chain.probe(["node", "docker"])
+    assert len(calls) == 1
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    chain.probe(["node"])
+    assert len(calls) == 2
+
+    tool.unlink()  # Uninstalled: probed again even though PATH is the same
+    chain.probe(["node"])
+    assert len(calls) == 3
+
+
+def test_stack_requires_are_checked_before_anything_runs(tmp_path, popen):
+    init = ProjectInitializer()
+    config = {"project_name": "app", "target_dir": str(tmp_path), "stack": "nextjs"}
+    with patch("alpha.toolchain.shutil.which", return_value=None), \
+         pytest.raises(MissingToolError, match="node, npm"):
+        init.generate_project(config)
+    popen.assert_not_called()
+    popen.run.assert_not_called()
+    assert not (tmp_path / "app").exists()
+
+
+def test_required_tools_fall_back_to_commands():
+    assert toolchain.required_tools({"requires": ["docker"]}) == ["docker"]
+    assert toolchain.required_tools({"init_command": "npx create-foo {name}"}) == ["node", "npm"]
+    assert toolchain.required_tools({"steps": [{"venv": "venv"}]}) == ["python"]
@@ -0,0 +1,68 @@
+import os
+import pytest
+from unittest.mock import patch
+from alpha.initializer import ProjectInitializer
+from alpha.venvs import BIN_DIR, clone_venv
+
+
+@pytest.fixture
+def fake_golden(tmp_path):
+    """A venv-shaped tree whose scripts embed its own absolute path."""
+    golden = tmp_path / "golden" / "venv"
+    site = golden / "lib" / "site-packages" / "django"
+    site.mkdir(parents=True)
+    (site / "__init__.py").write_text("VERSION = (5, 0)")
+    (golden / BIN_DIR).mkdir()
+    script = golden / BIN_DIR / "django-admin"
+    script.write_text(f"#!{golden}/{BIN_DIR}/python\nimport django\n")
+    os.chmod(script, 0o755)
+    (golden / "pyvenv.cfg").write_text(f"home = /usr/bin\ncommand = /usr/bin/python -m venv {golden}\n")
+    return golden
+
+
+def test_clone_rewrites_embedded_paths(fake_golden, tmp_path):
+    dest = tmp_path / "project" / "venv"
+    clone_venv(fake_golden, dest)
+
+    script = (dest / BIN_DIR / "django-admin").read_text()
+    assert script.startswith(f"#!{dest}/{BIN_DIR}/python")
+    assert str(fake_golden) not in (dest / "pyvenv.cfg").read_text()
+    assert os.access(dest / BIN_DIR / "django-admin", os.X_OK)
+
+
+def test_clone_hardlinks_site_packages(fake_golden, tmp_path):
+    dest = tmp_path / "project" / "venv"
+    clone_venv(fake_golden, dest)
+
+    src = fake_golden / "lib" / "site-packages" / "django" / "__init__.py"
+    dst = dest / "lib" / "site-packages" / "django" / "__init__.py"
+    assert os.stat(src).st_ino == os.stat(dst).st_ino
+    # Rewritten files must not alias the golden copy
+    assert os.stat(fake_golden / "pyvenv.cfg").st_ino != os.stat(dest / "pyvenv.cfg").st_ino
+
+
+def test_split_venv_command():
+    # Legacy shell stacks (structured stacks have a venv step instead)
+    init = ProjectInitializer()
+    cmd = "mkdir app && cd app && python -m venv venv && venv/Scripts/pip install django && venv/Scripts/python -m django startproject app ."
+    before, after = init._split_venv_command(cmd)
+
+    assert before == "mkdir app && cd app"
+    assert after == "venv/Scripts/python -m django startproject app ."
+    assert init._split_venv_command("npx create-next-app@latest app") is None
+
+
+def test_golden_mode_skips_venv_build(tmp_path, popen):
+    init = ProjectInitializer()
+    config = {
+        "project_name": "My API", "target_dir": str(tmp_path),
+        "stack": "fastapi", "use_golden_venv": True,
+    }
+    with patch("alpha.initializer.GoldenVenvStore.clone") as mock_clone:
+        init.generate_project(config)
+
+    mock_clone.assert_called_once_with(["fastapi", "uvicorn[standard]"], (tmp_path / "my_api" / "venv").absolute())
+    # Everything else is written in-process: nothing to spawn at all
+    popen.assert_not_called()
+    popen.run.assert_not_called()
+    assert (tmp_path / "my_api" / "main.py").exists()
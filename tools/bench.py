@@ -0,0 +1,374 @@
+"""Benchmarks for the scaffolding hot paths (``python -m tools.bench``).
+
+A development tool: it runs from a source checkout (it reads
+``benchmarks.json`` and starts ``main.py`` from the repo root) and is not
+part of the ``alpha`` package or the release builds.
+
+Each benchmark builds its inputs in a scratch directory, times the operation
+a few times and keeps the median and fastest run. Results are written as JSON so runs can be
+compared; given a baseline, any benchmark slower than its allowed regression
+(see ``benchmarks.json`` at the repo root) fails the run.
+
+No real scaffolding tools are invoked: ``generate_project`` runs against a
+fake command backend. The superpower benchmark needs git and the startup
+benchmark needs PyQt6; they are skipped when those are missing.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from alpha.initializer import ProjectInitializer, PHASE_INIT
+from alpha.utils import get_data_dir
+from alpha.version import __version__
+
+REPO_ROOT = Path(__file__).parent.parent
+CONFIG_FILE = REPO_ROOT / "benchmarks.json"
+
+DEFAULT_CONFIG = {"repeat": 5, "max_regression": 0.25, "min_delta_ms": 5, "benchmarks": {}}
+
+# Git refuses to commit without an identity; CI machines often have none
+GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "alpha-bench", "GIT_AUTHOR_EMAIL": "bench@localhost",
+    "GIT_COMMITTER_NAME": "alpha-bench", "GIT_COMMITTER_EMAIL": "bench@localhost",
+}
+
+
+class SkipBenchmark(Exception):
+    pass
+
+
+class FakeCommandInitializer(ProjectInitializer):
+    """Runs no commands. The init command creates a small npm-style project
+    in place of the real scaffolder, so only ALPHA's own work is timed."""
+
+    def __init__(self, files=50):
+        super().__init__()
+        self.toolchain_check = lambda tools, what=None: None  # The tools are faked
+        self.files = files
+        self.project_name = None
+        self.commands = []
+
+    def _run_command(self, cmd, cwd, phase=PHASE_INIT, timeout=None):
+        self.commands.append(cmd)
+        if phase != PHASE_INIT:
+            return
+        root = Path(cwd) / self.project_name
+        (root / "src").mkdir(parents=True, exist_ok=True)
+        (root / "package.json").write_text(json.dumps({"name": self.project_name, "private": True}))
+        for i in range(self.files):
+            (root / "src" / f"module_{i}.js").write_text(f"export const value{i} = {i};\n")
+
+
+def _write_tree(root, files, depth=4, size=2048):
+    """Synthetic template tree: `files` files spread over nested directories."""
+    payload = "x" * size
+    for i in range(files):
+        parts = [f"dir_{(i >> (2 * level)) % 4}" for level in range(depth)]
+        path = root.joinpath(*parts, f"file_{i}.txt")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(payload)
+
+
+def _big_tsconfig(entries):
+    return {
+        "compilerOptions": {
+            "target": "ES2020",
+            "strict": True,
+            "paths": {f"@lib{i}/*": [f"./src/lib{i}/*"] for i in range(entries)},
+        },
+        "include": [f"src/pkg{i}/**/*.ts" for i in range(entries)],
+    }
+
+
+def _scaled(n, scale):
+    return max(1, int(n * scale))
+
+
+def bench_generate_project(work, scale):
+    init = FakeCommandInitializer(files=_scaled(50, scale))
+    counter = iter(range(10 ** 6))
+
+    def setup():
+        init.project_name = f"bench-app-{next(counter)}"
+        return init.project_name
+
+    def run(name):
+        init.generate_project({
+            "project_name": name, "target_dir": str(work), "stack": "react",
+            "use_docker": True, "use_superpower": False,
+        })
+    return setup, run
+
+
+def bench_copy_stack_template(work, scale):
+    templates = work / "templates"
+    _write_tree(templates / "big", _scaled(2000, scale))
+    init = ProjectInitializer(templates_dir=str(templates))
+    counter = iter(range(10 ** 6))
+    return (lambda: work / f"copy_{next(counter)}"), (lambda dest: init._copy_stack_template("big", dest))
+
+
+def bench_superpower(work, scale):
+    if shutil.which("git") is None:
+        raise SkipBenchmark("git not found")
+    init = ProjectInitializer()
+    counter = iter(range(10 ** 6))
+
+    def setup():
+        project = work / f"project_{next(counter)}"
+        project.mkdir()
+        return project
+
+    def run(project):
+        init._apply_superpower_framework(project)
+        if not (project / ".git").exists():
+            raise RuntimeError("superpower setup did not create a git repository")
+    return setup, run
+
+
+def bench_update_json_config(work, scale):
+    init = ProjectInitializer()
+    path = work / "tsconfig.json"
+    content = json.dumps(_big_tsconfig(_scaled(5000, scale)), indent=2)
+    updates = {"compilerOptions": {"baseUrl": ".", "paths": {"@/*": ["./src/*"]}}}
+
+    def setup():
+        path.write_text(content)
+        return path
+    return setup, lambda p: init._update_json_config(p, updates)
+
+
+def bench_docker_files(work, scale):
+    init = ProjectInitializer()
+    counter = iter(range(10 ** 6))
+
+    def setup():
+        dest = work / f"docker_{next(counter)}"
+        dest.mkdir()
+        return dest
+    return setup, lambda dest: init._generate_docker_files("nextjs", dest, None)
+
+
+STARTUP_SCRIPT = """
+from PyQt6.QtWidgets import QApplication
+import main
+app = QApplication([])
+window = main.startup(app)
+window.show()
+app.processEvents()
+"""
+
+
+def bench_cold_startup(work, scale):
+    """A fresh interpreter up to a shown main window (imports included)."""
+    try:
+        import PyQt6  # noqa: F401
+    except ImportError:
+        raise SkipBenchmark("PyQt6 not installed")
+
+    def run(_):
+        env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+        subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=REPO_ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (lambda: None), run
+
+
+BENCHMARKS = {
+    "generate_project": bench_generate_project,
+    "copy_stack_template": bench_copy_stack_template,
+    "superpower": bench_superpower,
+    "update_json_config": bench_update_json_config,
+    "docker_files": bench_docker_files,
+    "cold_startup": bench_cold_startup,
+}
+
+
+@contextmanager
+def _quiet():
+    """Discard output at the fd level so tools like git don't write to the terminal mid-run."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = [os.dup(1), os.dup(2)]
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        yield
+    finally:
+        os.dup2(saved[0], 1)
+        os.dup2(saved[1], 2)
+        for fd in saved + [devnull]:
+            os.close(fd)
+
+
+def load_config(path=CONFIG_FILE):
+    config = dict(DEFAULT_CONFIG)
+    if Path(path).exists():
+        with open(path, "r") as f:
+            config.update(json.load(f))
+    return config
+
+
+def run_benchmark(name, repeat=5, scale=1.0):
+    """Times one benchmark; returns its result dict."""
+    with tempfile.TemporaryDirectory(prefix=f"alpha-bench-{name}-") as tmp:
+        work = Path(tmp)
+        try:
+            setup, run = BENCHMARKS[name](work, scale)
+        except SkipBenchmark as e:
+            return {"skipped": str(e)}
+
+        # Keep history, caches and git config of the benchmarks out of the user's
+        bench_env = dict(GIT_IDENTITY, ALPHA_HOME=str(work / "alpha_home"))
+        saved_env = {key: os.environ.get(key) for key in bench_env}
+        os.environ.update(bench_env)
+        try:
+            runs = []
+            with _quiet():
+                for _ in range(repeat):
+                    arg = setup()
+                    start = time.perf_counter()
+                    run(arg)
+                    runs.append(time.perf_counter() - start)
+        finally:
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+    return {
+        "median_s": statistics.median(runs),
+        "min_s": min(runs),
+        "max_s": max(runs),
+        "runs": runs,
+    }
+
+
+def run_suite(names=None, repeat=5, scale=1.0):
+    names = names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    return {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "repeat": repeat,
+            "scale": scale,
+        },
+        "results": {name: run_benchmark(name, repeat, scale) for name in names},
+    }
+
+
+def compare(report, baseline, config):
+    """Returns a list of regressions of `report` against `baseline`.
+
+    Runs are compared on their fastest time, which is far less sensitive to
+    background load than the median. A benchmark regresses when it is more
+    than ``max_regression`` (a fraction, overridable per benchmark) slower
+    than the baseline and the difference is above ``min_delta_ms``, which
+    keeps tiny timings from failing on noise.
+    """
+    if report["meta"].get("scale") != baseline["meta"].get("scale"):
+        raise ValueError("Baseline was recorded at a different --scale")
+
+    problems = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if "min_s" not in result or not base or "min_s" not in base:
+            continue
+        limits = dict(config, **config.get("benchmarks", {}).get(name, {}))
+        delta = result["min_s"] - base["min_s"]
+        ratio = delta / base["min_s"] if base["min_s"] else 0.0
+        if ratio > limits["max_regression"] and delta * 1000 > limits["min_delta_ms"]:
+            problems.append(
+                f"{name}: {result['min_s'] * 1000:.1f}ms vs {base['min_s'] * 1000:.1f}ms baseline "
+                f"(+{ratio:.0%}, allowed +{limits['max_regression']:.0%})"
+            )
+    return problems
+
+
+def format_report(report, baseline=None):
+    lines = []
+    for name, result in report["results"].items():
+        if "skipped" in result:
+            lines.append(f"{name:<22} skipped ({result['skipped']})")
+            continue
+        line = f"{name:<22} {result['median_s'] * 1000:>9.1f}ms median {result['min_s'] * 1000:>9.1f}ms min"
+        base = (baseline or {}).get("results", {}).get(name, {})
+        if base.get("min_s"):
+            line += f"  ({(result['min_s'] / base['min_s'] - 1):+.0%} min vs baseline)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def default_output_path():
+    out_dir = get_data_dir() / "benchmarks"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return out_dir / time.strftime("bench-%Y%m%d-%H%M%S.json")
+
+
+def run_report(names=None, repeat=None, scale=1.0, output=None, baseline_path=None,
+               max_regression=None, config_path=CONFIG_FILE):
+    """Runs the suite, writes the JSON report and checks it against a baseline.
+
+    Returns 1 if any benchmark regressed beyond its allowance.
+    """
+    config = load_config(config_path)
+    if max_regression is not None:
+        config["max_regression"] = max_regression
+        config["benchmarks"] = {}  # An explicit limit applies to every benchmark
+
+    report = run_suite(names, repeat=repeat or config["repeat"], scale=scale)
+
+    baseline = None
+    if baseline_path:
+        with open(baseline_path, "r") as f:
+            baseline = json.load(f)
+    print(format_report(report, baseline))
+
+    output = Path(output) if output else default_output_path()
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    if baseline is None:
+        return 0
+    problems = compare(report, baseline, config)
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    return 1 if problems else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tools.bench",
+                                     description="Benchmark the scaffolding hot paths and check for regressions")
+    parser.add_argument("benchmarks", nargs="*", help="Benchmarks to run (default: all)")
+    parser.add_argument("--repeat", type=int, help="Timed runs per benchmark (default: from benchmarks.json)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply synthetic input sizes")
+    parser.add_argument("-o", "--output", help="Results JSON (default: a timestamped file in the data dir)")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against; regressions exit 1")
+    parser.add_argument("--max-regression", type=float,
+                        help="Allowed slowdown as a fraction for every benchmark (default: from benchmarks.json)")
+    args = parser.parse_args(argv)
+    try:
+        return run_report(args.benchmarks or None, repeat=args.repeat, scale=args.scale, output=args.output,
+                          baseline_path=args.baseline, max_regression=args.max_regression)
+    except (OSError, ValueError) as e:
+        print(f"bench: error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())